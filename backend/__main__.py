@@ -0,0 +1,186 @@
+import argparse
+import logging
+import os
+import signal
+import socket
+import sys
+import tempfile
+import time
+
+logger = logging.getLogger("backend.serve")
+
+
+def migrate(args):
+    from backend.db.session import engine
+    from backend.db.migrations import migrate as run_migrations
+
+    revision = run_migrations(engine)
+    engine.dispose()
+    print(f"database at revision {revision}")
+
+
+def check(args):
+    from backend.db.session import engine
+    from backend.db.migrations import check_ready
+
+    ready, detail = check_ready(engine)
+    engine.dispose()
+    print(("ready: " if ready else "not ready: ") + detail)
+    return 0 if ready else 1
+
+
+def lifecycle(args):
+    from datetime import date
+    from backend.db.session import engine
+    from backend.core.config import LIFECYCLE_BATCH_SIZE
+    from backend.core.lifecycle import run_lifecycle
+
+    today = date.fromisoformat(args.date) if args.date else None
+    report = run_lifecycle(today=today, batch_size=args.batch_size or LIFECYCLE_BATCH_SIZE)
+    engine.dispose()
+    if not report:
+        print("skipped: another lifecycle run holds the lock")
+        return 1
+    for step in report:
+        print(f"{step['step']:<22} {step['updated']:>8} rows  {step['batches']:>5} batches  {step['elapsed_ms']:>9.1f} ms")
+
+
+def bind_socket(host: str, port: int) -> socket.socket:
+    sock = socket.socket(socket.AF_INET6 if ":" in host else socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    return sock
+
+
+def run_worker(app, sock: socket.socket, args, forked_at: float, runs_scheduler: bool):
+    import uvicorn
+    from backend.core import lifecycle_scheduler, metrics_reconciler
+
+    lifecycle_scheduler.enabled = lifecycle_scheduler.enabled and runs_scheduler
+    metrics_reconciler.enabled = metrics_reconciler.enabled and runs_scheduler
+
+    class WorkerServer(uvicorn.Server):
+        async def startup(self, sockets=None):
+            await super().startup(sockets=sockets)
+            logger.info("worker %s ready in %.1f ms", os.getpid(), (time.perf_counter() - forked_at) * 1000)
+
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    config = uvicorn.Config(app, log_level=args.log_level, access_log=args.access_log,
+                            timeout_graceful_shutdown=args.graceful_timeout)
+    WorkerServer(config).run(sockets=[sock])
+
+
+# prometheus_client picks multiprocess mode when it is imported, so the directory is set up before the app loads.
+# Samples left by a previous run are cleared so counters start from zero.
+def prepare_metrics_dir() -> str:
+    path = os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR",
+                                 os.path.join(tempfile.gettempdir(), "cloud_chaser_metrics"))
+    os.makedirs(path, exist_ok=True)
+    for name in os.listdir(path):
+        if name.endswith(".db"):
+            os.remove(os.path.join(path, name))
+    return path
+
+
+def serve(args):
+    started = time.perf_counter()
+    prepare_metrics_dir()
+    from prometheus_client import multiprocess
+    from backend.db.session import engine, replica_engines
+    from backend.db.migrations import check_ready
+    from backend.main import create_app
+
+    if args.migrate:
+        migrate(args)
+    if not args.skip_check:
+        ready, detail = check_ready(engine)
+        if not ready:
+            logger.error("refusing to start: %s", detail)
+            return 1
+    app = create_app()
+    for db_engine in [engine, *replica_engines]:
+        db_engine.dispose()
+    logger.info("warm imports finished in %.1f ms", (time.perf_counter() - started) * 1000)
+
+    sock = bind_socket(args.host, args.port)
+    logger.info("listening on %s:%s with %s workers", args.host, args.port, args.workers)
+
+    workers = {}
+    stopping = False
+
+    # Only one worker at a time runs the in-process lifecycle scheduler and metrics reconciler; its replacement
+    # inherits the role.
+    def spawn(runs_scheduler: bool):
+        forked_at = time.perf_counter()
+        pid = os.fork()
+        if pid == 0:
+            try:
+                run_worker(app, sock, args, forked_at, runs_scheduler)
+            finally:
+                os._exit(0)
+        workers[pid] = runs_scheduler
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+        for pid in list(workers):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+    for index in range(args.workers):
+        spawn(index == 0)
+
+    while workers:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        except InterruptedError:
+            continue
+        runs_scheduler = workers.pop(pid, False)
+        multiprocess.mark_process_dead(pid)
+        if not stopping:
+            logger.warning("worker %s exited with status %s, restarting", pid, status)
+            spawn(runs_scheduler)
+    sock.close()
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m backend")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("migrate", help="create or upgrade the schema to the Alembic head").set_defaults(func=migrate)
+    commands.add_parser("check", help="exit non-zero unless the database is at the Alembic head").set_defaults(func=check)
+
+    lifecycle_parser = commands.add_parser("lifecycle", help="activate, complete and expire campaigns and subscriptions by date")
+    lifecycle_parser.add_argument("--date", help="run as of this ISO date instead of today")
+    lifecycle_parser.add_argument("--batch-size", type=int, help="rows per batch (default: LIFECYCLE_BATCH_SIZE)")
+    lifecycle_parser.set_defaults(func=lifecycle)
+
+    serve_parser = commands.add_parser("serve", help="serve the API with preforked workers")
+    serve_parser.add_argument("--host", default=os.getenv("HOST", "127.0.0.1"))
+    serve_parser.add_argument("--port", type=int, default=int(os.getenv("PORT", "8000")))
+    serve_parser.add_argument("--workers", type=int, default=int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1)))
+    serve_parser.add_argument("--migrate", action="store_true", help="run migrations before forking")
+    serve_parser.add_argument("--skip-check", action="store_true", help="start even if the schema is behind")
+    serve_parser.add_argument("--log-level", default="info")
+    serve_parser.add_argument("--access-log", action="store_true")
+    serve_parser.add_argument("--graceful-timeout", type=int, default=30)
+    serve_parser.set_defaults(func=serve)
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.WARNING, format="%(asctime)s %(levelname)s [%(name)s] %(message)s")
+    logger.setLevel(getattr(args, "log_level", "info").upper())
+    return args.func(args) or 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
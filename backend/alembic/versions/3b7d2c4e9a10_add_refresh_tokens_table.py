@@ -0,0 +1,43 @@
+"""Add refresh_tokens table
+
+Revision ID: 3b7d2c4e9a10
+Revises: 785fe8831736
+Create Date: 2026-10-17 09:12:44.512031
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b7d2c4e9a10'
+down_revision: Union[str, Sequence[str], None] = '785fe8831736'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'refresh_tokens',
+        sa.Column('jti', sa.String(length=64), nullable=False),
+        sa.Column('id_user', mysql.BIGINT(unsigned=True), nullable=False),
+        sa.Column('family', sa.String(length=64), nullable=False),
+        sa.Column('expires_at', sa.TIMESTAMP(), nullable=False),
+        sa.Column('revoked_at', sa.TIMESTAMP(), nullable=True),
+        sa.Column('created_at', sa.TIMESTAMP(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=True),
+        sa.ForeignKeyConstraint(['id_user'], ['users.id_user'], name='fk_refresh_token_user', ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('jti'),
+    )
+    op.create_index(op.f('ix_refresh_tokens_id_user'), 'refresh_tokens', ['id_user'], unique=False)
+    op.create_index(op.f('ix_refresh_tokens_family'), 'refresh_tokens', ['family'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_refresh_tokens_family'), table_name='refresh_tokens')
+    op.drop_index(op.f('ix_refresh_tokens_id_user'), table_name='refresh_tokens')
+    op.drop_table('refresh_tokens')
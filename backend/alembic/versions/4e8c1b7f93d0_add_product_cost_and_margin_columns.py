@@ -0,0 +1,36 @@
+"""Add product cost and margin columns
+
+Revision ID: 4e8c1b7f93d0
+Revises: b93f0d6a2c71
+Create Date: 2026-10-17 18:14:52.330417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4e8c1b7f93d0'
+down_revision: Union[str, Sequence[str], None] = 'b93f0d6a2c71'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PRODUCT_COST = (
+    "(SELECT COALESCE(SUM(c.unit_cost * pc.quantity), 0) FROM products_components pc "
+    "JOIN components c ON c.id_component = pc.id_component WHERE pc.id_product = products.id_product)"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('products', sa.Column('cost', sa.DECIMAL(precision=19, scale=4), server_default='0', nullable=False))
+    op.add_column('products', sa.Column('margin', sa.DECIMAL(precision=19, scale=4), server_default='0', nullable=False))
+    op.execute(f"UPDATE products SET cost = {PRODUCT_COST}, margin = monthly_price - {PRODUCT_COST}")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('products', 'margin')
+    op.drop_column('products', 'cost')
@@ -0,0 +1,32 @@
+"""Add campaign sort key indexes
+
+Revision ID: 6a2f9d84c1e7
+Revises: 4e8c1b7f93d0
+Create Date: 2026-10-17 14:12:37.518204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6a2f9d84c1e7'
+down_revision: Union[str, Sequence[str], None] = '4e8c1b7f93d0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_campaigns_name_id', 'campaigns', ['name', 'id_campaign'], unique=False)
+    op.create_index('ix_campaigns_start_date_id', 'campaigns', ['start_date', 'id_campaign'], unique=False)
+    op.create_index('ix_campaigns_end_date_id', 'campaigns', ['end_date', 'id_campaign'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_campaigns_end_date_id', table_name='campaigns')
+    op.drop_index('ix_campaigns_start_date_id', table_name='campaigns')
+    op.drop_index('ix_campaigns_name_id', table_name='campaigns')
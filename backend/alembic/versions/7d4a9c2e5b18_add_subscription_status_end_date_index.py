@@ -0,0 +1,28 @@
+"""Add subscription status/end_date index
+
+Revision ID: 7d4a9c2e5b18
+Revises: e2b84f61c9d3
+Create Date: 2026-10-17 16:21:37.514208
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7d4a9c2e5b18'
+down_revision: Union[str, Sequence[str], None] = 'e2b84f61c9d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_subscriptions_status_end_date', 'subscriptions', ['status', 'end_date'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_subscriptions_status_end_date', table_name='subscriptions')
@@ -0,0 +1,37 @@
+"""Add principals resource version
+
+Revision ID: 8c3e5f1a2d74
+Revises: 6a2f9d84c1e7
+Create Date: 2026-10-17 16:05:41.208315
+
+"""
+from datetime import datetime, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c3e5f1a2d74'
+down_revision: Union[str, Sequence[str], None] = '6a2f9d84c1e7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+resource_versions = sa.table(
+    'resource_versions',
+    sa.column('name', sa.String),
+    sa.column('version', sa.BigInteger),
+    sa.column('updated_at', sa.TIMESTAMP),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    now = datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0)
+    op.bulk_insert(resource_versions, [{'name': 'principals', 'version': 1, 'updated_at': now}])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(resource_versions.delete().where(resource_versions.c.name == 'principals'))
@@ -0,0 +1,37 @@
+"""Add indexes for hot filter columns
+
+Revision ID: a41c6e2f8b57
+Revises: 3b7d2c4e9a10
+Create Date: 2026-10-17 10:41:05.837214
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a41c6e2f8b57'
+down_revision: Union[str, Sequence[str], None] = '3b7d2c4e9a10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_subscriptions_user_status_product', 'subscriptions', ['id_user', 'status', 'id_product'], unique=False)
+    op.create_index('ix_campaigns_subscription', 'campaigns', ['id_subscription'], unique=False)
+    op.create_index('ix_users_role', 'users', ['role'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_users_role', table_name='users')
+    if op.get_bind().dialect.name == 'mysql':
+        # InnoDB dropped the implicit FK indexes once ours covered those columns, so they need to come back
+        # before ours can go.
+        op.create_index('fk_campaign_subscription', 'campaigns', ['id_subscription'], unique=False)
+        op.create_index('fk_subscription_user', 'subscriptions', ['id_user'], unique=False)
+    op.drop_index('ix_campaigns_subscription', table_name='campaigns')
+    op.drop_index('ix_subscriptions_user_status_product', table_name='subscriptions')
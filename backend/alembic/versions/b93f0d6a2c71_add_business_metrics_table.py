@@ -0,0 +1,50 @@
+"""Add business metrics summary table
+
+Revision ID: b93f0d6a2c71
+Revises: 7d4a9c2e5b18
+Create Date: 2026-10-17 17:02:11.846390
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b93f0d6a2c71'
+down_revision: Union[str, Sequence[str], None] = '7d4a9c2e5b18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'business_metrics',
+        sa.Column('metric', sa.String(length=32), nullable=False),
+        sa.Column('dimension', sa.String(length=64), nullable=False),
+        sa.Column('value', sa.DECIMAL(precision=19, scale=4), nullable=False),
+        sa.Column('updated_at', sa.TIMESTAMP(), nullable=False),
+        sa.PrimaryKeyConstraint('metric', 'dimension'),
+    )
+    op.execute(
+        "INSERT INTO business_metrics (metric, dimension, value, updated_at) "
+        "SELECT 'campaigns', status, COUNT(*), CURRENT_TIMESTAMP FROM campaigns GROUP BY status"
+    )
+    op.execute(
+        "INSERT INTO business_metrics (metric, dimension, value, updated_at) "
+        "SELECT 'active_subscriptions', CAST(s.id_product AS CHAR), COUNT(*), CURRENT_TIMESTAMP "
+        "FROM subscriptions s WHERE s.status = 'Active' GROUP BY s.id_product"
+    )
+    op.execute(
+        "INSERT INTO business_metrics (metric, dimension, value, updated_at) "
+        "SELECT 'mrr', CAST(s.id_product AS CHAR), SUM(p.monthly_price), CURRENT_TIMESTAMP "
+        "FROM subscriptions s JOIN products p ON p.id_product = s.id_product "
+        "WHERE s.status = 'Active' GROUP BY s.id_product"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('business_metrics')
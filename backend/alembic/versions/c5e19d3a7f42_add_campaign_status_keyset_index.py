@@ -0,0 +1,28 @@
+"""Add campaign status keyset index
+
+Revision ID: c5e19d3a7f42
+Revises: a41c6e2f8b57
+Create Date: 2026-10-17 12:08:44.190352
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5e19d3a7f42'
+down_revision: Union[str, Sequence[str], None] = 'a41c6e2f8b57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_campaigns_status_id', 'campaigns', ['status', 'id_campaign'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_campaigns_status_id', table_name='campaigns')
@@ -0,0 +1,40 @@
+"""Add resource versions table
+
+Revision ID: e2b84f61c9d3
+Revises: c5e19d3a7f42
+Create Date: 2026-10-17 14:22:10.517930
+
+"""
+from datetime import datetime, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b84f61c9d3'
+down_revision: Union[str, Sequence[str], None] = 'c5e19d3a7f42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+VERSIONED_TABLES = ("products", "components", "products_components", "campaigns", "subscriptions")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    resource_versions = op.create_table(
+        'resource_versions',
+        sa.Column('name', sa.String(length=64), nullable=False),
+        sa.Column('version', mysql.BIGINT(unsigned=True), nullable=False),
+        sa.Column('updated_at', sa.TIMESTAMP(), nullable=False),
+        sa.PrimaryKeyConstraint('name'),
+    )
+    now = datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0)
+    op.bulk_insert(resource_versions, [{'name': name, 'version': 1, 'updated_at': now} for name in VERSIONED_TABLES])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('resource_versions')
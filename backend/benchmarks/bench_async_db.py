@@ -0,0 +1,95 @@
+"""Throughput of the hot read routes on the sync vs. async database path.
+
+Usage: python -m backend.benchmarks.bench_async_db [--requests 4000] [--concurrency 200]
+"""
+import argparse
+import asyncio
+import subprocess
+import sys
+import time
+
+from backend.benchmarks.common import configure_environment, create_schema, seed_catalog, seed_user, summarize, timed_request
+
+ENDPOINTS = ["/products/list", "/products/drop_down", "/campaigns/", "/subscriptions/my-active-ids", "/users/me"]
+
+
+def seed_subscriptions(db, user, campaigns: int):
+    from datetime import date
+    from backend.db.models import Product, Subscription, Campaign
+
+    products = db.query(Product).limit(5).all()
+    for product in products:
+        subscription = Subscription(id_user=user.id_user, id_product=product.id_product, start_date=date(2026, 1, 1))
+        db.add(subscription)
+        db.flush()
+        db.add_all([
+            Campaign(id_subscription=subscription.id_subscription, name=f"Campaign {i}",
+                     start_date=date(2026, 1, 1), end_date=date(2026, 12, 31))
+            for i in range(campaigns)
+        ])
+    db.commit()
+
+
+async def run(total: int, concurrency: int):
+    import httpx
+    from backend.main import app
+    from backend.db.session import SessionLocal, ASYNC_DB_ENABLED
+
+    create_schema()
+    db = SessionLocal()
+    seed_catalog(db)
+    user = seed_user(db, "bench@example.com", "Benchmark1!")
+    seed_subscriptions(db, user, campaigns=10)
+    db.close()
+
+    latencies = {endpoint: [] for endpoint in ENDPOINTS}
+    errors = 0
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=120) as client:
+            response = await client.post("/login", data={"username": "bench@example.com", "password": "Benchmark1!"})
+            headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+            queue = asyncio.Queue()
+            for i in range(total):
+                queue.put_nowait(ENDPOINTS[i % len(ENDPOINTS)])
+
+            async def worker():
+                nonlocal errors
+                while not queue.empty():
+                    endpoint = queue.get_nowait()
+                    latency, response = await timed_request(client, "GET", endpoint, headers=headers)
+                    if response.is_success:
+                        latencies[endpoint].append(latency)
+                    else:
+                        errors += 1
+
+            start = time.perf_counter()
+            await asyncio.gather(*(worker() for _ in range(concurrency)))
+            elapsed = time.perf_counter() - start
+
+    print(f"--- {'async' if ASYNC_DB_ENABLED else 'sync'} path: {(total - errors) / elapsed:.0f} req/s "
+          f"({total} requests, {errors} failed, concurrency {concurrency}, {elapsed:.1f}s)")
+    for endpoint, values in latencies.items():
+        print(summarize(f"GET {endpoint}", values))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=4000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--mode", choices=["sync", "async"], default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode is not None:
+        configure_environment(f"cloud_chaser_bench_{args.mode}.db", HASH_POOL_WORKERS=0,
+                              ASYNC_DB_ENABLED=str(args.mode == "async").lower())
+        asyncio.run(run(args.requests, args.concurrency))
+        return
+
+    for mode in ("sync", "async"):
+        subprocess.run([sys.executable, "-m", "backend.benchmarks.bench_async_db", "--requests", str(args.requests),
+                        "--concurrency", str(args.concurrency), "--mode", mode], check=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Peak memory of exporting every campaign: materialized JSON array vs. streamed CSV/NDJSON.
+
+Usage: python -m backend.benchmarks.bench_export [--campaigns 1000000] [--batch-size 2000]
+"""
+import argparse
+import resource
+import subprocess
+import sys
+import time
+
+from backend.benchmarks.common import configure_environment, create_schema
+
+MODES = ["materialized-json", "stream-csv", "stream-ndjson"]
+
+
+def peak_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def seed_campaigns(total: int, clients: int = 1000, chunk: int = 50_000):
+    from datetime import date
+    from sqlalchemy import insert
+    from backend.db.models import User, Product, Subscription, Campaign
+    from backend.db.session import engine
+
+    with engine.begin() as connection:
+        connection.execute(insert(Product), [
+            {"name": f"Product {i}", "description": "Export benchmark", "monthly_price": 100 + i, "is_active": True}
+            for i in range(10)
+        ])
+        connection.execute(insert(User), [
+            {"name": f"Client {i}", "email": f"client{i}@example.com", "password_hash": "x", "role": "CLIENT"}
+            for i in range(clients)
+        ])
+        connection.execute(insert(Subscription), [
+            {"id_user": i + 1, "id_product": i % 10 + 1, "status": "Active", "start_date": date(2026, 1, 1)}
+            for i in range(clients)
+        ])
+        for offset in range(0, total, chunk):
+            connection.execute(insert(Campaign), [
+                {"id_subscription": i % clients + 1, "name": f"Campaign {i}", "status": "Active",
+                 "start_date": date(2026, 1, 1), "end_date": date(2026, 12, 31)}
+                for i in range(offset, min(offset + chunk, total))
+            ])
+
+
+def run_materialized(batch_size: int) -> int:
+    import json
+    from sqlalchemy.orm import joinedload
+    from backend.db.models import Campaign, Subscription
+    from backend.db.session import SessionLocal
+    from backend.schemas import AdminCampaignOut
+
+    with SessionLocal() as db:
+        campaigns = db.query(Campaign).options(
+            joinedload(Campaign.subscription).joinedload(Subscription.product),
+            joinedload(Campaign.subscription).joinedload(Subscription.user)
+        ).all()
+        payload = [
+            AdminCampaignOut(id_campaign=c.id_campaign, name=c.name, status=c.status, start_date=c.start_date,
+                             end_date=c.end_date, product_name=c.subscription.product.name,
+                             client_name=c.subscription.user.name, client_email=c.subscription.user.email).model_dump(mode="json")
+            for c in campaigns
+        ]
+        return len(json.dumps(payload).encode("utf-8"))
+
+
+def run_streamed(export_format: str, batch_size: int) -> int:
+    from backend.db.session import SessionLocal
+    from backend.functions import iter_export, campaigns_export_query
+
+    return sum(len(chunk) for chunk in iter_export(SessionLocal, campaigns_export_query(), export_format, batch_size))
+
+
+def measure(mode: str, batch_size: int):
+    import backend.main  # noqa: F401 - load the app's modules so the baseline includes them
+    baseline = peak_rss_mb()
+    start = time.perf_counter()
+    if mode == "materialized-json":
+        size = run_materialized(batch_size)
+    else:
+        size = run_streamed(mode.split("-")[1], batch_size)
+    elapsed = time.perf_counter() - start
+    print(f"{mode:<18} {size / 1e6:8.1f} MB out  {elapsed:6.1f}s  peak RSS {peak_rss_mb():7.1f} MB "
+          f"(+{peak_rss_mb() - baseline:.1f} MB over baseline)", flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--campaigns", type=int, default=1_000_000)
+    parser.add_argument("--batch-size", type=int, default=2000)
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=MODES)
+    parser.add_argument("--mode", choices=MODES, default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode is not None:
+        measure(args.mode, args.batch_size)
+        return
+
+    configure_environment("cloud_chaser_bench_export.db", HASH_POOL_WORKERS=0)
+    create_schema()
+    start = time.perf_counter()
+    seed_campaigns(args.campaigns)
+    print(f"seeded {args.campaigns} campaigns in {time.perf_counter() - start:.1f}s", flush=True)
+
+    for mode in args.modes:
+        subprocess.run([sys.executable, "-m", "backend.benchmarks.bench_export", "--mode", mode,
+                        "--batch-size", str(args.batch_size)], check=True)
+
+
+if __name__ == "__main__":
+    main()
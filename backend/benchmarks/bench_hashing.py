@@ -0,0 +1,81 @@
+"""Login storm benchmark: argon2 in the shared threadpool vs. the hashing process pool.
+
+Usage: python -m backend.benchmarks.bench_hashing [--logins 200] [--concurrency 32] [--workers 2]
+"""
+import argparse
+import asyncio
+import subprocess
+import sys
+
+from backend.benchmarks.common import configure_environment, create_schema, seed_catalog, seed_user, summarize, timed_request
+
+PASSWORD = "Benchmark1!"
+
+
+async def run(logins: int, concurrency: int):
+    import httpx
+    from backend.main import app
+    from backend.db.session import SessionLocal
+    from backend.core import password_hasher
+
+    create_schema()
+    db = SessionLocal()
+    seed_catalog(db)
+    seed_user(db, "bench@example.com", PASSWORD)
+    db.close()
+    password_hasher.start()
+
+    login_latencies, list_latencies = [], []
+    storm_done = asyncio.Event()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=120) as client:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def login():
+            async with semaphore:
+                latency, response = await timed_request(
+                    client, "POST", "/login", data={"username": "bench@example.com", "password": PASSWORD}
+                )
+                response.raise_for_status()
+                login_latencies.append(latency)
+
+        async def browse():
+            while not storm_done.is_set():
+                latency, response = await timed_request(client, "GET", "/products/list")
+                response.raise_for_status()
+                list_latencies.append(latency)
+
+        browsers = [asyncio.create_task(browse()) for _ in range(4)]
+        await asyncio.gather(*(login() for _ in range(logins)))
+        storm_done.set()
+        await asyncio.gather(*browsers)
+
+    password_hasher.shutdown()
+    mode = f"process pool ({password_hasher.workers} workers)" if password_hasher.workers else "shared threadpool"
+    print(f"--- {mode}")
+    print(summarize("POST /login", login_latencies))
+    print(summarize("GET /products/list (during)", list_latencies))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--mode-workers", type=int, default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode_workers is not None:
+        configure_environment("cloud_chaser_bench_hashing.db", HASH_POOL_WORKERS=args.mode_workers,
+                              HASH_POOL_MAX_PENDING=args.logins)
+        asyncio.run(run(args.logins, args.concurrency))
+        return
+
+    for workers in (0, args.workers):
+        subprocess.run([sys.executable, "-m", "backend.benchmarks.bench_hashing",
+                        "--logins", str(args.logins), "--concurrency", str(args.concurrency),
+                        "--mode-workers", str(workers)], check=True)
+
+
+if __name__ == "__main__":
+    main()
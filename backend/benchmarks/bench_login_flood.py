@@ -0,0 +1,115 @@
+"""Abusive login flood with and without login admission control.
+
+Attackers hammer POST /login with wrong passwords from a few IPs while legitimate users log in every
+few seconds from their own IPs and browse /products/list. Latencies are recorded after a warmup, once the attackers have
+used up their per-IP budget.
+
+Usage: python -m backend.benchmarks.bench_login_flood [--seconds 10] [--warmup 10] [--attackers 8] [--concurrency 16]
+"""
+import argparse
+import asyncio
+import subprocess
+import sys
+import time
+from collections import Counter
+
+from backend.benchmarks.common import configure_environment, create_schema, seed_catalog, seed_user, summarize, timed_request
+
+PASSWORD = "Benchmark1!"
+USERS = 6
+
+
+async def run(seconds: float, warmup: float, attackers: int, concurrency: int):
+    import httpx
+    from backend.main import app
+    from backend.db.session import SessionLocal, async_engine
+    from backend.core import password_hasher, login_admission
+
+    create_schema()
+    db = SessionLocal()
+    seed_catalog(db)
+    seed_user(db, "victim@example.com", PASSWORD)
+    for i in range(USERS):
+        seed_user(db, f"user{i}@example.com", PASSWORD)
+    db.close()
+    password_hasher.start()
+
+    statuses = Counter()
+    flood_latencies, login_latencies, list_latencies = [], [], []
+    measure_from = time.perf_counter() + warmup
+    deadline = measure_from + seconds
+
+    def client_for(ip: str):
+        transport = httpx.ASGITransport(app=app, client=(ip, 40000))
+        return httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=120)
+
+    async def attack(client, index: int):
+        while time.perf_counter() < deadline:
+            email = "victim@example.com" if index % 2 else f"guess{index}@example.com"
+            latency, response = await timed_request(client, "POST", "/login",
+                                                    data={"username": email, "password": "wrong-password"})
+            if time.perf_counter() >= measure_from:
+                statuses[response.status_code] += 1
+                flood_latencies.append(latency)
+
+    async def legit_login(client, email: str):
+        while time.perf_counter() < deadline:
+            latency, response = await timed_request(client, "POST", "/login",
+                                                    data={"username": email, "password": PASSWORD})
+            response.raise_for_status()
+            if time.perf_counter() >= measure_from:
+                login_latencies.append(latency)
+            await asyncio.sleep(3)
+
+    async def browse(client):
+        while time.perf_counter() < deadline:
+            latency, response = await timed_request(client, "GET", "/products/list")
+            response.raise_for_status()
+            if time.perf_counter() >= measure_from:
+                list_latencies.append(latency)
+
+    attacker_clients = [client_for(f"203.0.113.{i + 1}") for i in range(attackers)]
+    user_clients = [client_for(f"198.51.100.{i + 1}") for i in range(USERS)]
+    tasks = [attack(attacker_clients[i % attackers], i) for i in range(concurrency)]
+    tasks += [legit_login(client, f"user{i}@example.com") for i, client in enumerate(user_clients)]
+    tasks += [browse(client) for client in user_clients[:4]]
+    await asyncio.gather(*tasks)
+    for client in attacker_clients + user_clients:
+        await client.aclose()
+    password_hasher.shutdown()
+    if async_engine is not None:
+        await async_engine.dispose()
+
+    mode = "admission control on" if login_admission.enabled else "admission control off"
+    print(f"--- {mode} ({attackers} attacker IPs, {concurrency} concurrent, {seconds:.0f}s)")
+    print(f"flood responses: {dict(sorted(statuses.items()))}")
+    print(summarize("POST /login (flood)", flood_latencies))
+    print(summarize("POST /login (legit users)", login_latencies))
+    print(summarize("GET /products/list (during)", list_latencies))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--warmup", type=float, default=10)
+    parser.add_argument("--attackers", type=int, default=8)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--mode-enabled", default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode_enabled is not None:
+        configure_environment("cloud_chaser_bench_login_flood.db", RATE_LIMIT_ENABLED=args.mode_enabled,
+                              HASH_POOL_WORKERS=args.workers, HASH_POOL_MAX_PENDING=args.concurrency * 2)
+        asyncio.run(run(args.seconds, args.warmup, args.attackers, args.concurrency))
+        return
+
+    for enabled in ("false", "true"):
+        subprocess.run([sys.executable, "-m", "backend.benchmarks.bench_login_flood",
+                        "--seconds", str(args.seconds), "--warmup", str(args.warmup), "--attackers", str(args.attackers),
+                        "--concurrency", str(args.concurrency), "--workers", str(args.workers),
+                        "--mode-enabled", enabled], check=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Argon2 CPU time per active user per day, with and without refresh tokens.
+
+Usage: python -m backend.benchmarks.bench_refresh [--active-hours 8] [--samples 20]
+"""
+import argparse
+import math
+import time
+
+from backend.benchmarks.common import configure_environment
+
+
+def cpu_seconds(fn, samples: int) -> float:
+    start = time.process_time()
+    for _ in range(samples):
+        fn()
+    return (time.process_time() - start) / samples
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--active-hours", type=float, default=8)
+    parser.add_argument("--samples", type=int, default=20)
+    args = parser.parse_args()
+
+    configure_environment("cloud_chaser_bench_refresh.db")
+    from backend.core import (ACCESS_TOKEN_EXPIRE_MINUTES, REFRESH_TOKEN_EXPIRE_DAYS, create_access_token,
+                              create_refresh_token, verify_refresh_token)
+    from backend.core.hashing import pwd_context
+
+    password = "Benchmark1!"
+    hashed = pwd_context.hash(password)
+    verify_cpu = cpu_seconds(lambda: pwd_context.verify(password, hashed), args.samples)
+
+    def exchange():
+        payload = verify_refresh_token(create_refresh_token(1)[0])
+        create_access_token({"id_user": payload["id_user"], "role": "CLIENT"})
+        create_refresh_token(payload["id_user"], family=payload["fam"])
+
+    exchange_cpu = cpu_seconds(exchange, args.samples * 50)
+
+    renewals = math.ceil(args.active_hours * 60 / ACCESS_TOKEN_EXPIRE_MINUTES)
+    password_logins_before = renewals
+    password_logins_after = 1 / REFRESH_TOKEN_EXPIRE_DAYS
+    before = password_logins_before * verify_cpu
+    after = password_logins_after * verify_cpu
+
+    print(f"argon2 verify CPU          {verify_cpu * 1000:8.2f} ms")
+    print(f"refresh exchange CPU       {exchange_cpu * 1000:8.3f} ms (JWT decode + 2 signs, no hashing)")
+    print(f"token renewals per day     {renewals} ({args.active_hours:g}h active, {ACCESS_TOKEN_EXPIRE_MINUTES} min access tokens)")
+    print(f"argon2 CPU/user/day before {before * 1000:8.1f} ms ({password_logins_before} password logins)")
+    print(f"argon2 CPU/user/day after  {after * 1000:8.1f} ms (1 password login per {REFRESH_TOKEN_EXPIRE_DAYS} days)")
+    print(f"refresh CPU/user/day after {renewals * exchange_cpu * 1000:8.1f} ms")
+    print(f"argon2 reduction           {100 * (1 - after / before):8.1f} %")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Serialization cost of a 10k-row admin campaign page: FastAPI's default path vs. the orjson fast path.
+
+Usage: python -m backend.benchmarks.bench_serialization [--rows 10000] [--repeat 20]
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from datetime import date
+from decimal import Decimal
+
+from backend.benchmarks.common import configure_environment
+
+
+def make_rows(total: int):
+    from backend.db.models import CampaignStatus
+
+    statuses = list(CampaignStatus)
+    return [
+        {"id_campaign": i, "name": f"Campaign {i}", "status": statuses[i % len(statuses)],
+         "start_date": date(2026, 1, 1 + i % 28), "end_date": date(2026, 12, 1 + i % 28),
+         "product_name": f"Product {i % 10}", "client_name": f"Client {i % 1000}",
+         "client_email": f"client{i % 1000}@example.com"}
+        for i in range(total)
+    ]
+
+
+def make_product_rows(total: int):
+    return [
+        {"id_product": i, "name": f"Product {i}", "description": None, "monthly_price": Decimal("199.0000"),
+         "is_active": True, "cost": Decimal("120.5000"), "margin": Decimal("78.5000")}
+        for i in range(total)
+    ]
+
+
+def page(items):
+    return {"items": items, "limit": len(items), "next_cursor": None, "total": None}
+
+
+def fastapi_default(model, items) -> bytes:
+    from fastapi.responses import JSONResponse
+    from fastapi.routing import serialize_response
+    from fastapi.utils import create_model_field
+    from backend.schemas import Page
+
+    field = create_model_field(name="response", type_=Page[model], mode="serialization")
+    content = asyncio.run(serialize_response(field=field, response_content=page(items)))
+    return JSONResponse(content).body
+
+
+def models_then_default(model, rows) -> bytes:
+    return fastapi_default(model, [model(**row) for row in rows])
+
+
+def fast_rows(model, rows) -> bytes:
+    from backend.core.responses import fast_response
+    return fast_response(page(rows)).body
+
+
+def fast_models(model, rows) -> bytes:
+    from backend.core.responses import fast_response
+    return fast_response(page([model(**row) for row in rows])).body
+
+
+MODES = {
+    "default: models + response_model": models_then_default,
+    "default: dicts + response_model": fastapi_default,
+    "fast: pre-validated models": fast_models,
+    "fast: raw rows": fast_rows,
+}
+
+
+def measure(name, func, model, rows, repeat: int):
+    timings = []
+    size = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        size = len(func(model, rows))
+        timings.append(time.perf_counter() - start)
+    print(f"{name:<36} {len(rows):>6} rows  median {statistics.median(timings) * 1000:8.1f} ms  "
+          f"min {min(timings) * 1000:8.1f} ms  {size / 1e6:5.2f} MB", flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    configure_environment("cloud_chaser_bench_serialization.db")
+    from backend.schemas import AdminCampaignOut, ProductMgmtOut
+
+    for label, model, rows in [("AdminCampaignOut (enum, dates)", AdminCampaignOut, make_rows(args.rows)),
+                               ("ProductMgmtOut (Decimal)", ProductMgmtOut, make_product_rows(args.rows))]:
+        print(label)
+        for name, func in MODES.items():
+            measure(name, func, model, rows, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+import os
+import tempfile
+import time
+
+
+def configure_environment(db_name: str, **overrides):
+    db_path = os.path.join(tempfile.gettempdir(), db_name)
+    if os.path.exists(db_path):
+        os.remove(db_path)
+    os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
+    os.environ.setdefault("SECRET_KEY", "benchmark-secret-key")
+    os.environ.setdefault("ALGORITHM", "HS256")
+    os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "30")
+    for key, value in overrides.items():
+        os.environ[key] = str(value)
+    return db_path
+
+
+def create_schema():
+    from backend.db.base import Base
+    from backend.db.session import engine
+
+    Base.metadata.create_all(bind=engine)
+
+
+def seed_catalog(db, products: int = 20, components_per_product: int = 5):
+    from backend.db.models import Product, Component, ProductComponent
+
+    components = [
+        Component(name=f"Component {i}", component_type="Post", unit_cost=10 + i)
+        for i in range(components_per_product * 2)
+    ]
+    db.add_all(components)
+    db.flush()
+    for i in range(products):
+        product = Product(name=f"Product {i}", description="Benchmark product", monthly_price=100 + i, is_active=True)
+        db.add(product)
+        db.flush()
+        for component in components[i % 2::2][:components_per_product]:
+            db.add(ProductComponent(id_product=product.id_product, id_component=component.id_component, quantity=2))
+    db.commit()
+
+
+def seed_user(db, email: str, password: str, role: str = "CLIENT"):
+    from backend.core.hashing import pwd_context
+    from backend.db.models import User
+
+    user = User(name=email.split("@")[0], email=email, password_hash=pwd_context.hash(password), role=role)
+    db.add(user)
+    db.commit()
+    return user
+
+
+def percentile(values, pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summarize(name: str, latencies) -> str:
+    ms = [value * 1000 for value in latencies]
+    return (f"{name:<28} n={len(ms):<6} p50={percentile(ms, 50):8.1f}ms "
+            f"p95={percentile(ms, 95):8.1f}ms p99={percentile(ms, 99):8.1f}ms")
+
+
+async def timed_request(client, method: str, url: str, **kwargs):
+    start = time.perf_counter()
+    response = await client.request(method, url, **kwargs)
+    return time.perf_counter() - start, response
@@ -0,0 +1,187 @@
+"""Deterministic large dataset for load tests: users, catalog, subscriptions and campaigns.
+
+Rows go through the models' tables in chunked executemany inserts with explicit ids, so the same
+--seed and --scale always produce the same database. Derived data (product cost/margin, business
+metrics, resource versions) is rebuilt at the end.
+
+Usage: python -m backend.benchmarks.dataset [--scale 1.0] [--seed 42] [--reset]
+       (uses DATABASE_URL; --scale 1.0 is 100k users, 1k products/components, 500k subscriptions, 2M campaigns)
+"""
+import argparse
+import random
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+
+FULL_SIZES = {"users": 100_000, "products": 1_000, "components": 1_000,
+              "subscriptions": 500_000, "campaigns": 2_000_000}
+COMPONENTS_PER_PRODUCT = 5
+ANCHOR_DATE = date(2026, 1, 1)
+PASSWORD = "Benchmark1!"
+COMPONENT_TYPES = ("Post", "Report", "Ad", "Video", "Newsletter", "Audit")
+
+
+def dataset_sizes(scale: float):
+    sizes = {name: max(1, int(count * scale)) for name, count in FULL_SIZES.items()}
+    sizes["admins"] = max(1, sizes["users"] // 1000)
+    sizes["operatives"] = max(1, sizes["users"] // 100)
+    sizes["clients"] = max(1, sizes["users"] - sizes["admins"] - sizes["operatives"])
+    sizes["users"] = sizes["admins"] + sizes["operatives"] + sizes["clients"]
+    return sizes
+
+
+def user_email(role: str, index: int) -> str:
+    return f"{role.lower()}{index}@example.com"
+
+
+def user_ids(sizes):
+    admins = range(1, sizes["admins"] + 1)
+    operatives = range(admins.stop, admins.stop + sizes["operatives"])
+    clients = range(operatives.stop, operatives.stop + sizes["clients"])
+    return {"ADMIN": admins, "OPERATIVE": operatives, "CLIENT": clients}
+
+
+def generate_users(sizes, password_hash: str):
+    for role, ids in user_ids(sizes).items():
+        for index, id_user in enumerate(ids):
+            yield {"id_user": id_user, "name": f"{role.title()} {index}", "email": user_email(role, index),
+                   "password_hash": password_hash, "role": role, "phone_number": f"+1555{id_user:07d}",
+                   "address": f"{id_user} Benchmark Street"}
+
+
+def generate_components(rng: random.Random, sizes):
+    for id_component in range(1, sizes["components"] + 1):
+        yield {"id_component": id_component, "name": f"Component {id_component}",
+               "component_type": COMPONENT_TYPES[id_component % len(COMPONENT_TYPES)],
+               "unit_cost": Decimal(rng.randrange(100, 4_000)) / 100, "description": "Generated component"}
+
+
+def generate_products(rng: random.Random, sizes):
+    for id_product in range(1, sizes["products"] + 1):
+        yield {"id_product": id_product, "name": f"Product {id_product}",
+               "description": f"Generated product {id_product}",
+               "monthly_price": Decimal(rng.randrange(4_900, 99_900)) / 100,
+               "is_active": rng.random() < 0.9, "cost": 0, "margin": 0}
+
+
+def generate_links(rng: random.Random, sizes):
+    per_product = min(COMPONENTS_PER_PRODUCT, sizes["components"])
+    for id_product in range(1, sizes["products"] + 1):
+        for id_component in sorted(rng.sample(range(1, sizes["components"] + 1), per_product)):
+            yield {"id_product": id_product, "id_component": id_component, "quantity": rng.randint(1, 5)}
+
+
+def generate_subscriptions(rng: random.Random, sizes, start_dates):
+    clients = user_ids(sizes)["CLIENT"]
+    for id_subscription in range(1, sizes["subscriptions"] + 1):
+        start_date = ANCHOR_DATE - timedelta(days=rng.randrange(0, 730))
+        roll = rng.random()
+        if roll < 0.8:
+            status, end_date = "Active", start_date + timedelta(days=365 * rng.randint(1, 3))
+        elif roll < 0.9:
+            status, end_date = "Cancelled", start_date + timedelta(days=rng.randrange(30, 365))
+        else:
+            status, end_date = "Expired", start_date + timedelta(days=rng.randrange(30, 365))
+        start_dates.append(start_date)
+        yield {"id_subscription": id_subscription, "id_user": rng.choice(clients),
+               "id_product": rng.randint(1, sizes["products"]), "status": status,
+               "start_date": start_date, "end_date": end_date}
+
+
+def generate_campaigns(rng: random.Random, sizes, start_dates):
+    for id_campaign in range(1, sizes["campaigns"] + 1):
+        id_subscription = rng.randint(1, sizes["subscriptions"])
+        start_date = start_dates[id_subscription - 1] + timedelta(days=rng.randrange(0, 540))
+        end_date = start_date + timedelta(days=rng.randrange(7, 90))
+        if rng.random() < 0.05:
+            status = "On Hold"
+        elif end_date < ANCHOR_DATE:
+            status = "Completed"
+        elif start_date <= ANCHOR_DATE:
+            status = "Active"
+        else:
+            status = "Pending"
+        yield {"id_campaign": id_campaign, "id_subscription": id_subscription, "name": f"Campaign {id_campaign}",
+               "status": status, "start_date": start_date, "end_date": end_date}
+
+
+def insert_rows(engine, table, rows, chunk_size: int) -> int:
+    started = time.perf_counter()
+    total = 0
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            with engine.begin() as connection:
+                connection.execute(table.insert(), chunk)
+            total += len(chunk)
+            chunk = []
+    if chunk:
+        with engine.begin() as connection:
+            connection.execute(table.insert(), chunk)
+        total += len(chunk)
+    elapsed = time.perf_counter() - started
+    print(f"{table.name:<22} {total:>10} rows  {elapsed:7.1f} s  {total / max(elapsed, 1e-9):>9.0f} rows/s", flush=True)
+    return total
+
+
+def rebuild_derived_data(engine):
+    from backend.db.metrics import METRIC_FAMILIES, recompute_family
+    from backend.db.models import VERSIONED_TABLES
+    from backend.db.product_costs import refresh_product_costs
+    from backend.db.versioning import bump_versions
+
+    with engine.begin() as connection:
+        refresh_product_costs(connection)
+        for family in METRIC_FAMILIES:
+            recompute_family(connection, family)
+        bump_versions(connection, VERSIONED_TABLES)
+
+
+def build_dataset(engine, scale: float = 1.0, seed: int = 42, chunk_size: int = 10_000):
+    from backend.core.hashing import pwd_context
+    from backend.db.models import Campaign, Component, Product, ProductComponent, Subscription, User
+
+    sizes = dataset_sizes(scale)
+    rng = random.Random(seed)
+    start_dates = []
+    insert_rows(engine, User.__table__, generate_users(sizes, pwd_context.hash(PASSWORD)), chunk_size)
+    insert_rows(engine, Component.__table__, generate_components(rng, sizes), chunk_size)
+    insert_rows(engine, Product.__table__, generate_products(rng, sizes), chunk_size)
+    insert_rows(engine, ProductComponent.__table__, generate_links(rng, sizes), chunk_size)
+    insert_rows(engine, Subscription.__table__, generate_subscriptions(rng, sizes, start_dates), chunk_size)
+    insert_rows(engine, Campaign.__table__, generate_campaigns(rng, sizes, start_dates), chunk_size)
+    rebuild_derived_data(engine)
+    return sizes
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scale", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--chunk-size", type=int, default=10_000)
+    parser.add_argument("--reset", action="store_true", help="drop and recreate every table first")
+    args = parser.parse_args()
+
+    from sqlalchemy import func, select, text
+    from backend.db.base import Base
+    from backend.db.migrations import migrate
+    from backend.db.models import User
+    from backend.db.session import engine
+
+    if args.reset:
+        Base.metadata.drop_all(bind=engine)
+        with engine.begin() as connection:
+            connection.execute(text("DROP TABLE IF EXISTS alembic_version"))
+    migrate(engine)
+    with engine.connect() as connection:
+        if connection.execute(select(func.count()).select_from(User)).scalar():
+            parser.error("the database already has users; pass --reset to rebuild it")
+    started = time.perf_counter()
+    sizes = build_dataset(engine, scale=args.scale, seed=args.seed, chunk_size=args.chunk_size)
+    engine.dispose()
+    print(f"dataset {sizes} built in {time.perf_counter() - started:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,361 @@
+"""Scripted HTTP load test: a client/operative/admin mix against every router, with stored results.
+
+Build the dataset first (python -m backend.benchmarks.dataset --scale S), then run with the same
+--scale so virtual users log in as accounts that exist. Without --base-url the app is served
+in-process over ASGI and every virtual user gets its own client IP. Against a real server all users
+share one IP, so raise LOGIN_RATE_LIMIT_PER_IP (or set RATE_LIMIT_ENABLED=false) there first.
+
+Each run is written to --results-dir as JSON. --compare latest (or a path) prints the change
+in p95 and throughput per endpoint against an earlier run.
+
+Usage: python -m backend.benchmarks.load_test [--scale 0.05] [--users 50] [--duration 60]
+       [--mix client=70,operative=20,admin=10] [--read-only] [--base-url URL] [--label NAME]
+       [--compare latest]
+"""
+import argparse
+import asyncio
+import glob
+import json
+import os
+import random
+import subprocess
+import time
+from collections import Counter, defaultdict
+from datetime import date, datetime, timedelta, timezone
+
+import httpx
+
+from backend.benchmarks.common import percentile
+from backend.benchmarks.dataset import PASSWORD, dataset_sizes, user_email
+
+DEFAULT_MIX = "client=70,operative=20,admin=10"
+
+
+class Recorder:
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.statuses = defaultdict(Counter)
+
+    def record(self, label: str, latency: float, status_code: int):
+        self.latencies[label].append(latency)
+        self.statuses[label][status_code] += 1
+
+    def summary(self, duration: float):
+        endpoints = {}
+        for label in sorted(self.latencies):
+            ms = [value * 1000 for value in self.latencies[label]]
+            errors = sum(count for code, count in self.statuses[label].items() if code == 0 or code >= 400)
+            endpoints[label] = {
+                "count": len(ms), "errors": errors, "rps": round(len(ms) / duration, 2),
+                "p50_ms": round(percentile(ms, 50), 2), "p95_ms": round(percentile(ms, 95), 2),
+                "p99_ms": round(percentile(ms, 99), 2), "max_ms": round(max(ms), 2),
+                "statuses": {str(code): count for code, count in sorted(self.statuses[label].items())},
+            }
+        total = sum(endpoint["count"] for endpoint in endpoints.values())
+        errors = sum(endpoint["errors"] for endpoint in endpoints.values())
+        return {"requests": total, "errors": errors, "rps": round(total / duration, 2)}, endpoints
+
+
+class VirtualUser:
+    def __init__(self, client, recorder: Recorder, rng: random.Random, role: str, email: str, sizes, read_only: bool):
+        self.client = client
+        self.recorder = recorder
+        self.rng = rng
+        self.role = role
+        self.email = email
+        self.sizes = sizes
+        self.read_only = read_only
+        self.tokens = {}
+        self.etags = {}
+        self.active_products = []
+
+    async def request(self, label: str, method: str, url: str, cached: bool = False, **kwargs):
+        headers = kwargs.pop("headers", {})
+        if self.tokens:
+            headers["Authorization"] = f"Bearer {self.tokens['access_token']}"
+        if cached and url in self.etags:
+            headers["If-None-Match"] = self.etags[url]
+        started = time.perf_counter()
+        try:
+            if method == "GET" and "/exports/" in url:
+                async with self.client.stream(method, url, headers=headers, **kwargs) as response:
+                    async for _ in response.aiter_bytes():
+                        pass
+            else:
+                response = await self.client.request(method, url, headers=headers, **kwargs)
+        except httpx.HTTPError:
+            self.recorder.record(label, time.perf_counter() - started, 0)
+            raise
+        self.recorder.record(label, time.perf_counter() - started, response.status_code)
+        if cached and "etag" in response.headers:
+            self.etags[url] = response.headers["etag"]
+        return response
+
+    async def login(self):
+        response = await self.request("POST /login", "POST", "/login",
+                                      data={"username": self.email, "password": PASSWORD})
+        response.raise_for_status()
+        self.tokens = response.json()
+
+    async def refresh(self):
+        response = await self.request("POST /refresh", "POST", "/refresh",
+                                      json={"refresh_token": self.tokens["refresh_token"]})
+        if response.status_code == 200:
+            self.tokens = response.json()
+
+    def product_id(self) -> int:
+        return self.rng.randint(1, self.sizes["products"])
+
+    # Client actions
+    async def browse_catalog(self):
+        await self.request("GET /products/list", "GET", "/products/list", cached=True)
+
+    async def product_drop_down(self):
+        await self.request("GET /products/drop_down", "GET", "/products/drop_down")
+
+    async def my_campaigns(self):
+        await self.request("GET /campaigns/", "GET", "/campaigns/", cached=True)
+
+    async def my_subscriptions(self):
+        response = await self.request("GET /subscriptions/my-active-ids", "GET", "/subscriptions/my-active-ids",
+                                      cached=True)
+        if response.status_code == 200:
+            self.active_products = response.json()
+
+    async def me(self):
+        await self.request("GET /users/me", "GET", "/users/me")
+
+    async def create_campaign(self):
+        if self.read_only or not self.active_products:
+            return await self.my_subscriptions()
+        start = date.today() + timedelta(days=self.rng.randint(1, 60))
+        await self.request("POST /campaigns/", "POST", "/campaigns/", json={
+            "name": f"Load test {self.rng.randint(1, 10**6)}", "id_product": self.rng.choice(self.active_products),
+            "start_date": start.isoformat(), "end_date": (start + timedelta(days=30)).isoformat()})
+
+    async def subscribe(self):
+        if self.read_only:
+            return await self.browse_catalog()
+        await self.request("POST /subscriptions/", "POST", "/subscriptions/", json={"id_product": self.product_id()})
+
+    # Operative actions
+    async def manage_products(self):
+        await self.request("GET /products-management/", "GET", "/products-management/", cached=True,
+                           params={"sort": self.rng.choice(["name", "-monthly_price", "id"])})
+
+    async def manage_components(self):
+        await self.request("GET /components-management/", "GET", "/components-management/", cached=True)
+
+    async def manage_packages(self):
+        await self.request("GET /packages-management/", "GET", "/packages-management/", cached=True)
+
+    async def margins(self):
+        await self.request("GET /products-management/margins", "GET", "/products-management/margins", cached=True)
+
+    async def reprice_product(self):
+        if self.read_only:
+            return await self.manage_products()
+        await self.request("PUT /products-management/{product_id}", "PUT",
+                           f"/products-management/{self.product_id()}",
+                           json={"monthly_price": str(self.rng.randrange(4_900, 99_900) / 100)})
+
+    async def recost_component(self):
+        if self.read_only:
+            return await self.manage_components()
+        await self.request("PUT /components-management/{component_id}", "PUT",
+                           f"/components-management/{self.rng.randint(1, self.sizes['components'])}",
+                           json={"unit_cost": str(self.rng.randrange(100, 4_000) / 100)})
+
+    # Admin actions
+    async def clients(self):
+        await self.request("GET /admin/clients", "GET", "/admin/clients",
+                           params={"email": f"client{self.rng.randint(0, 99)}"})
+
+    async def admin_campaigns(self):
+        await self.request("GET /admin/campaigns", "GET", "/admin/campaigns",
+                           params={"sort": self.rng.choice(["id", "-start_date", "end_date"])})
+
+    async def metrics(self):
+        await self.request("GET /admin/metrics", "GET", "/admin/metrics")
+
+    async def pool_stats(self):
+        await self.request("GET /admin/db/pool", "GET", "/admin/db/pool")
+
+    async def export_client_campaigns(self):
+        client_id = self.rng.choice(range(self.sizes["admins"] + self.sizes["operatives"] + 1,
+                                          self.sizes["users"] + 1))
+        await self.request("GET /admin/exports/campaigns", "GET", "/admin/exports/campaigns",
+                           params={"client_id": client_id, "format": "ndjson"})
+
+    async def export_clients(self):
+        await self.request("GET /admin/exports/clients", "GET", "/admin/exports/clients")
+
+    async def profiles(self):
+        await self.request("GET /admin/profiles", "GET", "/admin/profiles")
+
+    async def hold_campaigns(self):
+        if self.read_only:
+            return await self.admin_campaigns()
+        ids = [self.rng.randint(1, self.sizes["campaigns"]) for _ in range(5)]
+        await self.request("PATCH /admin/campaigns", "PATCH", "/admin/campaigns",
+                           json={"ids": ids, "status": self.rng.choice(["On Hold", "Active"])})
+
+    async def health(self):
+        await self.request("GET /health/ready", "GET", "/health/ready")
+
+    async def scrape_metrics(self):
+        await self.request("GET /health/metrics", "GET", "/health/metrics")
+
+
+SCENARIOS = {
+    "CLIENT": [
+        (VirtualUser.browse_catalog, 25), (VirtualUser.product_drop_down, 10), (VirtualUser.my_campaigns, 25),
+        (VirtualUser.my_subscriptions, 15), (VirtualUser.me, 12), (VirtualUser.create_campaign, 6),
+        (VirtualUser.subscribe, 1), (VirtualUser.refresh, 3),
+    ],
+    "OPERATIVE": [
+        (VirtualUser.manage_products, 25), (VirtualUser.manage_components, 20), (VirtualUser.manage_packages, 20),
+        (VirtualUser.margins, 15), (VirtualUser.browse_catalog, 10), (VirtualUser.reprice_product, 5),
+        (VirtualUser.recost_component, 5),
+    ],
+    "ADMIN": [
+        (VirtualUser.clients, 20), (VirtualUser.admin_campaigns, 25), (VirtualUser.metrics, 15),
+        (VirtualUser.pool_stats, 5), (VirtualUser.export_client_campaigns, 5), (VirtualUser.export_clients, 1),
+        (VirtualUser.profiles, 2), (VirtualUser.hold_campaigns, 3), (VirtualUser.health, 2),
+        (VirtualUser.scrape_metrics, 5), (VirtualUser.me, 2),
+    ],
+}
+
+
+def parse_mix(mix: str):
+    weights = {}
+    for part in mix.split(","):
+        role, _, weight = part.partition("=")
+        weights[role.strip().upper()] = float(weight)
+    return weights
+
+
+async def run_user(user: VirtualUser, deadline: float, think_seconds: float):
+    actions, weights = zip(*SCENARIOS[user.role])
+    await user.login()
+    while time.perf_counter() < deadline:
+        try:
+            await user.rng.choices(actions, weights)[0](user)
+        except httpx.HTTPError:
+            pass
+        if think_seconds:
+            await asyncio.sleep(think_seconds * user.rng.uniform(0.5, 1.5))
+
+
+async def run(args, sizes):
+    recorder = Recorder()
+    rng = random.Random(args.seed)
+    mix = parse_mix(args.mix)
+    role_counts = {"CLIENT": sizes["clients"], "OPERATIVE": sizes["operatives"], "ADMIN": sizes["admins"]}
+    app = None
+    if args.base_url is None:
+        from backend.main import app
+        from backend.core import password_hasher
+        password_hasher.start()
+
+    clients, users = [], []
+    for index in range(args.users):
+        role = rng.choices(list(mix), list(mix.values()))[0]
+        email = user_email(role, rng.randrange(role_counts[role]))
+        if app is not None:
+            ip = f"10.{index // 65536}.{index // 256 % 256}.{index % 256}"
+            transport = httpx.ASGITransport(app=app, raise_app_exceptions=False, client=(ip, 50000))
+            client = httpx.AsyncClient(transport=transport, base_url="http://load-test", timeout=300)
+        else:
+            client = httpx.AsyncClient(base_url=args.base_url, timeout=300)
+        clients.append(client)
+        users.append(VirtualUser(client, recorder, random.Random(f"{args.seed}-{index}"), role, email, sizes,
+                                 args.read_only))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(run_user(user, started + args.duration, args.think_ms / 1000) for user in users))
+    elapsed = time.perf_counter() - started
+    for client in clients:
+        await client.aclose()
+    if app is not None:
+        from backend.core import password_hasher
+        from backend.db.session import async_engine
+        password_hasher.shutdown()
+        if async_engine is not None:
+            await async_engine.dispose()
+    return recorder, elapsed, Counter(user.role for user in users)
+
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def find_baseline(results_dir: str, compare: str, current: str):
+    if compare != "latest":
+        return compare
+    runs = sorted(path for path in glob.glob(os.path.join(results_dir, "*.json")) if path != current)
+    return runs[-1] if runs else None
+
+
+def print_report(result, baseline=None):
+    base = baseline["endpoints"] if baseline else {}
+    print(f"{'endpoint':<42} {'count':>7} {'err':>5} {'rps':>8} {'p50':>9} {'p95':>9} {'p99':>9}"
+          + ("   p95 vs base   rps vs base" if baseline else ""))
+    for label, stats in result["endpoints"].items():
+        line = (f"{label:<42} {stats['count']:>7} {stats['errors']:>5} {stats['rps']:>8.1f} "
+                f"{stats['p50_ms']:>8.1f}ms {stats['p95_ms']:>8.1f}ms {stats['p99_ms']:>8.1f}ms")
+        if label in base:
+            p95_change = (stats["p95_ms"] / base[label]["p95_ms"] - 1) * 100 if base[label]["p95_ms"] else 0
+            rps_change = (stats["rps"] / base[label]["rps"] - 1) * 100 if base[label]["rps"] else 0
+            line += f"   {p95_change:>+10.1f}%   {rps_change:>+10.1f}%"
+        print(line)
+    totals = result["totals"]
+    print(f"total: {totals['requests']} requests, {totals['errors']} errors, {totals['rps']:.1f} req/s")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scale", type=float, default=0.05, help="--scale the dataset was built with")
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=60)
+    parser.add_argument("--think-ms", type=float, default=0)
+    parser.add_argument("--mix", default=DEFAULT_MIX)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--read-only", action="store_true", help="replace write actions with reads")
+    parser.add_argument("--base-url", default=None, help="target a running server instead of the in-process app")
+    parser.add_argument("--label", default="run")
+    parser.add_argument("--results-dir", default="load_test_results")
+    parser.add_argument("--compare", default=None, help="'latest' or a results file to compare against")
+    args = parser.parse_args()
+
+    sizes = dataset_sizes(args.scale)
+    recorder, elapsed, roles = asyncio.run(run(args, sizes))
+    totals, endpoints = recorder.summary(elapsed)
+    started_at = datetime.now(timezone.utc)
+    result = {
+        "label": args.label, "finished_at": started_at.isoformat(), "git_revision": git_revision(),
+        "config": {key: value for key, value in vars(args).items() if key not in ("results_dir", "compare")},
+        "virtual_users": dict(roles), "duration_s": round(elapsed, 2), "totals": totals, "endpoints": endpoints,
+    }
+    os.makedirs(args.results_dir, exist_ok=True)
+    path = os.path.join(args.results_dir, f"{started_at:%Y%m%dT%H%M%SZ}-{args.label}.json")
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(result, handle, indent=2)
+
+    baseline = None
+    if args.compare:
+        baseline_path = find_baseline(args.results_dir, args.compare, path)
+        if baseline_path:
+            with open(baseline_path, encoding="utf-8") as handle:
+                baseline = json.load(handle)
+            print(f"comparing with {baseline_path}")
+    print_report(result, baseline)
+    print(f"results written to {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,2 +1,8 @@
 from .auth import *
 from .config import *
+from .catalog_snapshot import catalog_snapshot, refresh_catalog
+from .http_cache import conditional_response, resource_validators, validator_headers, is_not_modified
+from .lifecycle import lifecycle_scheduler, metrics_reconciler, run_lifecycle, run_reconcile
+from .responses import FastJSONResponse, fast_response
+from .profiling import request_profiler
+from .telemetry import telemetry, render_metrics, install_query_tracking, TELEMETRY_ENABLED
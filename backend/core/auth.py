@@ -1,18 +1,39 @@
-from backend.core.config import SECRET_KEY, ACCESS_TOKEN_EXPIRE_MINUTES, ALGORITHM
+from backend.core.config import (SECRET_KEY, ACCESS_TOKEN_EXPIRE_MINUTES, ALGORITHM, REFRESH_TOKEN_EXPIRE_DAYS,
+                                 AUTH_CACHE_MAXSIZE, AUTH_CACHE_TTL_SECONDS, AUTH_CACHE_RECHECK_SECONDS,
+                                 HASH_POOL_WORKERS, HASH_POOL_MAX_PENDING,
+                                 LAST_LOGIN_FLUSH_INTERVAL_SECONDS, LAST_LOGIN_FLUSH_BATCH_SIZE,
+                                 RATE_LIMIT_ENABLED, RATE_LIMIT_WINDOW_SECONDS, RATE_LIMIT_MAX_KEYS,
+                                 RATE_LIMIT_REDIS_URL, LOGIN_RATE_LIMIT_PER_IP, LOGIN_RATE_LIMIT_PER_EMAIL,
+                                 REGISTER_RATE_LIMIT_PER_IP, REGISTER_RATE_LIMIT_PER_EMAIL)
+from backend.core.principal_cache import PrincipalCache
+from backend.core.hashing import PasswordHasher, pwd_context
+from backend.core.last_login import LastLoginWriteBehind
+from backend.core.rate_limit import AdmissionControl, build_rate_limit_store
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from datetime import datetime, timedelta, timezone
 from typing import Optional
+import uuid
 from jose import JWTError, jwt
-from passlib.context import CryptContext
-from backend.db.session import get_db
+from backend.db.session import get_db, get_async_db, SessionLocal
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from backend.functions import get_user_by_id
+from backend.functions import (get_user_by_id, get_user_by_id_async, get_principals_version,
+                               get_principals_version_async)
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="login")
-
-
-pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
+principal_cache = PrincipalCache(maxsize=AUTH_CACHE_MAXSIZE, ttl_seconds=AUTH_CACHE_TTL_SECONDS,
+                                 recheck_seconds=AUTH_CACHE_RECHECK_SECONDS)
+password_hasher = PasswordHasher(workers=HASH_POOL_WORKERS, max_pending=HASH_POOL_MAX_PENDING)
+last_login_writer = LastLoginWriteBehind(SessionLocal, flush_interval_seconds=LAST_LOGIN_FLUSH_INTERVAL_SECONDS,
+                                         batch_size=LAST_LOGIN_FLUSH_BATCH_SIZE)
+rate_limit_store = build_rate_limit_store(RATE_LIMIT_REDIS_URL, max_keys=RATE_LIMIT_MAX_KEYS)
+login_admission = AdmissionControl(rate_limit_store, "login", RATE_LIMIT_WINDOW_SECONDS,
+                                   per_ip=LOGIN_RATE_LIMIT_PER_IP, per_email=LOGIN_RATE_LIMIT_PER_EMAIL,
+                                   enabled=RATE_LIMIT_ENABLED)
+register_admission = AdmissionControl(rate_limit_store, "register", RATE_LIMIT_WINDOW_SECONDS,
+                                      per_ip=REGISTER_RATE_LIMIT_PER_IP, per_email=REGISTER_RATE_LIMIT_PER_EMAIL,
+                                      enabled=RATE_LIMIT_ENABLED)
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
@@ -27,6 +48,23 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
+def create_refresh_token(user_id: int, family: Optional[str] = None):
+    jti = uuid.uuid4().hex
+    family = family or uuid.uuid4().hex
+    expire = datetime.now(timezone.utc) + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
+    to_encode = {"id_user": user_id, "type": "refresh", "jti": jti, "fam": family, "exp": expire}
+    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    return encoded_jwt, jti, family, expire
+
+def verify_refresh_token(token: str):
+    try:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    except JWTError:
+        return None
+    if payload.get("type") != "refresh" or not payload.get("jti") or payload.get("id_user") is None:
+        return None
+    return payload
+
 def verify_access_token(token: str):
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
@@ -34,19 +72,42 @@ def verify_access_token(token: str):
     except JWTError:
         return None
     
-def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
+def decode_access_token(token: str) -> dict:
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id = payload.get("id_user")
-        if user_id is None:
-            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid authentication")
     except JWTError:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid authentication")
-    
-    user = get_user_by_id(db, user_id)
+    if payload.get("id_user") is None or payload.get("type") == "refresh":
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid authentication")
+    return payload
+
+def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
+    cached = principal_cache.get(token)
+    if cached is not None and principal_cache.version_due():
+        principal_cache.sync_version(get_principals_version(db))
+        cached = principal_cache.get(token)
+    if cached is not None:
+        return cached[1]
+
+    payload = decode_access_token(token)
+    user = get_user_by_id(db, payload["id_user"])
+    if user is None:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
+    return principal_cache.put(token, payload, user)
+
+async def get_current_user_async(token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_async_db)):
+    cached = principal_cache.get(token)
+    if cached is not None and principal_cache.version_due():
+        principal_cache.sync_version(await get_principals_version_async(db))
+        cached = principal_cache.get(token)
+    if cached is not None:
+        return cached[1]
+
+    payload = decode_access_token(token)
+    user = await get_user_by_id_async(db, payload["id_user"])
     if user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
-    return user
+    return principal_cache.put(token, payload, user)
 
 def admin_required(current_user = Depends(get_current_user)):
     if current_user.role != "ADMIN":
@@ -0,0 +1,100 @@
+import threading
+import time
+from typing import List, Optional, Tuple
+
+from pydantic import TypeAdapter
+
+from backend.core.config import CATALOG_SNAPSHOT_TTL_SECONDS
+from backend.schemas import Page, ProductCard, ProductDropDown
+
+PAGE_CACHE_MAXSIZE = 256
+CATALOG_RESOURCES = ("components", "products", "products_components")
+
+catalog_page_adapter = TypeAdapter(Page[ProductCard])
+drop_down_adapter = TypeAdapter(List[ProductDropDown])
+
+
+class CatalogSnapshot:
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self.version = 0
+        self._products: Optional[list] = None
+        self._drop_down = b"[]"
+        self.resource_versions = []
+        self._pages = {}
+        self._built_at = 0.0
+        self._lock = threading.Lock()
+
+    def is_fresh(self) -> bool:
+        return self._products is not None and time.monotonic() - self._built_at < self.ttl_seconds
+
+    def load(self, rows, resource_versions) -> int:
+        products = {}
+        for row in rows:
+            card = products.get(row.id_product)
+            if card is None:
+                card = products[row.id_product] = {
+                    "id_product": row.id_product,
+                    "name": row.name,
+                    "description": row.description,
+                    "monthly_price": row.monthly_price,
+                    "components": [],
+                }
+            if row.component_name is not None:
+                card["components"].append({"name": row.component_name, "quantity": row.quantity})
+
+        drop_down = drop_down_adapter.dump_json(drop_down_adapter.validate_python(
+            [{"id_product": p["id_product"], "name": p["name"]} for p in products.values()]
+        ))
+        with self._lock:
+            self._products = list(products.values())
+            self._drop_down = drop_down
+            self.resource_versions = list(resource_versions)
+            self._pages = {}
+            self._built_at = time.monotonic()
+            self.version += 1
+            return self.version
+
+    def clear(self):
+        with self._lock:
+            self._products = None
+            self._pages = {}
+
+    def drop_down(self) -> Tuple[int, bytes, list]:
+        with self._lock:
+            return self.version, self._drop_down, self.resource_versions
+
+    def page(self, spec, params) -> Tuple[int, bytes, list]:
+        from backend.functions.pagination import make_page
+        key = (params.sort_param, tuple(params.after) if params.after else None, params.limit, params.include_total)
+        with self._lock:
+            version, products, body = self.version, self._products, self._pages.get(key)
+            resource_versions = self.resource_versions
+        if body is not None:
+            return version, body, resource_versions
+
+        keys = [column.key for column in spec.key_columns(params.sort)]
+        sort_key = lambda product: tuple(product[k] for k in keys)
+        rows = sorted(products, key=sort_key, reverse=params.descending)
+        if params.after is not None:
+            after = tuple(params.after)
+            rows = [p for p in rows if (sort_key(p) < after if params.descending else sort_key(p) > after)]
+        total = len(products) if params.include_total else None
+        page = make_page(rows[:params.limit + 1], spec, params, total)
+        body = catalog_page_adapter.dump_json(catalog_page_adapter.validate_python(page))
+
+        with self._lock:
+            if self.version == version:
+                if len(self._pages) >= PAGE_CACHE_MAXSIZE:
+                    self._pages.clear()
+                self._pages[key] = body
+        return version, body, resource_versions
+
+
+catalog_snapshot = CatalogSnapshot(ttl_seconds=CATALOG_SNAPSHOT_TTL_SECONDS)
+
+
+def refresh_catalog(db) -> int:
+    from backend.functions import get_catalog_rows, get_resource_versions
+    resource_versions = get_resource_versions(db, CATALOG_RESOURCES)
+    return catalog_snapshot.load(get_catalog_rows(db), resource_versions)
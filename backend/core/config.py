@@ -1,8 +1,45 @@
 import os
+import tempfile
 from dotenv import load_dotenv
 
 load_dotenv()
 
 SECRET_KEY = os.getenv("SECRET_KEY")
 ALGORITHM = os.getenv("ALGORITHM")
-ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES"))
\ No newline at end of file
+ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES"))
+AUTH_CACHE_MAXSIZE = int(os.getenv("AUTH_CACHE_MAXSIZE", "4096"))
+AUTH_CACHE_TTL_SECONDS = int(os.getenv("AUTH_CACHE_TTL_SECONDS", "60"))
+AUTH_CACHE_RECHECK_SECONDS = float(os.getenv("AUTH_CACHE_RECHECK_SECONDS", "1"))
+HASH_POOL_WORKERS = int(os.getenv("HASH_POOL_WORKERS", "2"))
+HASH_POOL_MAX_PENDING = int(os.getenv("HASH_POOL_MAX_PENDING", "64"))
+REFRESH_TOKEN_EXPIRE_DAYS = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "14"))
+LAST_LOGIN_WRITE_BEHIND = os.getenv("LAST_LOGIN_WRITE_BEHIND", "true").lower() in ("1", "true", "yes")
+LAST_LOGIN_FLUSH_INTERVAL_SECONDS = float(os.getenv("LAST_LOGIN_FLUSH_INTERVAL_SECONDS", "5"))
+LAST_LOGIN_FLUSH_BATCH_SIZE = int(os.getenv("LAST_LOGIN_FLUSH_BATCH_SIZE", "500"))
+PAGE_SIZE_DEFAULT = int(os.getenv("PAGE_SIZE_DEFAULT", "50"))
+PAGE_SIZE_MAX = int(os.getenv("PAGE_SIZE_MAX", "500"))
+CATALOG_SNAPSHOT_TTL_SECONDS = float(os.getenv("CATALOG_SNAPSHOT_TTL_SECONDS", "30"))
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", "2000"))
+BULK_IMPORT_MAX_ROWS = int(os.getenv("BULK_IMPORT_MAX_ROWS", "10000"))
+BULK_IMPORT_CHUNK_SIZE = int(os.getenv("BULK_IMPORT_CHUNK_SIZE", "500"))
+LIFECYCLE_SCHEDULER_ENABLED = os.getenv("LIFECYCLE_SCHEDULER_ENABLED", "false").lower() in ("1", "true", "yes")
+LIFECYCLE_INTERVAL_SECONDS = float(os.getenv("LIFECYCLE_INTERVAL_SECONDS", "900"))
+LIFECYCLE_BATCH_SIZE = int(os.getenv("LIFECYCLE_BATCH_SIZE", "1000"))
+METRICS_RECONCILE_INTERVAL_SECONDS = float(os.getenv("METRICS_RECONCILE_INTERVAL_SECONDS", "3600"))
+RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "true").lower() in ("1", "true", "yes")
+RATE_LIMIT_WINDOW_SECONDS = float(os.getenv("RATE_LIMIT_WINDOW_SECONDS", "60"))
+RATE_LIMIT_MAX_KEYS = int(os.getenv("RATE_LIMIT_MAX_KEYS", "100000"))
+RATE_LIMIT_REDIS_URL = os.getenv("RATE_LIMIT_REDIS_URL", "")
+LOGIN_RATE_LIMIT_PER_IP = int(os.getenv("LOGIN_RATE_LIMIT_PER_IP", "30"))
+LOGIN_RATE_LIMIT_PER_EMAIL = int(os.getenv("LOGIN_RATE_LIMIT_PER_EMAIL", "10"))
+REGISTER_RATE_LIMIT_PER_IP = int(os.getenv("REGISTER_RATE_LIMIT_PER_IP", "10"))
+REGISTER_RATE_LIMIT_PER_EMAIL = int(os.getenv("REGISTER_RATE_LIMIT_PER_EMAIL", "3"))
+PROFILING_ENABLED = os.getenv("PROFILING_ENABLED", "false").lower() in ("1", "true", "yes")
+PROFILING_SAMPLE_RATE = float(os.getenv("PROFILING_SAMPLE_RATE", "0"))
+PROFILING_INTERVAL_MS = float(os.getenv("PROFILING_INTERVAL_MS", "5"))
+PROFILING_MAX_REPORTS = int(os.getenv("PROFILING_MAX_REPORTS", "50"))
+PROFILING_DIR = os.getenv("PROFILING_DIR", os.path.join(tempfile.gettempdir(), "cloud_chaser_profiles"))
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() in ("1", "true", "yes")
+TRACING_ENABLED = os.getenv("TRACING_ENABLED", "false").lower() in ("1", "true", "yes")
+TRACING_SAMPLE_RATE = float(os.getenv("TRACING_SAMPLE_RATE", "1"))
+TRACING_FILE = os.getenv("TRACING_FILE", os.path.join(tempfile.gettempdir(), "cloud_chaser_traces.ndjson"))
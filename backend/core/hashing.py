@@ -0,0 +1,65 @@
+import asyncio
+import time
+from concurrent.futures import ProcessPoolExecutor
+from fastapi import HTTPException, status
+from passlib.context import CryptContext
+from starlette.concurrency import run_in_threadpool
+from backend.core.telemetry import HASHING_PENDING, observe_hashing
+
+pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
+
+
+def _hash(password: str) -> str:
+    return pwd_context.hash(password)
+
+def _verify(password: str, hashed_password: str) -> bool:
+    return pwd_context.verify(password, hashed_password)
+
+
+class PasswordHasher:
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = workers
+        self.max_pending = max_pending
+        self._executor = None
+        self._pending = 0
+
+    def start(self):
+        if self.workers > 0 and self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            for future in [self._executor.submit(_hash, "warmup") for _ in range(self.workers)]:
+                future.result()
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    async def hash(self, password: str) -> str:
+        return await self._submit("hash", _hash, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return await self._submit("verify", _verify, password, hashed_password)
+
+    async def _submit(self, operation: str, fn, *args):
+        if self._pending >= self.max_pending:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Authentication service is busy, please retry.",
+                headers={"Retry-After": "1"},
+            )
+        self._pending += 1
+        HASHING_PENDING.inc()
+        started_at, started = time.time(), time.perf_counter()
+        try:
+            if self._executor is None:
+                return await run_in_threadpool(fn, *args)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, fn, *args)
+        finally:
+            self._pending -= 1
+            HASHING_PENDING.dec()
+            observe_hashing(operation, started_at, time.perf_counter() - started)
@@ -0,0 +1,59 @@
+import hashlib
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional, Tuple
+
+from fastapi import Request, Response, status
+
+REPRESENTATION_VERSION = "1"
+# resource_versions.updated_at has whole-second precision, so a Last-Modified from the current second could be
+# followed by another write with the same timestamp. It is only sent once that second is over.
+LAST_MODIFIED_SETTLE = timedelta(seconds=1)
+
+
+def make_etag(*parts) -> str:
+    digest = hashlib.sha1("|".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+    return f'W/"{digest[:24]}"'
+
+
+def resource_validators(versions, *parts) -> Tuple[str, Optional[datetime]]:
+    etag = make_etag(REPRESENTATION_VERSION, *parts, *(f"{v.name}.{v.version}" for v in versions))
+    last_modified = max((v.updated_at for v in versions), default=None)
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    if last_modified is not None and now - last_modified < LAST_MODIFIED_SETTLE:
+        last_modified = None
+    return etag, last_modified
+
+
+def validator_headers(etag: str, last_modified: Optional[datetime]) -> dict:
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(last_modified.replace(tzinfo=timezone.utc), usegmt=True)
+    return headers
+
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[datetime]) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        candidates = [tag.strip() for tag in if_none_match.split(",")]
+        return "*" in candidates or any(tag.removeprefix("W/") == etag.removeprefix("W/") for tag in candidates)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    return last_modified.replace(tzinfo=timezone.utc) <= since
+
+
+def conditional_response(request: Request, response: Response, versions, *parts) -> Optional[Response]:
+    etag, last_modified = resource_validators(versions, request.url.path, request.url.query, *parts)
+    headers = validator_headers(etag, last_modified)
+    if is_not_modified(request, etag, last_modified):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return None
@@ -0,0 +1,83 @@
+import logging
+import threading
+from datetime import datetime
+from sqlalchemy import case, update
+from backend.db.models import User
+
+logger = logging.getLogger(__name__)
+
+
+class LastLoginWriteBehind:
+    def __init__(self, session_factory, flush_interval_seconds: float, batch_size: int):
+        self.session_factory = session_factory
+        self.flush_interval_seconds = flush_interval_seconds
+        self.batch_size = batch_size
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def record(self, user_id: int, logged_in_at: datetime):
+        with self._lock:
+            previous = self._pending.get(user_id)
+            if previous is None or logged_in_at > previous:
+                self._pending[user_id] = logged_in_at
+            full = len(self._pending) >= self.batch_size
+        if full:
+            self._wake.set()
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def flush(self) -> int:
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, {}
+            if not batch:
+                return 0
+
+            db = self.session_factory()
+            try:
+                db.execute(
+                    update(User)
+                    .where(User.id_user.in_(list(batch)))
+                    .values(last_login_at=case(batch, value=User.id_user))
+                    .execution_options(synchronize_session=False)
+                )
+                db.commit()
+            except Exception:
+                db.rollback()
+                with self._lock:
+                    for user_id, logged_in_at in batch.items():
+                        self._pending.setdefault(user_id, logged_in_at)
+                raise
+            finally:
+                db.close()
+            return len(batch)
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="last-login-write-behind", daemon=True)
+        self._thread.start()
+
+    def shutdown(self):
+        if self._thread is not None:
+            self._stop.set()
+            self._wake.set()
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval_seconds)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Failed to flush last_login_at updates")
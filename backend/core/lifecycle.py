@@ -0,0 +1,205 @@
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from datetime import date
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy import select, text, update
+
+from backend.core.config import (LIFECYCLE_BATCH_SIZE, LIFECYCLE_INTERVAL_SECONDS, LIFECYCLE_SCHEDULER_ENABLED,
+                                 METRICS_RECONCILE_INTERVAL_SECONDS)
+from backend.db.metrics import MAINTAINS_METRICS, apply_deltas, reconcile_metrics, status_change_deltas
+from backend.db.models import Campaign, CampaignStatus, Subscription, SubscriptionStatus
+from backend.db.session import SessionLocal
+
+logger = logging.getLogger(__name__)
+LIFECYCLE_LOCK = "cloud_chaser_lifecycle"
+RECONCILE_LOCK = "cloud_chaser_reconcile_metrics"
+_process_locks = {LIFECYCLE_LOCK: threading.Lock(), RECONCILE_LOCK: threading.Lock()}
+
+
+class LifecycleStep:
+    def __init__(self, name: str, model, pk, criteria: Callable[[date], list], values: Dict):
+        self.name = name
+        self.model = model
+        self.pk = pk
+        self.criteria = criteria
+        self.values = values
+
+    def run(self, session_factory, today: date, batch_size: int) -> Dict:
+        started = time.perf_counter()
+        updated = batches = 0
+        while True:
+            db = session_factory()
+            try:
+                criteria = self.criteria(today)
+                ids = db.execute(select(self.pk).where(*criteria).limit(batch_size)).scalars().all()
+                if ids:
+                    where = [self.pk.in_(ids), *criteria]
+                    deltas = status_change_deltas(db.connection(), self.model, where, self.values["status"])
+                    result = db.execute(
+                        update(self.model)
+                        .where(*where)
+                        .values(**self.values)
+                        .execution_options(synchronize_session=False, **{MAINTAINS_METRICS: True})
+                    )
+                    apply_deltas(db.connection(), deltas)
+                    db.commit()
+                    updated += result.rowcount
+                    batches += 1
+            finally:
+                db.close()
+            if len(ids) < batch_size:
+                break
+        return {"step": self.name, "updated": updated, "batches": batches,
+                "elapsed_ms": round((time.perf_counter() - started) * 1000, 1)}
+
+
+LIFECYCLE_STEPS = (
+    LifecycleStep(
+        "complete_campaigns", Campaign, Campaign.id_campaign,
+        lambda today: [Campaign.status.in_([CampaignStatus.Pending, CampaignStatus.Active]),
+                       Campaign.end_date < today],
+        {"status": CampaignStatus.Completed},
+    ),
+    LifecycleStep(
+        "activate_campaigns", Campaign, Campaign.id_campaign,
+        lambda today: [Campaign.status == CampaignStatus.Pending, Campaign.start_date <= today],
+        {"status": CampaignStatus.Active},
+    ),
+    LifecycleStep(
+        "expire_subscriptions", Subscription, Subscription.id_subscription,
+        lambda today: [Subscription.status == SubscriptionStatus.Active, Subscription.end_date < today],
+        {"status": SubscriptionStatus.Expired},
+    ),
+)
+
+
+# On MySQL a named lock held by one connection keeps overlapping runs from every worker and instance apart.
+# Other databases only get a per-process lock.
+@contextmanager
+def lifecycle_lock(session_factory, name: str = LIFECYCLE_LOCK):
+    process_lock = _process_locks[name]
+    if not process_lock.acquire(blocking=False):
+        yield False
+        return
+    try:
+        db = session_factory()
+        try:
+            if db.get_bind().dialect.name != "mysql":
+                yield True
+                return
+            connection = db.connection()
+            acquired = connection.execute(text("SELECT GET_LOCK(:name, 0)"), {"name": name}).scalar() == 1
+            try:
+                yield acquired
+            finally:
+                if acquired:
+                    connection.execute(text("SELECT RELEASE_LOCK(:name)"), {"name": name})
+        finally:
+            db.close()
+    finally:
+        process_lock.release()
+
+
+def run_reconcile(session_factory=SessionLocal) -> Optional[int]:
+    with lifecycle_lock(session_factory, RECONCILE_LOCK) as acquired:
+        if not acquired:
+            logger.info("metrics reconcile skipped: another run holds the lock")
+            return None
+        db = session_factory()
+        try:
+            return reconcile_metrics(db)
+        finally:
+            db.close()
+
+
+def run_lifecycle(session_factory=SessionLocal, today: Optional[date] = None,
+                  batch_size: int = LIFECYCLE_BATCH_SIZE) -> List[Dict]:
+    with lifecycle_lock(session_factory) as acquired:
+        if not acquired:
+            logger.info("lifecycle run skipped: another run holds the lock")
+            return []
+        return run_steps(session_factory, today or date.today(), batch_size)
+
+
+def run_steps(session_factory, today: date, batch_size: int) -> List[Dict]:
+    report = [step.run(session_factory, today, batch_size) for step in LIFECYCLE_STEPS]
+    started = time.perf_counter()
+    drifted = run_reconcile(session_factory)
+    report.append({"step": "reconcile_metrics", "updated": drifted or 0, "batches": 1,
+                   "elapsed_ms": round((time.perf_counter() - started) * 1000, 1)})
+    return report
+
+
+class PeriodicJob:
+    thread_name = "periodic-job"
+    run_at_start = True
+
+    def __init__(self, session_factory, interval_seconds: float, enabled: bool = False):
+        self.session_factory = session_factory
+        self.enabled = enabled
+        self.interval_seconds = interval_seconds
+        self._stop = threading.Event()
+        self._thread = None
+
+    def run_once(self):
+        raise NotImplementedError
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name=self.thread_name, daemon=True)
+        self._thread.start()
+
+    def shutdown(self):
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        if not self.run_at_start:
+            self._stop.wait(self.interval_seconds)
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+            except Exception:
+                logger.exception("%s run failed", self.thread_name)
+            self._stop.wait(self.interval_seconds)
+
+
+class LifecycleScheduler(PeriodicJob):
+    thread_name = "lifecycle-scheduler"
+
+    def __init__(self, session_factory, interval_seconds: float, batch_size: int, enabled: bool = False):
+        super().__init__(session_factory, interval_seconds, enabled)
+        self.batch_size = batch_size
+        self.last_report: List[Dict] = []
+
+    def run_once(self) -> List[Dict]:
+        self.last_report = run_lifecycle(self.session_factory, batch_size=self.batch_size)
+        for step in self.last_report:
+            logger.info("lifecycle %(step)s: %(updated)s rows in %(batches)s batches, %(elapsed_ms)s ms", step)
+        return self.last_report
+
+
+# Write paths keep business_metrics up to date incrementally; this catches drift from raw SQL or missed hooks
+# even when the lifecycle job is not scheduled. Workers wait one interval before the first run.
+class MetricsReconciler(PeriodicJob):
+    thread_name = "metrics-reconciler"
+    run_at_start = False
+
+    def run_once(self) -> Optional[int]:
+        drifted = run_reconcile(self.session_factory)
+        if drifted:
+            logger.warning("metrics reconcile rewrote %s drifted counters", drifted)
+        return drifted
+
+
+lifecycle_scheduler = LifecycleScheduler(SessionLocal, interval_seconds=LIFECYCLE_INTERVAL_SECONDS,
+                                         batch_size=LIFECYCLE_BATCH_SIZE, enabled=LIFECYCLE_SCHEDULER_ENABLED)
+metrics_reconciler = MetricsReconciler(SessionLocal, interval_seconds=METRICS_RECONCILE_INTERVAL_SECONDS,
+                                       enabled=METRICS_RECONCILE_INTERVAL_SECONDS > 0)
@@ -0,0 +1,88 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from backend.db.models import User
+
+
+def _token_key(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def snapshot_user(user: User) -> User:
+    return User(**{column.key: getattr(user, column.key) for column in User.__table__.columns})
+
+
+# invalidate_user only reaches this process. Other workers compare the shared principals version at most every
+# recheck_seconds on a cache hit and drop everything when it moved.
+class PrincipalCache:
+    def __init__(self, maxsize: int, ttl_seconds: int, recheck_seconds: float = 1):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self.recheck_seconds = recheck_seconds
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._version = None
+        self._checked_at = float("-inf")
+
+    @property
+    def enabled(self) -> bool:
+        return self.maxsize > 0 and self.ttl_seconds > 0
+
+    def get(self, token: str) -> Optional[Tuple[dict, User]]:
+        if not self.enabled:
+            return None
+        key = _token_key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, claims, user = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return claims, user
+
+    def put(self, token: str, claims: dict, user: User) -> User:
+        snapshot = snapshot_user(user)
+        if not self.enabled:
+            return snapshot
+        expires_at = time.time() + self.ttl_seconds
+        token_exp = claims.get("exp")
+        if token_exp is not None:
+            expires_at = min(expires_at, float(token_exp))
+        key = _token_key(token)
+        with self._lock:
+            self._entries[key] = (expires_at, claims, snapshot)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return snapshot
+
+    def version_due(self) -> bool:
+        return time.monotonic() - self._checked_at >= self.recheck_seconds
+
+    def sync_version(self, version: Optional[int]):
+        with self._lock:
+            if version != self._version:
+                self._entries.clear()
+                self._version = version
+            self._checked_at = time.monotonic()
+
+    def invalidate_user(self, user_id: int):
+        with self._lock:
+            stale = [key for key, (_, _, user) in self._entries.items() if user.id_user == user_id]
+            for key in stale:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._version = None
+            self._checked_at = float("-inf")
+
+    def __len__(self):
+        return len(self._entries)
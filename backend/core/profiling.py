@@ -0,0 +1,231 @@
+import json
+import os
+import random
+import sys
+import threading
+import time
+import tracemalloc
+import uuid
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+from fastapi import HTTPException, Request
+
+from backend.core.config import (PROFILING_DIR, PROFILING_INTERVAL_MS, PROFILING_MAX_REPORTS,
+                                 PROFILING_SAMPLE_RATE)
+
+# Leaf frames of threads parked on a lock, queue or selector. aiosqlite's worker blocks on a C queue, so its
+# SQL time is indistinguishable from idling and is not sampled.
+IDLE_FRAMES = {("threading.py", "wait"), ("queue.py", "get"), ("selectors.py", "select"),
+               ("thread.py", "_worker"), ("threading.py", "_wait_for_tstate_lock"),
+               ("core.py", "_connection_worker_thread")}
+CATEGORIES = (
+    ("sql", ("sqlalchemy/engine", "sqlalchemy/dialects", "sqlalchemy/pool", "sqlite3", "pymysql", "aiomysql",
+             "aiosqlite")),
+    ("orm", ("sqlalchemy/orm", "sqlalchemy/sql")),
+    ("pydantic", ("pydantic",)),
+    ("hashing", ("argon2", "passlib")),
+    ("serialization", ("json", "orjson", "fastapi/encoders")),
+    ("app", ("backend",)),
+    ("framework", ("fastapi", "starlette", "anyio")),
+)
+# Sync routes and dependencies run on anyio's threadpool; other worker threads (the lifecycle scheduler, the
+# last-login writer) never serve a request and are left out of its samples.
+WORKER_THREAD_NAME = "AnyIO worker thread"
+SAMPLE_SCOPE = ("event loop and threadpool threads of this worker; requests served concurrently by the same "
+                "worker share those threads and are included")
+
+
+def frame_category(filename: str) -> str:
+    path = filename.replace(os.sep, "/")
+    for category, markers in CATEGORIES:
+        if any(f"/{marker}" in path for marker in markers):
+            return category
+    return "other"
+
+
+def frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class StackSampler:
+    def __init__(self, interval_seconds: float):
+        self.interval_seconds = interval_seconds
+        self.stacks = Counter()
+        self.categories = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = None
+        self._loop_thread = None
+
+    def start(self):
+        self._loop_thread = threading.get_ident()
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def request_threads(self) -> set:
+        workers = {thread.ident for thread in threading.enumerate() if thread.name == WORKER_THREAD_NAME}
+        return workers | {self._loop_thread}
+
+    def _run(self):
+        while not self._stop.wait(self.interval_seconds):
+            threads = self.request_threads()
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id in threads:
+                    self.sample(frame)
+
+    def sample(self, frame):
+        code = frame.f_code
+        if (os.path.basename(code.co_filename), code.co_name) in IDLE_FRAMES:
+            return
+        category = frame_category(code.co_filename)
+        stack = []
+        while frame is not None:
+            stack.append(frame_label(frame))
+            if category in ("other", "framework"):
+                candidate = frame_category(frame.f_code.co_filename)
+                if candidate not in ("other", "framework"):
+                    category = candidate
+            frame = frame.f_back
+        self.stacks[";".join(reversed(stack))] += 1
+        self.categories[category] += 1
+        self.samples += 1
+
+
+def allocation_diff(before, after, limit: int) -> List[Dict]:
+    own = (tracemalloc.Filter(False, __file__), tracemalloc.Filter(False, tracemalloc.__file__))
+    stats = after.filter_traces(own).compare_to(before.filter_traces(own), "lineno")
+    return [
+        {"location": str(stat.traceback), "size_diff_kb": round(stat.size_diff / 1024, 1),
+         "count_diff": stat.count_diff}
+        for stat in stats[:limit]
+    ]
+
+
+def top_functions(stacks: Counter, limit: int) -> List[Dict]:
+    self_samples = Counter()
+    for stack, count in stacks.items():
+        self_samples[stack.rsplit(";", 1)[-1]] += count
+    return [{"function": function, "samples": count} for function, count in self_samples.most_common(limit)]
+
+
+class RequestProfiler:
+    def __init__(self, directory: str, sample_rate: float, interval_ms: float, max_reports: int,
+                 header: str = "X-Profile"):
+        self.directory = directory
+        self.sample_rate = sample_rate
+        self.interval_seconds = interval_ms / 1000
+        self.max_reports = max_reports
+        self.header = header
+        self._busy = threading.Lock()
+
+    def wants(self, request: Request) -> bool:
+        if self.sample_rate > 0 and random.random() < self.sample_rate:
+            return True
+        if request.headers.get(self.header) is None:
+            return False
+        from backend.core.auth import decode_access_token
+
+        scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+        if scheme.lower() != "bearer" or not token:
+            return False
+        try:
+            return decode_access_token(token).get("role") == "ADMIN"
+        except HTTPException:
+            return False
+
+    async def profile(self, request: Request, call_next):
+        if not self._busy.acquire(blocking=False):
+            return await call_next(request)
+        try:
+            started_tracing = not tracemalloc.is_tracing()
+            if started_tracing:
+                tracemalloc.start()
+            before = tracemalloc.take_snapshot()
+            sampler = StackSampler(self.interval_seconds)
+            started_at = datetime.now(timezone.utc)
+            started = time.perf_counter()
+            sampler.start()
+            try:
+                response = await call_next(request)
+            finally:
+                sampler.stop()
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                after = tracemalloc.take_snapshot()
+                if started_tracing:
+                    tracemalloc.stop()
+            profile_id = uuid.uuid4().hex
+            self.save(profile_id, {
+                "id": profile_id,
+                "method": request.method,
+                "path": request.url.path,
+                "status_code": response.status_code,
+                "started_at": started_at.isoformat(),
+                "duration_ms": round(elapsed_ms, 1),
+                "samples": sampler.samples,
+                "interval_ms": self.interval_seconds * 1000,
+                "scope": SAMPLE_SCOPE,
+                "categories": dict(sampler.categories.most_common()),
+                "top_functions": top_functions(sampler.stacks, 30),
+                "allocations": allocation_diff(before, after, 30),
+            }, sampler.stacks)
+            response.headers["X-Profile-Id"] = profile_id
+            return response
+        finally:
+            self._busy.release()
+
+    def path(self, profile_id: str, extension: str) -> str:
+        return os.path.join(self.directory, f"{profile_id}.{extension}")
+
+    def save(self, profile_id: str, report: Dict, stacks: Counter):
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self.path(profile_id, "json"), "w", encoding="utf-8") as handle:
+            json.dump(report, handle)
+        with open(self.path(profile_id, "folded"), "w", encoding="utf-8") as handle:
+            handle.writelines(f"{stack} {count}\n" for stack, count in stacks.most_common())
+        self.prune()
+
+    def prune(self):
+        reports = sorted(self.report_paths(), key=os.path.getmtime, reverse=True)
+        for path in reports[self.max_reports:]:
+            for extension in ("json", "folded"):
+                try:
+                    os.remove(f"{path[:-len('.json')]}.{extension}")
+                except FileNotFoundError:
+                    pass
+
+    def report_paths(self) -> List[str]:
+        if not os.path.isdir(self.directory):
+            return []
+        return [os.path.join(self.directory, name) for name in os.listdir(self.directory) if name.endswith(".json")]
+
+    def list_reports(self) -> List[Dict]:
+        reports = []
+        for path in self.report_paths():
+            try:
+                with open(path, encoding="utf-8") as handle:
+                    report = json.load(handle)
+            except (OSError, ValueError):
+                continue
+            reports.append({key: report[key] for key in
+                            ("id", "method", "path", "status_code", "started_at", "duration_ms", "samples")})
+        return sorted(reports, key=lambda report: report["started_at"], reverse=True)
+
+    def read(self, profile_id: str, extension: str) -> Optional[str]:
+        if not profile_id.isalnum():
+            return None
+        try:
+            with open(self.path(profile_id, extension), encoding="utf-8") as handle:
+                return handle.read()
+        except FileNotFoundError:
+            return None
+
+
+request_profiler = RequestProfiler(PROFILING_DIR, sample_rate=PROFILING_SAMPLE_RATE,
+                                   interval_ms=PROFILING_INTERVAL_MS, max_reports=PROFILING_MAX_REPORTS)
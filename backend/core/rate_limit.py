@@ -0,0 +1,132 @@
+import hashlib
+import logging
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from fastapi import HTTPException, Request, status
+from starlette.concurrency import run_in_threadpool
+
+logger = logging.getLogger(__name__)
+
+
+def sliding_count(previous: int, current: int, elapsed: float, window_seconds: float) -> float:
+    return previous * (1 - elapsed / window_seconds) + current
+
+
+class MemoryRateLimitStore:
+    blocking = False
+
+    def __init__(self, max_keys: int):
+        self.max_keys = max_keys
+        self._windows = OrderedDict()
+        self._lock = threading.Lock()
+
+    def acquire(self, key: str, limit: int, window_seconds: float, now: float) -> bool:
+        window = int(now // window_seconds)
+        with self._lock:
+            index, current, previous = self._windows.pop(key, (window, 0, 0))
+            if index != window:
+                previous = current if index == window - 1 else 0
+                current = 0
+            allowed = sliding_count(previous, current, now % window_seconds, window_seconds) < limit
+            if allowed:
+                current += 1
+            self._windows[key] = (window, current, previous)
+            while len(self._windows) > self.max_keys:
+                self._windows.popitem(last=False)
+        return allowed
+
+    def clear(self):
+        with self._lock:
+            self._windows.clear()
+
+    def __len__(self):
+        return len(self._windows)
+
+
+# Check and increment run as one script, so concurrent workers cannot all pass the check before any of them
+# counts its attempt.
+ACQUIRE_SCRIPT = """
+local previous = tonumber(redis.call('GET', KEYS[1]) or '0')
+local current = tonumber(redis.call('GET', KEYS[2]) or '0')
+if previous * tonumber(ARGV[1]) + current >= tonumber(ARGV[2]) then
+    return 0
+end
+redis.call('INCR', KEYS[2])
+redis.call('EXPIRE', KEYS[2], ARGV[3])
+return 1
+"""
+
+
+class RedisRateLimitStore:
+    blocking = True
+
+    def __init__(self, url: str):
+        import redis
+
+        self._client = redis.Redis.from_url(url)
+        self._acquire = self._client.register_script(ACQUIRE_SCRIPT)
+
+    def acquire(self, key: str, limit: int, window_seconds: float, now: float) -> bool:
+        window = int(now // window_seconds)
+        previous_weight = 1 - (now % window_seconds) / window_seconds
+        return bool(self._acquire(keys=[f"rate:{key}:{window - 1}", f"rate:{key}:{window}"],
+                                  args=[repr(previous_weight), limit, math.ceil(window_seconds * 2)]))
+
+    def clear(self):
+        pass
+
+
+def _email_key(email: str) -> str:
+    return hashlib.sha256(email.strip().lower().encode("utf-8")).hexdigest()
+
+
+class AdmissionControl:
+    def __init__(self, store, scope: str, window_seconds: float, per_ip: int, per_email: int, enabled: bool = True):
+        self.store = store
+        self.scope = scope
+        self.window_seconds = window_seconds
+        self.per_ip = per_ip
+        self.per_email = per_email
+        self.enabled = enabled
+
+    def admit(self, ip: Optional[str], email: Optional[str]) -> Tuple[bool, int]:
+        now = time.time()
+        checks = []
+        if self.per_ip > 0 and ip:
+            checks.append((f"{self.scope}:ip:{ip}", self.per_ip))
+        if self.per_email > 0 and email:
+            checks.append((f"{self.scope}:email:{_email_key(email)}", self.per_email))
+        for key, limit in checks:
+            try:
+                allowed = self.store.acquire(key, limit, self.window_seconds, now)
+            except Exception:
+                logger.exception("Rate limit store failed, admitting request")
+                return True, 0
+            if not allowed:
+                return False, max(1, math.ceil(self.window_seconds - now % self.window_seconds))
+        return True, 0
+
+    async def check(self, request: Request, email: Optional[str] = None):
+        if not self.enabled:
+            return
+        ip = request.client.host if request.client else None
+        if self.store.blocking:
+            allowed, retry_after = await run_in_threadpool(self.admit, ip, email)
+        else:
+            allowed, retry_after = self.admit(ip, email)
+        if not allowed:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many attempts, please retry later.",
+                headers={"Retry-After": str(retry_after)},
+            )
+
+
+def build_rate_limit_store(redis_url: str, max_keys: int):
+    if redis_url:
+        return RedisRateLimitStore(redis_url)
+    return MemoryRateLimitStore(max_keys=max_keys)
@@ -0,0 +1,40 @@
+from collections.abc import Mapping
+from decimal import Decimal
+from typing import Any, Optional
+
+import orjson
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from sqlalchemy.engine import Row
+
+
+def json_default(value):
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    if isinstance(value, Row):
+        return value._asdict()
+    if isinstance(value, Mapping):
+        return dict(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    return orjson.dumps(content, default=json_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+class FastJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+# Skips response_model validation and jsonable_encoder, so content must already match the
+# route's schema (pre-validated models, or rows/dicts with the schema's keys). Headers set on
+# the injected response, such as the ETag, are carried over.
+def fast_response(content: Any, response: Optional[Response] = None, status_code: int = 200) -> FastJSONResponse:
+    headers = dict(response.headers) if response is not None else None
+    return FastJSONResponse(content, status_code=status_code, headers=headers)
@@ -0,0 +1,177 @@
+import json
+import os
+import random
+import re
+import threading
+import time
+import uuid
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Tuple
+
+from prometheus_client import REGISTRY, CollectorRegistry, Counter, Gauge, Histogram, generate_latest, multiprocess
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from backend.core.config import METRICS_ENABLED, TRACING_ENABLED, TRACING_FILE, TRACING_SAMPLE_RATE
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+TRACEPARENT = re.compile(r"^[0-9a-f]{2}-([0-9a-f]{32})-([0-9a-f]{16})-[0-9a-f]{2}$")
+
+
+def render_metrics(path: Optional[str] = None) -> bytes:
+    # Under prefork every worker writes its samples to PROMETHEUS_MULTIPROC_DIR and any of them can serve the
+    # aggregate, so a scrape no longer depends on which worker accepts it.
+    path = path or os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if not path:
+        return generate_latest(REGISTRY)
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry, path=path)
+    return generate_latest(registry)
+
+
+HTTP_REQUESTS = Counter(
+    "http_requests_total", "Requests served, by route template and status code.", ("method", "route", "status"))
+HTTP_LATENCY = Histogram(
+    "http_request_duration_seconds", "Time until the response headers are sent.", ("method", "route"),
+    buckets=LATENCY_BUCKETS)
+HTTP_IN_FLIGHT = Gauge("http_requests_in_flight", "Requests currently being handled.", multiprocess_mode="livesum")
+REQUEST_QUERIES = Histogram(
+    "http_request_db_queries", "SQL statements executed per request.", ("route",), buckets=QUERY_COUNT_BUCKETS)
+REQUEST_DB_TIME = Histogram(
+    "http_request_db_duration_seconds", "Time spent in SQL statements per request.", ("route",),
+    buckets=LATENCY_BUCKETS)
+DB_QUERIES = Counter("db_queries_total", "SQL statements executed, in or out of requests.")
+PASSWORD_HASHING = Histogram(
+    "password_hashing_duration_seconds", "argon2 hash/verify time including queueing.", ("operation",),
+    buckets=LATENCY_BUCKETS)
+HASHING_PENDING = Gauge("password_hashing_pending", "argon2 jobs queued or running.", multiprocess_mode="livesum")
+THREADPOOL_BUSY = Gauge(
+    "threadpool_busy_threads", "Threadpool slots in use by sync routes and run_in_threadpool.",
+    multiprocess_mode="livesum")
+THREADPOOL_SIZE = Gauge("threadpool_max_threads", "Threadpool capacity.", multiprocess_mode="livesum")
+
+
+def threadpool_usage() -> Tuple[int, int]:
+    from anyio.to_thread import current_default_thread_limiter
+
+    limiter = current_default_thread_limiter()
+    return limiter.borrowed_tokens, int(limiter.total_tokens)
+
+
+# Multiprocess gauges cannot call back into the worker at scrape time, so the threadpool is sampled per request.
+def record_threadpool_usage():
+    busy, size = threadpool_usage()
+    THREADPOOL_BUSY.set(busy)
+    THREADPOOL_SIZE.set(size)
+
+
+class RequestTrace:
+    def __init__(self, trace_id: str, parent_span_id: Optional[str], sampled: bool):
+        self.trace_id = trace_id
+        self.span_id = uuid.uuid4().hex[:16]
+        self.parent_span_id = parent_span_id
+        self.spans: Optional[List[Dict]] = [] if sampled else None
+        self.queries = 0
+        self.db_seconds = 0.0
+
+    def span(self, name: str, started: float, duration: float, **attributes):
+        if self.spans is None:
+            return
+        self.spans.append({"trace_id": self.trace_id, "span_id": uuid.uuid4().hex[:16],
+                           "parent_span_id": self.span_id, "name": name, "start_time": started,
+                           "duration_ms": round(duration * 1000, 3), "attributes": attributes})
+
+
+current_trace: ContextVar[Optional[RequestTrace]] = ContextVar("current_trace", default=None)
+
+
+def before_query(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started", []).append((time.time(), time.perf_counter()))
+
+
+def after_query(conn, cursor, statement, parameters, context, executemany):
+    started_at, started = conn.info["query_started"].pop()
+    elapsed = time.perf_counter() - started
+    DB_QUERIES.inc()
+    trace = current_trace.get()
+    if trace is not None:
+        trace.queries += 1
+        trace.db_seconds += elapsed
+        trace.span("db.query", started_at, elapsed, statement=" ".join(statement.split())[:500],
+                   executemany=executemany)
+
+
+def install_query_tracking(engine_class=Engine):
+    if not event.contains(engine_class, "before_cursor_execute", before_query):
+        event.listen(engine_class, "before_cursor_execute", before_query)
+        event.listen(engine_class, "after_cursor_execute", after_query)
+
+
+def observe_hashing(operation: str, started_at: float, elapsed: float):
+    PASSWORD_HASHING.labels(operation=operation).observe(elapsed)
+    trace = current_trace.get()
+    if trace is not None:
+        trace.span(f"password.{operation}", started_at, elapsed)
+
+
+def route_label(scope) -> str:
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+class Telemetry:
+    def __init__(self, tracing: bool, trace_file: str, trace_sample_rate: float):
+        self.tracing = tracing
+        self.trace_file = trace_file
+        self.trace_sample_rate = trace_sample_rate
+        self._write_lock = threading.Lock()
+
+    def start_trace(self, request) -> RequestTrace:
+        match = TRACEPARENT.match(request.headers.get("traceparent", ""))
+        trace_id, parent_span_id = match.groups() if match else (uuid.uuid4().hex, None)
+        sampled = self.tracing and (match is not None or random.random() < self.trace_sample_rate)
+        return RequestTrace(trace_id, parent_span_id, sampled)
+
+    async def observe_request(self, request, call_next):
+        trace = self.start_trace(request)
+        token = current_trace.set(trace)
+        HTTP_IN_FLIGHT.inc()
+        record_threadpool_usage()
+        started_at, started = time.time(), time.perf_counter()
+        status_code = 500
+        try:
+            response = await call_next(request)
+            status_code = response.status_code
+            if trace.spans is not None:
+                response.headers["traceparent"] = f"00-{trace.trace_id}-{trace.span_id}-01"
+            return response
+        finally:
+            elapsed = time.perf_counter() - started
+            HTTP_IN_FLIGHT.dec()
+            record_threadpool_usage()
+            current_trace.reset(token)
+            route = route_label(request.scope)
+            HTTP_REQUESTS.labels(method=request.method, route=route, status=status_code).inc()
+            HTTP_LATENCY.labels(method=request.method, route=route).observe(elapsed)
+            REQUEST_QUERIES.labels(route=route).observe(trace.queries)
+            REQUEST_DB_TIME.labels(route=route).observe(trace.db_seconds)
+            if trace.spans is not None:
+                self.export(trace, {
+                    "trace_id": trace.trace_id, "span_id": trace.span_id, "parent_span_id": trace.parent_span_id,
+                    "name": f"{request.method} {route}", "start_time": started_at,
+                    "duration_ms": round(elapsed * 1000, 3),
+                    "attributes": {"http.method": request.method, "http.route": route, "http.target": request.url.path,
+                                   "http.status_code": status_code, "db.queries": trace.queries,
+                                   "db.duration_ms": round(trace.db_seconds * 1000, 3)},
+                })
+
+    def export(self, trace: RequestTrace, root: Dict):
+        lines = "".join(json.dumps(span, default=str) + "\n" for span in [root, *trace.spans])
+        with self._write_lock:
+            with open(self.trace_file, "a", encoding="utf-8") as handle:
+                handle.write(lines)
+
+
+telemetry = Telemetry(tracing=TRACING_ENABLED, trace_file=TRACING_FILE, trace_sample_rate=TRACING_SAMPLE_RATE)
+TELEMETRY_ENABLED = METRICS_ENABLED or TRACING_ENABLED
@@ -1,9 +1,18 @@
+from sqlalchemy.dialects.mysql import BIGINT
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import declarative_base
 
 Base = declarative_base()
 
+@compiles(BIGINT, "sqlite")
+def compile_bigint_sqlite(type_, compiler, **kw):
+    return "INTEGER"
+
 from backend.db.models.user import User
 from backend.db.models.product import Product
 from backend.db.models.campaign import Campaign
 from backend.db.models.component import Component
 from backend.db.models.subscription import Subscription
+from backend.db.models.refresh_token import RefreshToken
+from backend.db.models.resource_version import ResourceVersion
+from backend.db.models.business_metric import BusinessMetric
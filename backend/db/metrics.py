@@ -0,0 +1,237 @@
+from collections import Counter
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Dict, Iterable, Tuple
+
+from sqlalchemy import delete, event, func, inspect, select
+from sqlalchemy.orm import Session
+from backend.db.models import (BusinessMetric, Campaign, CampaignStatus, Product,
+                               Subscription, SubscriptionStatus)
+
+MetricKey = Tuple[str, str]
+
+METRIC_FAMILIES = {
+    "campaigns": ("campaigns",),
+    "subscriptions": ("active_subscriptions", "mrr"),
+}
+# Statements that already applied their own deltas skip the generic tracking.
+MAINTAINS_METRICS = "maintains_metrics"
+
+
+def now():
+    return datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0)
+
+
+def campaign_contribution(status) -> Counter:
+    return Counter({("campaigns", CampaignStatus(status).value): 1})
+
+
+def subscription_contribution(status, id_product, price) -> Counter:
+    if SubscriptionStatus(status) != SubscriptionStatus.Active:
+        return Counter()
+    return Counter({("active_subscriptions", str(id_product)): 1, ("mrr", str(id_product)): Decimal(price)})
+
+
+def campaign_totals(connection, *criteria, status=None, lock=False) -> Counter:
+    totals = Counter()
+    query = select(Campaign.status, func.count()).where(*criteria).group_by(Campaign.status)
+    rows = connection.execute(query.with_for_update(of=Campaign) if lock else query)
+    for row_status, count in rows:
+        totals[("campaigns", CampaignStatus(status or row_status).value)] += count
+    return totals
+
+
+def subscription_totals(connection, *criteria, status=None, lock=False) -> Counter:
+    totals = Counter()
+    if status is not None and SubscriptionStatus(status) != SubscriptionStatus.Active:
+        return totals
+    if status is None:
+        criteria = (Subscription.status == SubscriptionStatus.Active, *criteria)
+    query = (
+        select(Subscription.id_product, func.count(), func.sum(Product.monthly_price))
+        .join(Product, Subscription.id_product == Product.id_product)
+        .where(*criteria)
+        .group_by(Subscription.id_product)
+    )
+    rows = connection.execute(query.with_for_update(of=Subscription) if lock else query)
+    for id_product, count, mrr in rows:
+        totals[("active_subscriptions", str(id_product))] += count
+        totals[("mrr", str(id_product))] += Decimal(mrr or 0)
+    return totals
+
+
+def apply_deltas(connection, deltas: Dict[MetricKey, Decimal]):
+    rows = [{"metric": metric, "dimension": dimension, "value": delta, "updated_at": now()}
+            for (metric, dimension), delta in sorted(deltas.items()) if delta]
+    if not rows:
+        return
+    if connection.dialect.name == "mysql":
+        from sqlalchemy.dialects.mysql import insert as dialect_insert
+        stmt = dialect_insert(BusinessMetric).values(rows)
+        stmt = stmt.on_duplicate_key_update(value=BusinessMetric.value + stmt.inserted.value,
+                                            updated_at=stmt.inserted.updated_at)
+    else:
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        stmt = dialect_insert(BusinessMetric).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[BusinessMetric.metric, BusinessMetric.dimension],
+            set_={"value": BusinessMetric.value + stmt.excluded.value, "updated_at": stmt.excluded.updated_at},
+        )
+    connection.execute(stmt)
+
+
+# Locking reads: the target rows cannot change before the caller's UPDATE, and on MySQL they see the latest
+# committed data rather than the REPEATABLE READ snapshot, so the deltas match the rows the UPDATE touches.
+def status_change_deltas(connection, model, criteria, new_status) -> Counter:
+    totals = campaign_totals if model is Campaign else subscription_totals
+    deltas = totals(connection, *criteria, status=new_status, lock=True)
+    deltas.subtract(totals(connection, *criteria, lock=True))
+    return deltas
+
+
+def stored_metrics(connection, metrics: Iterable[str]) -> Dict[MetricKey, Decimal]:
+    rows = connection.execute(
+        select(BusinessMetric.metric, BusinessMetric.dimension, BusinessMetric.value)
+        .where(BusinessMetric.metric.in_(list(metrics)))
+    )
+    return {(metric, dimension): value for metric, dimension, value in rows if value}
+
+
+def recompute_family(connection, family: str) -> int:
+    metrics = METRIC_FAMILIES[family]
+    totals = campaign_totals(connection) if family == "campaigns" else subscription_totals(connection)
+    current = {key: value for key, value in totals.items() if value}
+    stored = stored_metrics(connection, metrics)
+    drifted = sum(1 for key in set(current) | set(stored) if current.get(key, 0) != stored.get(key, 0))
+    if drifted:
+        connection.execute(delete(BusinessMetric).where(BusinessMetric.metric.in_(metrics)))
+        if current:
+            connection.execute(BusinessMetric.__table__.insert(), [
+                {"metric": metric, "dimension": dimension, "value": value, "updated_at": now()}
+                for (metric, dimension), value in sorted(current.items())
+            ])
+    return drifted
+
+
+def reconcile_metrics(session: Session) -> int:
+    drifted = sum(recompute_family(session.connection(), family) for family in METRIC_FAMILIES)
+    session.commit()
+    return drifted
+
+
+def previous(obj, attr):
+    history = inspect(obj).attrs[attr].history
+    return history.deleted[0] if history.deleted else getattr(obj, attr)
+
+
+def flushed_deltas(session: Session) -> Counter:
+    deltas = Counter()
+    subscriptions = []
+    price_changes = []
+    for obj in session.new:
+        if isinstance(obj, Campaign):
+            deltas.update(campaign_contribution(obj.status))
+        elif isinstance(obj, Subscription):
+            subscriptions.append((None, (obj.status, obj.id_product)))
+    for obj in session.deleted:
+        if isinstance(obj, Campaign):
+            deltas.subtract(campaign_contribution(previous(obj, "status")))
+        elif isinstance(obj, Subscription):
+            subscriptions.append(((previous(obj, "status"), previous(obj, "id_product")), None))
+    for obj in session.dirty:
+        if not session.is_modified(obj, include_collections=False):
+            continue
+        if isinstance(obj, Campaign):
+            deltas.update(campaign_contribution(obj.status))
+            deltas.subtract(campaign_contribution(previous(obj, "status")))
+        elif isinstance(obj, Subscription):
+            old = (previous(obj, "status"), previous(obj, "id_product"))
+            subscriptions.append((old, (obj.status, obj.id_product)))
+        elif isinstance(obj, Product):
+            old_price = previous(obj, "monthly_price")
+            if old_price is not None and Decimal(old_price) != Decimal(obj.monthly_price):
+                price_changes.append((obj.id_product, Decimal(obj.monthly_price) - Decimal(old_price)))
+
+    if subscriptions:
+        product_ids = {state[1] for pair in subscriptions for state in pair if state}
+        prices = dict(session.connection().execute(
+            select(Product.id_product, Product.monthly_price).where(Product.id_product.in_(product_ids))
+        ).all())
+        for old, new in subscriptions:
+            if new:
+                deltas.update(subscription_contribution(new[0], new[1], prices.get(new[1], 0)))
+            if old:
+                deltas.subtract(subscription_contribution(old[0], old[1], prices.get(old[1], 0)))
+    if price_changes:
+        active = stored_metrics(session.connection(), ["active_subscriptions"])
+        for id_product, change in price_changes:
+            deltas[("mrr", str(id_product))] += change * active.get(("active_subscriptions", str(id_product)), 0)
+    return deltas
+
+
+def enforces_foreign_keys(connection) -> bool:
+    if connection.dialect.name != "sqlite":
+        return True
+    return bool(connection.exec_driver_sql("PRAGMA foreign_keys").scalar())
+
+
+def track_flushed_metrics(session, flush_context):
+    apply_deltas(session.connection(), flushed_deltas(session))
+
+
+# Only these product columns feed MRR and active subscriptions; renames and description edits leave them alone.
+PRICED_PRODUCT_COLUMNS = {"monthly_price", "is_active"}
+
+
+def updated_columns(orm_execute_state) -> set:
+    parameters = orm_execute_state.parameters
+    columns = set()
+    for row in parameters if isinstance(parameters, list) else [parameters or {}]:
+        columns.update(getattr(key, "key", key) for key in row)
+    set_clause = orm_execute_state.statement.compile(column_keys=[]).params
+    return columns | {key for key in set_clause if key in orm_execute_state.statement.table.c}
+
+
+def track_bulk_metrics(orm_execute_state):
+    if not (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    if orm_execute_state.execution_options.get(MAINTAINS_METRICS):
+        return
+    statement = orm_execute_state.statement
+    table = statement.table.name
+    if table not in ("campaigns", "subscriptions", "products"):
+        return
+    if table == "products" and not (orm_execute_state.is_update
+                                     and updated_columns(orm_execute_state) & PRICED_PRODUCT_COLUMNS):
+        return
+    session = orm_execute_state.session
+    if orm_execute_state.is_delete and statement.whereclause is not None:
+        connection = session.connection()
+        if table == "campaigns":
+            deltas = campaign_totals(connection, statement.whereclause)
+        else:
+            deltas = subscription_totals(connection, statement.whereclause)
+            if enforces_foreign_keys(connection):
+                cascaded = select(Subscription.id_subscription).where(statement.whereclause)
+                deltas.update(campaign_totals(connection, Campaign.id_subscription.in_(cascaded)))
+        apply_deltas(connection, {key: -value for key, value in deltas.items()})
+        return
+    stale = session.info.setdefault("stale_metric_families", set())
+    stale.add("campaigns" if table == "campaigns" else "subscriptions")
+
+
+def recompute_stale_metrics(session):
+    for family in sorted(session.info.pop("stale_metric_families", ())):
+        recompute_family(session.connection(), family)
+
+
+def forget_stale_metrics(session):
+    session.info.pop("stale_metric_families", None)
+
+
+def install_metric_tracking(session_class=Session):
+    if not event.contains(session_class, "after_flush", track_flushed_metrics):
+        event.listen(session_class, "after_flush", track_flushed_metrics)
+        event.listen(session_class, "do_orm_execute", track_bulk_metrics)
+        event.listen(session_class, "before_commit", recompute_stale_metrics)
+        event.listen(session_class, "after_rollback", forget_stale_metrics)
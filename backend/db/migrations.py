@@ -0,0 +1,44 @@
+import os
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import inspect, text
+
+ALEMBIC_INI = os.path.join(os.path.dirname(os.path.dirname(__file__)), "alembic.ini")
+
+
+def alembic_config() -> Config:
+    config = Config(ALEMBIC_INI)
+    config.attributes["configure_logger"] = False
+    return config
+
+def head_revision() -> str:
+    return ScriptDirectory.from_config(alembic_config()).get_current_head()
+
+def current_revision(engine):
+    with engine.connect() as connection:
+        return MigrationContext.configure(connection).get_current_revision()
+
+def migrate(engine) -> str:
+    from backend.db.base import Base
+
+    config = alembic_config()
+    if not inspect(engine).get_table_names():
+        Base.metadata.create_all(bind=engine)
+        command.stamp(config, "head")
+    else:
+        command.upgrade(config, "head")
+    return current_revision(engine)
+
+def check_ready(engine):
+    try:
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+        current = current_revision(engine)
+    except Exception as exc:
+        return False, f"database unavailable: {exc.__class__.__name__}"
+    head = head_revision()
+    if current != head:
+        return False, f"database at revision {current}, expected {head}"
+    return True, head
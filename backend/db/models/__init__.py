@@ -5,3 +5,6 @@ from .product_component import ProductComponent
 from .component import Component
 from .subscription import Subscription, SubscriptionStatus
 from .campaign import Campaign, CampaignStatus
+from .refresh_token import RefreshToken
+from .resource_version import ResourceVersion, VERSIONED_TABLES, PRINCIPALS_VERSION
+from .business_metric import BusinessMetric
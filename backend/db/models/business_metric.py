@@ -0,0 +1,9 @@
+from sqlalchemy import Column, String, DECIMAL, TIMESTAMP
+from ..base import Base
+
+class BusinessMetric(Base):
+    __tablename__ = 'business_metrics'
+    metric = Column(String(32), primary_key=True, nullable=False)
+    dimension = Column(String(64), primary_key=True, nullable=False, default="")
+    value = Column(DECIMAL(19, 4), nullable=False, default=0)
+    updated_at = Column(TIMESTAMP, nullable=False)
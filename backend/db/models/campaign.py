@@ -1,6 +1,6 @@
 from sqlalchemy import (
     Column, String, Enum, Date, 
-    CheckConstraint,ForeignKey
+    CheckConstraint,ForeignKey, Index
 )
 from sqlalchemy.dialects.mysql import BIGINT
 from sqlalchemy.orm import relationship
@@ -25,4 +25,9 @@ class Campaign(Base):
     subscription = relationship("Subscription", back_populates="campaigns")
     __table_args__ = (
         CheckConstraint('start_date <= end_date', name='chk_campaign_dates'),
+        Index('ix_campaigns_subscription', 'id_subscription'),
+        Index('ix_campaigns_status_id', 'status', 'id_campaign'),
+        Index('ix_campaigns_name_id', 'name', 'id_campaign'),
+        Index('ix_campaigns_start_date_id', 'start_date', 'id_campaign'),
+        Index('ix_campaigns_end_date_id', 'end_date', 'id_campaign'),
     )
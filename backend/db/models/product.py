@@ -10,6 +10,8 @@ class Product(Base):
     description = Column(Text, nullable=True)
     monthly_price = Column(DECIMAL(19, 4), nullable=False)
     is_active = Column(Boolean, default=True)
+    cost = Column(DECIMAL(19, 4), nullable=False, default=0, server_default="0")
+    margin = Column(DECIMAL(19, 4), nullable=False, default=0, server_default="0")
 
     subscriptions = relationship("Subscription", back_populates="product")
     components_association = relationship("ProductComponent", back_populates="product") 
@@ -0,0 +1,13 @@
+from sqlalchemy import Column, String, TIMESTAMP, ForeignKey
+from sqlalchemy.dialects.mysql import BIGINT
+from sqlalchemy.sql import func
+from ..base import Base
+
+class RefreshToken(Base):
+    __tablename__ = 'refresh_tokens'
+    jti = Column(String(64), primary_key=True, nullable=False)
+    id_user = Column(BIGINT(unsigned=True), ForeignKey("users.id_user", name="fk_refresh_token_user", ondelete="CASCADE"), nullable=False, index=True)
+    family = Column(String(64), nullable=False, index=True)
+    expires_at = Column(TIMESTAMP, nullable=False)
+    revoked_at = Column(TIMESTAMP, nullable=True)
+    created_at = Column(TIMESTAMP, server_default=func.now())
@@ -0,0 +1,20 @@
+from datetime import datetime, timezone
+from sqlalchemy import Column, String, TIMESTAMP, event, insert
+from sqlalchemy.dialects.mysql import BIGINT
+from ..base import Base
+
+VERSIONED_TABLES = ("products", "components", "products_components", "campaigns", "subscriptions")
+# Bumped when an admin edits or deletes a user, so every worker drops its cached principals.
+PRINCIPALS_VERSION = "principals"
+
+class ResourceVersion(Base):
+    __tablename__ = 'resource_versions'
+    name = Column(String(64), primary_key=True, nullable=False)
+    version = Column(BIGINT(unsigned=True), nullable=False, default=1)
+    updated_at = Column(TIMESTAMP, nullable=False)
+
+
+@event.listens_for(ResourceVersion.__table__, "after_create")
+def seed_resource_versions(target, connection, **kw):
+    now = datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0)
+    connection.execute(insert(target), [{"name": name, "version": 1, "updated_at": now} for name in (*VERSIONED_TABLES, PRINCIPALS_VERSION)])
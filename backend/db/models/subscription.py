@@ -1,5 +1,5 @@
 from sqlalchemy import (
-    Column, Date, Enum, ForeignKey
+    Column, Date, Enum, ForeignKey, Index
 )
 from sqlalchemy.dialects.mysql import BIGINT
 from sqlalchemy.orm import relationship
@@ -23,4 +23,8 @@ class Subscription(Base):
     user = relationship("User", back_populates="subscriptions")
     product = relationship("Product", back_populates="subscriptions")
     campaigns = relationship("Campaign", back_populates="subscription")
+    __table_args__ = (
+        Index('ix_subscriptions_user_status_product', 'id_user', 'status', 'id_product'),
+        Index('ix_subscriptions_status_end_date', 'status', 'end_date'),
+    )
 
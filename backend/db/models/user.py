@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Enum, TIMESTAMP
+from sqlalchemy import Column, String, Enum, TIMESTAMP, Index
 from sqlalchemy.dialects.mysql import BIGINT
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -23,3 +23,6 @@ class User(Base):
     last_login_at = Column(TIMESTAMP, nullable=True)
     
     subscriptions = relationship("Subscription", back_populates="user")
+    __table_args__ = (
+        Index('ix_users_role', 'role'),
+    )
@@ -0,0 +1,98 @@
+import threading
+import time
+from sqlalchemy import text
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
+
+
+class PoolWaitStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.checkouts = 0
+            self.timeouts = 0
+            self.total_wait = 0.0
+            self.max_wait = 0.0
+
+    def record(self, waited: float, timed_out: bool = False):
+        with self._lock:
+            self.checkouts += 1
+            self.timeouts += int(timed_out)
+            self.total_wait += waited
+            self.max_wait = max(self.max_wait, waited)
+
+
+class InstrumentedPoolMixin:
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_stats = PoolWaitStats()
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.wait_stats = self.wait_stats
+        return pool
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except Exception:
+            self.wait_stats.record(time.perf_counter() - start, timed_out=True)
+            raise
+        self.wait_stats.record(time.perf_counter() - start)
+        return connection
+
+
+class InstrumentedQueuePool(InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def pool_status(engine) -> dict:
+    pool = engine.pool
+    stats = getattr(pool, "wait_stats", None)
+    if stats is None:
+        return {"pool_class": type(pool).__name__}
+    return {
+        "pool_class": type(pool).__name__,
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": max(pool.overflow(), 0),
+        "checkouts": stats.checkouts,
+        "timeouts": stats.timeouts,
+        "wait_total_ms": round(stats.total_wait * 1000, 3),
+        "wait_avg_ms": round(stats.total_wait * 1000 / stats.checkouts, 3) if stats.checkouts else 0.0,
+        "wait_max_ms": round(stats.max_wait * 1000, 3),
+    }
+
+
+def warm_up_pool(engine, connections: int) -> int:
+    opened = []
+    try:
+        for _ in range(connections):
+            connection = engine.connect()
+            connection.execute(text("SELECT 1"))
+            opened.append(connection)
+    finally:
+        for connection in opened:
+            connection.close()
+    return len(opened)
+
+
+async def warm_up_async_pool(engine, connections: int) -> int:
+    opened = []
+    try:
+        for _ in range(connections):
+            connection = await engine.connect()
+            await connection.execute(text("SELECT 1"))
+            opened.append(connection)
+    finally:
+        for connection in opened:
+            await connection.close()
+    return len(opened)
@@ -0,0 +1,109 @@
+from sqlalchemy import event, func, inspect, select, update
+from sqlalchemy.orm import Session
+from backend.db.models import Component, Product, ProductComponent
+from backend.db.versioning import mark_changed
+
+COST_TABLES = ("components", "products_components", "products")
+# Bulk statements that know which products they touch pass those ids under this execution option, so only those
+# products are recomputed instead of the whole catalog.
+COSTED_PRODUCTS = "costed_product_ids"
+
+
+def product_cost():
+    return (
+        select(func.coalesce(func.sum(Component.unit_cost * ProductComponent.quantity), 0))
+        .select_from(ProductComponent)
+        .join(Component, ProductComponent.id_component == Component.id_component)
+        .where(ProductComponent.id_product == Product.id_product)
+        .scalar_subquery()
+    )
+
+
+def refresh_product_costs(connection, product_ids=None):
+    if product_ids is not None and not product_ids:
+        return
+    statement = update(Product).values(cost=product_cost(), margin=Product.monthly_price - product_cost())
+    if product_ids is not None:
+        statement = statement.where(Product.id_product.in_(sorted(product_ids)))
+    connection.execute(statement)
+
+
+def linked_products(connection, component_ids):
+    if not component_ids:
+        return set()
+    return set(connection.execute(
+        select(ProductComponent.id_product).where(ProductComponent.id_component.in_(component_ids))
+    ).scalars())
+
+
+def changed(obj, attr) -> bool:
+    return inspect(obj).attrs[attr].history.has_changes()
+
+
+def collect_deleted_components(session, flush_context, instances):
+    deleted = [obj.id_component for obj in session.deleted if isinstance(obj, Component)]
+    if deleted:
+        session.info.setdefault("cost_products", set()).update(linked_products(session.connection(), deleted))
+
+
+def track_flushed_costs(session, flush_context):
+    products = session.info.pop("cost_products", set())
+    components = []
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        if isinstance(obj, ProductComponent):
+            products.add(obj.id_product)
+            products.update(inspect(obj).attrs.id_product.history.deleted)
+        elif isinstance(obj, Component) and obj not in session.deleted and changed(obj, "unit_cost"):
+            components.append(obj.id_component)
+        elif isinstance(obj, Product) and obj not in session.deleted and (
+                obj in session.new or changed(obj, "monthly_price")):
+            products.add(obj.id_product)
+    products.update(linked_products(session.connection(), components))
+    if products:
+        refresh_product_costs(session.connection(), products)
+        mark_changed(session, {"products"})
+        session.info.setdefault("costed_products", set()).update(products)
+
+
+def expire_costed_products(session, flush_context):
+    product_ids = session.info.pop("costed_products", ())
+    for obj in list(session.identity_map.values()):
+        if isinstance(obj, Product) and obj.id_product in product_ids:
+            session.expire(obj, ["cost", "margin"])
+
+
+def track_bulk_costs(orm_execute_state):
+    if not (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    if orm_execute_state.statement.table.name not in COST_TABLES:
+        return
+    product_ids = orm_execute_state.execution_options.get(COSTED_PRODUCTS)
+    if product_ids is None:
+        orm_execute_state.session.info["cost_refresh_all"] = True
+    else:
+        orm_execute_state.session.info.setdefault("cost_refresh_products", set()).update(product_ids)
+
+
+def refresh_stale_costs(session):
+    product_ids = session.info.pop("cost_refresh_products", set())
+    if session.info.pop("cost_refresh_all", False):
+        product_ids = None
+    elif not product_ids:
+        return
+    refresh_product_costs(session.connection(), product_ids)
+    mark_changed(session, {"products"})
+
+
+def forget_stale_costs(session):
+    for key in ("cost_refresh_all", "cost_refresh_products", "cost_products", "costed_products"):
+        session.info.pop(key, None)
+
+
+def install_cost_tracking(session_class=Session):
+    if not event.contains(session_class, "after_flush", track_flushed_costs):
+        event.listen(session_class, "before_flush", collect_deleted_components)
+        event.listen(session_class, "after_flush", track_flushed_costs)
+        event.listen(session_class, "after_flush_postexec", expire_costed_products)
+        event.listen(session_class, "do_orm_execute", track_bulk_costs)
+        event.listen(session_class, "before_commit", refresh_stale_costs)
+        event.listen(session_class, "after_rollback", forget_stale_costs)
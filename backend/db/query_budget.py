@@ -0,0 +1,62 @@
+import threading
+import time
+from typing import Iterable, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+def query_budget(max_queries: int):
+    def decorator(endpoint):
+        endpoint.query_budget = max_queries
+        return endpoint
+    return decorator
+
+
+def get_query_budget(endpoint) -> Optional[int]:
+    return getattr(endpoint, "query_budget", None)
+
+
+def sync_engines(engines: Iterable) -> List[Engine]:
+    return [getattr(db_engine, "sync_engine", db_engine) for db_engine in engines if db_engine is not None]
+
+
+class QueryCounter:
+    def __init__(self, *engines):
+        self.engines = sync_engines(engines)
+        self.statements: List[Tuple[str, object, float]] = []
+        self._started = threading.local()
+        self._lock = threading.Lock()
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    @property
+    def elapsed_ms(self) -> float:
+        return sum(elapsed for _, _, elapsed in self.statements)
+
+    def _before(self, conn, cursor, statement, parameters, context, executemany):
+        self._started.value = time.perf_counter()
+
+    def _after(self, conn, cursor, statement, parameters, context, executemany):
+        elapsed = (time.perf_counter() - getattr(self._started, "value", time.perf_counter())) * 1000
+        with self._lock:
+            self.statements.append((statement, parameters, elapsed))
+
+    def report(self) -> str:
+        lines = [f"{self.count} queries in {self.elapsed_ms:.1f} ms"]
+        lines += [f"  {elapsed:7.2f} ms  {' '.join(statement.split())}" for statement, _, elapsed in self.statements]
+        return "\n".join(lines)
+
+    def __enter__(self):
+        for db_engine in self.engines:
+            event.listen(db_engine, "before_cursor_execute", self._before)
+            event.listen(db_engine, "after_cursor_execute", self._after)
+        return self
+
+    def __exit__(self, *exc_info):
+        for db_engine in self.engines:
+            event.remove(db_engine, "before_cursor_execute", self._before)
+            event.remove(db_engine, "after_cursor_execute", self._after)
+        return False
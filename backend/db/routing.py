@@ -0,0 +1,43 @@
+import hashlib
+import hmac
+import math
+import time
+from fastapi import Request, Response
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+PIN_COOKIE = "read_primary_until"
+PIN_HEADER = "X-Read-Primary-Until"
+
+
+# The pin travels with the client as a signed expiry timestamp, so every worker and instance honours it and it
+# survives token refreshes.
+class PrimaryPins:
+    def __init__(self, window_seconds: float, secret: str):
+        self.window_seconds = window_seconds
+        self.secret = secret.encode("utf-8")
+
+    def signature(self, until_ms: str) -> str:
+        return hmac.new(self.secret, until_ms.encode("utf-8"), hashlib.sha256).hexdigest()[:32]
+
+    def token(self) -> str:
+        until_ms = str(int((time.time() + self.window_seconds) * 1000))
+        return f"{until_ms}.{self.signature(until_ms)}"
+
+    def pin(self, response: Response):
+        token = self.token()
+        response.headers[PIN_HEADER] = token
+        response.set_cookie(PIN_COOKIE, token, max_age=max(1, math.ceil(self.window_seconds)),
+                            httponly=True, samesite="lax")
+
+    def is_pinned(self, token: str) -> bool:
+        until_ms, _, signature = token.partition(".")
+        if not until_ms.isdigit() or not hmac.compare_digest(signature, self.signature(until_ms)):
+            return False
+        return int(until_ms) > time.time() * 1000
+
+
+def wants_primary(request: Request, pins: PrimaryPins) -> bool:
+    if request.headers.get("x-read-consistency", "").lower() == "primary":
+        return True
+    token = request.cookies.get(PIN_COOKIE) or request.headers.get(PIN_HEADER)
+    return bool(token) and pins.is_pinned(token)
@@ -1,17 +1,112 @@
+from fastapi import Request, Response
+from itertools import cycle
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from backend.db.pool import InstrumentedQueuePool, InstrumentedAsyncQueuePool
+from backend.db.routing import PrimaryPins, wants_primary
+from backend.db.versioning import install_version_tracking
+from backend.db.metrics import install_metric_tracking
+from backend.db.product_costs import install_cost_tracking
 from dotenv import load_dotenv
 import os
 
 load_dotenv(dotenv_path="backend/.env")
 DATABASE_URL = os.getenv("DATABASE_URL")
+DATABASE_REPLICA_URLS = [url.strip() for url in os.getenv("DATABASE_REPLICA_URLS", "").split(",") if url.strip()]
+READ_AFTER_WRITE_WINDOW_SECONDS = float(os.getenv("READ_AFTER_WRITE_WINDOW_SECONDS", "5"))
+ASYNC_DB_ENABLED = os.getenv("ASYNC_DB_ENABLED", "true").lower() in ("1", "true", "yes")
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "10"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes")
+DB_POOL_WARMUP = int(os.getenv("DB_POOL_WARMUP", str(DB_POOL_SIZE)))
 
-engine = create_engine(DATABASE_URL)
+ASYNC_DRIVERS = {
+    "mysql": "mysql+aiomysql",
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+def to_async_url(url: str) -> str:
+    parsed = make_url(url)
+    return parsed.set(drivername=ASYNC_DRIVERS.get(parsed.get_backend_name(), parsed.drivername)).render_as_string(hide_password=False)
+
+def pool_options(url: str, poolclass) -> dict:
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:"):
+        return {}
+    return {
+        "poolclass": poolclass,
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+    }
+
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL") or to_async_url(DATABASE_URL)
+
+engine = create_engine(DATABASE_URL, **pool_options(DATABASE_URL, InstrumentedQueuePool))
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+install_metric_tracking()
+install_cost_tracking()
+install_version_tracking()
+
+async_engine = (
+    create_async_engine(ASYNC_DATABASE_URL, **pool_options(ASYNC_DATABASE_URL, InstrumentedAsyncQueuePool))
+    if ASYNC_DB_ENABLED else None
+)
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
+replica_engines = [create_engine(url, **pool_options(url, InstrumentedQueuePool)) for url in DATABASE_REPLICA_URLS]
+replica_sessions = cycle([
+    sessionmaker(autocommit=False, autoflush=False, bind=replica) for replica in replica_engines
+]) if replica_engines else None
+
+async_replica_engines = [
+    create_async_engine(to_async_url(url), **pool_options(to_async_url(url), InstrumentedAsyncQueuePool))
+    for url in DATABASE_REPLICA_URLS
+] if ASYNC_DB_ENABLED else []
+async_replica_sessions = cycle([
+    async_sessionmaker(bind=replica, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+    for replica in async_replica_engines
+]) if async_replica_engines else None
+
+primary_pins = PrimaryPins(window_seconds=READ_AFTER_WRITE_WINDOW_SECONDS, secret=os.getenv("SECRET_KEY") or "")
 
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+def pin_reads_to_primary(response: Response):
+    primary_pins.pin(response)
+
+def read_session_factory(request: Request):
+    if replica_sessions is None or wants_primary(request, primary_pins):
+        return SessionLocal
+    return next(replica_sessions)
+
+def get_read_db(request: Request):
+    db = read_session_factory(request)()
+    try:
+        yield db
+    finally:
+        db.close()
+
+async def get_async_read_db(request: Request):
+    if async_replica_sessions is None or wants_primary(request, primary_pins):
+        session_factory = AsyncSessionLocal
+    else:
+        session_factory = next(async_replica_sessions)
+    async with session_factory() as db:
+        yield db
\ No newline at end of file
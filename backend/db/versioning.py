@@ -0,0 +1,61 @@
+from datetime import datetime, timezone
+from sqlalchemy import event, inspect, update
+from sqlalchemy.orm import Session
+from backend.db.models import ResourceVersion, VERSIONED_TABLES
+
+PENDING_BUMPS = "pending_version_bumps"
+
+
+def bump_versions(connection, tables):
+    if not tables:
+        return
+    connection.execute(
+        update(ResourceVersion)
+        .where(ResourceVersion.name.in_(sorted(tables)))
+        .values(version=ResourceVersion.version + 1,
+                updated_at=datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0))
+    )
+
+
+def changed_tables(session: Session):
+    changed = list(session.new) + list(session.deleted)
+    changed += [obj for obj in session.dirty if session.is_modified(obj, include_collections=False)]
+    return {inspect(obj).mapper.local_table.name for obj in changed} & set(VERSIONED_TABLES)
+
+
+def mark_changed(session: Session, tables):
+    session.info.setdefault(PENDING_BUMPS, set()).update(tables)
+
+
+def track_flushed_changes(session, flush_context):
+    mark_changed(session, changed_tables(session))
+
+
+def track_bulk_statements(orm_execute_state):
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        table = orm_execute_state.statement.table.name
+        if table in VERSIONED_TABLES:
+            mark_changed(orm_execute_state.session, {table})
+
+
+# Versions are bumped as the last statement of the writer's own transaction, so readers never see new rows under
+# the old version and a crash cannot commit the rows without the bump. The resource_versions row lock is only held
+# for the COMMIT itself, so writers do not serialize on it for the rest of their transaction. Installed after the
+# other before_commit hooks so the tables they mark are included.
+def bump_pending_versions(session):
+    session.flush()
+    tables = session.info.pop(PENDING_BUMPS, None)
+    if tables:
+        bump_versions(session.connection(), tables)
+
+
+def forget_pending_versions(session):
+    session.info.pop(PENDING_BUMPS, None)
+
+
+def install_version_tracking(session_class=Session):
+    if not event.contains(session_class, "after_flush", track_flushed_changes):
+        event.listen(session_class, "after_flush", track_flushed_changes)
+        event.listen(session_class, "do_orm_execute", track_bulk_statements)
+        event.listen(session_class, "before_commit", bump_pending_versions)
+        event.listen(session_class, "after_rollback", forget_pending_versions)
@@ -1,3 +1,14 @@
-from .user import create_user, get_user_by_email, get_user_by_id
-from .campaign import get_user_campaigns
-from .product import get_active_products
\ No newline at end of file
+from .user import create_user, get_user_by_email, get_user_by_id, get_user_by_id_async
+from .campaign import (get_user_campaigns, get_user_campaigns_async,
+                       admin_campaigns_query, user_campaigns_page_query, bulk_update_campaigns)
+from .product import get_catalog_rows, get_catalog_rows_async
+from .subscription import get_active_product_ids, get_active_product_ids_async
+from .refresh_token import (store_refresh_token, get_refresh_token,
+                            consume_refresh_token, revoke_refresh_family)
+from .resource_version import (get_resource_versions, get_resource_versions_async, get_principals_version,
+                               get_principals_version_async)
+from .pagination import ListSpec, PageParams, page_params, paginate, paginate_async
+from .export import (iter_export, EXPORT_FORMATS, campaigns_export_query,
+                     clients_export_query, subscriptions_export_query)
+from .bulk_import import bulk_import_components, bulk_import_products, bulk_import_packages
+from .metrics import get_metrics_summary
@@ -0,0 +1,226 @@
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type
+
+from fastapi import HTTPException, status
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import insert, select, tuple_, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from backend.core.config import BULK_IMPORT_CHUNK_SIZE, BULK_IMPORT_MAX_ROWS
+from backend.db.models import Component, Product, ProductComponent
+from backend.db.product_costs import COSTED_PRODUCTS, linked_products
+from backend.schemas import (ComponentCreate, ComponentUpdate, PackageCreate,
+                             ProductMgmtCreate, ProductMgmtUpdate)
+
+
+def validation_detail(exc: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in error['loc']) or 'row'}: {error['msg']}"
+        for error in exc.errors()
+    )
+
+
+def check_bulk_size(count: int):
+    if count > BULK_IMPORT_MAX_ROWS:
+        raise HTTPException(
+            status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+            detail=f"At most {BULK_IMPORT_MAX_ROWS} rows per request"
+        )
+
+
+def chunked(items: List, size: int):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+class BulkReport:
+    def __init__(self, total: int):
+        self.results: List[Optional[Dict[str, Any]]] = [None] * total
+
+    def created(self, index: int, row_id=None):
+        self.results[index] = {"index": index, "status": "created", "id": row_id}
+
+    def updated(self, index: int, row_id=None):
+        self.results[index] = {"index": index, "status": "updated", "id": row_id}
+
+    def error(self, index: int, detail: str):
+        self.results[index] = {"index": index, "status": "error", "detail": detail}
+
+    def as_dict(self) -> Dict[str, Any]:
+        counts = {"created": 0, "updated": 0, "error": 0}
+        for result in self.results:
+            counts[result["status"]] += 1
+        return {"created": counts["created"], "updated": counts["updated"],
+                "failed": counts["error"], "results": self.results}
+
+
+def run_chunk(db: Session, report: BulkReport, indexes: List[int], write) -> None:
+    try:
+        write()
+        db.commit()
+    except SQLAlchemyError as exc:
+        db.rollback()
+        detail = f"Database error: {exc.__class__.__name__}"
+        for index in indexes:
+            report.error(index, detail)
+
+
+# Each chunk is one multi-row INSERT, whose auto-increment ids are handed out in VALUES order, so sorting them
+# maps them back to the rows. MySQL has no RETURNING, but InnoDB gives such a "simple insert" consecutive ids
+# starting at lastrowid.
+def insert_returning_ids(db: Session, model, pk, rows: List[Dict[str, Any]], **options) -> List[int]:
+    statement = insert(model.__table__).values(rows).execution_options(**options)
+    if db.get_bind().dialect.insert_returning:
+        return sorted(db.scalars(statement.returning(pk)))
+    result = db.execute(statement)
+    return list(range(result.lastrowid, result.lastrowid + len(rows)))
+
+
+def bulk_upsert_entities(
+    db: Session,
+    model,
+    pk,
+    rows: List[Dict[str, Any]],
+    create_schema: Type[BaseModel],
+    update_schema: Type[BaseModel],
+    chunk_size: int = BULK_IMPORT_CHUNK_SIZE,
+    costed_products: Optional[Callable[[Session, List[Dict[str, Any]]], Iterable[int]]] = None,
+    create_defaults: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+) -> Dict[str, Any]:
+    check_bulk_size(len(rows))
+    report = BulkReport(len(rows))
+    valid: List[Tuple[int, Optional[int], Dict[str, Any]]] = []
+    for index, row in enumerate(rows):
+        row_id = row.get(pk.key)
+        try:
+            if row_id is None:
+                valid.append((index, None, create_schema.model_validate(row).model_dump()))
+            else:
+                data = update_schema.model_validate(row).model_dump(exclude_unset=True)
+                valid.append((index, int(row_id), data))
+        except (ValidationError, TypeError, ValueError) as exc:
+            report.error(index, validation_detail(exc) if isinstance(exc, ValidationError) else str(exc))
+
+    for chunk in chunked(valid, chunk_size):
+        updates = [(index, row_id, data) for index, row_id, data in chunk if row_id is not None]
+        creates = [(index, data) for index, row_id, data in chunk if row_id is None]
+        existing = set()
+        if updates:
+            existing = set(db.execute(select(pk).where(pk.in_([row_id for _, row_id, _ in updates]))).scalars())
+        for index, row_id, _ in updates:
+            if row_id not in existing:
+                report.error(index, f"{model.__name__} {row_id} not found")
+        updates = [update_row for update_row in updates if update_row[1] in existing]
+
+        def write():
+            changes = [{pk.key: row_id, **data} for _, row_id, data in updates if data]
+            options = {}
+            if costed_products is not None:
+                options[COSTED_PRODUCTS] = set(costed_products(db, changes)) if changes else set()
+            if changes:
+                db.execute(update(model).execution_options(**options), changes)
+            created_ids = []
+            if creates:
+                created = [create_defaults(data) if create_defaults else data for _, data in creates]
+                created_ids = insert_returning_ids(db, model, pk, created, **options)
+            for index, row_id, _ in updates:
+                report.updated(index, row_id)
+            for (index, _), row_id in zip(creates, created_ids):
+                report.created(index, row_id)
+
+        run_chunk(db, report, [index for index, _, _ in chunk if report.results[index] is None], write)
+    return report.as_dict()
+
+
+# New components have no package links and new products have no components yet, so only updates can move the
+# cost of existing products.
+def repriced_component_products(db: Session, changes: List[Dict[str, Any]]):
+    return linked_products(db.connection(), [change["id_component"] for change in changes if "unit_cost" in change])
+
+
+def repriced_products(db: Session, changes: List[Dict[str, Any]]):
+    return {change["id_product"] for change in changes if "monthly_price" in change}
+
+
+def uncosted_product(data: Dict[str, Any]) -> Dict[str, Any]:
+    return {**data, "cost": 0, "margin": data["monthly_price"]}
+
+
+def bulk_import_components(db: Session, rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return bulk_upsert_entities(db, Component, Component.id_component, rows, ComponentCreate, ComponentUpdate,
+                                costed_products=repriced_component_products)
+
+
+def bulk_import_products(db: Session, rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return bulk_upsert_entities(db, Product, Product.id_product, rows, ProductMgmtCreate, ProductMgmtUpdate,
+                                costed_products=repriced_products, create_defaults=uncosted_product)
+
+
+def upsert_package_links(db: Session, rows: List[Dict[str, Any]]):
+    dialect = db.get_bind().dialect.name
+    if dialect == "mysql":
+        from sqlalchemy.dialects.mysql import insert as dialect_insert
+        stmt = dialect_insert(ProductComponent).values(rows)
+        stmt = stmt.on_duplicate_key_update(quantity=stmt.inserted.quantity)
+    else:
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        stmt = dialect_insert(ProductComponent).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ProductComponent.id_product, ProductComponent.id_component],
+            set_={"quantity": stmt.excluded.quantity},
+        )
+    db.execute(stmt.execution_options(**{COSTED_PRODUCTS: {row["id_product"] for row in rows}}))
+
+
+def bulk_import_packages(db: Session, rows: List[Dict[str, Any]],
+                         chunk_size: int = BULK_IMPORT_CHUNK_SIZE) -> Dict[str, Any]:
+    check_bulk_size(len(rows))
+    report = BulkReport(len(rows))
+    valid: List[Tuple[int, Dict[str, Any]]] = []
+    seen = {}
+    for index, row in enumerate(rows):
+        try:
+            data = PackageCreate.model_validate(row).model_dump()
+        except ValidationError as exc:
+            report.error(index, validation_detail(exc))
+            continue
+        key = (data["id_product"], data["id_component"])
+        if key in seen:
+            report.error(index, f"Duplicate of row {seen[key]}")
+            continue
+        seen[key] = index
+        valid.append((index, data))
+
+    for chunk in chunked(valid, chunk_size):
+        product_ids = {data["id_product"] for _, data in chunk}
+        component_ids = {data["id_component"] for _, data in chunk}
+        products = set(db.execute(select(Product.id_product).where(Product.id_product.in_(product_ids))).scalars())
+        components = set(db.execute(
+            select(Component.id_component).where(Component.id_component.in_(component_ids))
+        ).scalars())
+        linkable = []
+        for index, data in chunk:
+            if data["id_product"] not in products:
+                report.error(index, f"Product {data['id_product']} not found")
+            elif data["id_component"] not in components:
+                report.error(index, f"Component {data['id_component']} not found")
+            else:
+                linkable.append((index, data))
+        if not linkable:
+            continue
+        keys = [(data["id_product"], data["id_component"]) for _, data in linkable]
+        existing = set(db.execute(
+            select(ProductComponent.id_product, ProductComponent.id_component)
+            .where(tuple_(ProductComponent.id_product, ProductComponent.id_component).in_(keys))
+        ).tuples())
+
+        def write():
+            upsert_package_links(db, [data for _, data in linkable])
+            for index, data in linkable:
+                if (data["id_product"], data["id_component"]) in existing:
+                    report.updated(index)
+                else:
+                    report.created(index)
+
+        run_chunk(db, report, [index for index, _ in linkable], write)
+    return report.as_dict()
@@ -1,16 +1,120 @@
-from sqlalchemy.orm import Session, joinedload
-from backend.db.models import Campaign, Subscription, Product
+from datetime import date
+from typing import Any, Dict, List, Optional
+from fastapi import HTTPException, status as http_status
+from sqlalchemy import func, select, update
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, contains_eager
+from backend.db.models import Campaign, CampaignStatus, Subscription, Product, User
+from backend.db.metrics import MAINTAINS_METRICS, apply_deltas, status_change_deltas
+from backend.functions.bulk_import import check_bulk_size
 
-def get_user_campaigns(db: Session, user_id: int):
-    campaigns = (
-        db.query(Campaign)
+def user_campaigns_query(user_id: int):
+    return (
+        select(Campaign)
         .join(Subscription, Campaign.id_subscription == Subscription.id_subscription)
         .join(Product, Subscription.id_product == Product.id_product)
-        .filter(Subscription.id_user == user_id)
+        .where(Subscription.id_user == user_id)
         .options(
-            joinedload(Campaign.subscription).joinedload(Subscription.product)
+            contains_eager(Campaign.subscription).contains_eager(Subscription.product)
+        )
+    )
+
+def get_user_campaigns(db: Session, user_id: int):
+    return db.scalars(user_campaigns_query(user_id)).unique().all()
+
+async def get_user_campaigns_async(db: AsyncSession, user_id: int):
+    return (await db.scalars(user_campaigns_query(user_id))).unique().all()
+
+def admin_campaigns_query(status: Optional[CampaignStatus] = None, client_id: Optional[int] = None,
+                          date_from: Optional[date] = None, date_to: Optional[date] = None):
+    query = (
+        select(
+            Campaign.id_campaign,
+            Campaign.name,
+            Campaign.status,
+            Campaign.start_date,
+            Campaign.end_date,
+            func.coalesce(Product.name, "Unknown").label("product_name"),
+            func.coalesce(User.name, "Unknown").label("client_name"),
+            func.coalesce(User.email, "Unknown").label("client_email"),
         )
-        .all()
+        .select_from(Campaign)
+        .outerjoin(Subscription, Campaign.id_subscription == Subscription.id_subscription)
+        .outerjoin(Product, Subscription.id_product == Product.id_product)
+        .outerjoin(User, Subscription.id_user == User.id_user)
+    )
+    if status is not None:
+        query = query.where(Campaign.status == status)
+    if client_id is not None:
+        query = query.where(Subscription.id_user == client_id)
+    if date_from is not None:
+        query = query.where(Campaign.end_date >= date_from)
+    if date_to is not None:
+        query = query.where(Campaign.start_date <= date_to)
+    return query
+
+def user_campaigns_page_query(user_id: int, status: Optional[CampaignStatus] = None):
+    query = user_campaigns_query(user_id)
+    if status is not None:
+        query = query.where(Campaign.status == status)
+    return query
+
+def campaign_bulk_update_query(values: Dict[str, Any], ids: Optional[List[int]] = None,
+                               status: Optional[CampaignStatus] = None, client_id: Optional[int] = None,
+                               product_id: Optional[int] = None, date_from: Optional[date] = None,
+                               date_to: Optional[date] = None):
+    query = update(Campaign).values(**values).execution_options(synchronize_session=False)
+    if ids is not None:
+        return query.where(Campaign.id_campaign.in_(ids))
+    if status is not None:
+        query = query.where(Campaign.status == status)
+    if client_id is not None or product_id is not None:
+        subscriptions = select(Subscription.id_subscription)
+        if client_id is not None:
+            subscriptions = subscriptions.where(Subscription.id_user == client_id)
+        if product_id is not None:
+            subscriptions = subscriptions.where(Subscription.id_product == product_id)
+        query = query.where(Campaign.id_subscription.in_(subscriptions))
+    if date_from is not None:
+        query = query.where(Campaign.end_date >= date_from)
+    if date_to is not None:
+        query = query.where(Campaign.start_date <= date_to)
+    return query
+
+def campaign_dates_conflict() -> HTTPException:
+    return HTTPException(
+        status_code=http_status.HTTP_409_CONFLICT,
+        detail="The new dates would leave some campaigns ending before they start"
     )
-    return campaigns
 
+def date_conflict_criterion(values: Dict[str, Any]):
+    if "start_date" in values and "end_date" not in values:
+        return Campaign.end_date < values["start_date"]
+    if "end_date" in values and "start_date" not in values:
+        return Campaign.start_date > values["end_date"]
+    return None
+
+def bulk_update_campaigns(db: Session, values: Dict[str, Any], ids: Optional[List[int]] = None, **filters) -> int:
+    if ids is not None:
+        check_bulk_size(len(ids))
+    query = campaign_bulk_update_query(values, ids=ids, **filters)
+    conflict = date_conflict_criterion(values)
+    if conflict is not None and db.execute(
+        select(Campaign.id_campaign).where(query.whereclause, conflict).limit(1)
+    ).first() is not None:
+        raise campaign_dates_conflict()
+    deltas = status_change_deltas(db.connection(), Campaign, [query.whereclause], values["status"]) \
+        if "status" in values else {}
+    try:
+        result = db.execute(query.execution_options(**{MAINTAINS_METRICS: True}))
+    except DBAPIError as exc:
+        # A concurrent write can still trip the check. MySQL reports it as errno 3819, which PyMySQL raises as
+        # OperationalError rather than IntegrityError.
+        db.rollback()
+        if "chk_campaign_dates" not in str(exc.orig):
+            raise
+        raise campaign_dates_conflict()
+    apply_deltas(db.connection(), deltas)
+    db.commit()
+    return result.rowcount
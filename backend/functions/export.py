@@ -0,0 +1,102 @@
+import csv
+import io
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Iterator
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from backend.db.models import Campaign, User, UserRole, Subscription, Product
+from backend.functions.campaign import admin_campaigns_query
+
+
+def clients_export_query():
+    return (
+        select(User.id_user, User.name, User.email, User.phone_number, User.address, User.role, User.created_at)
+        .where(User.role.in_([UserRole.CLIENT, UserRole.OPERATIVE]))
+        .order_by(User.id_user)
+    )
+
+def subscriptions_export_query():
+    return (
+        select(
+            Subscription.id_subscription,
+            Subscription.id_user,
+            User.email.label("client_email"),
+            Subscription.id_product,
+            Product.name.label("product_name"),
+            Subscription.status,
+            Subscription.start_date,
+            Subscription.end_date,
+        )
+        .join(User, Subscription.id_user == User.id_user)
+        .join(Product, Subscription.id_product == Product.id_product)
+        .order_by(Subscription.id_subscription)
+    )
+
+def campaigns_export_query(**filters):
+    return admin_campaigns_query(**filters).order_by(Campaign.id_campaign)
+
+
+def export_value(value):
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+# Spreadsheets evaluate text cells starting with these as formulas, so client-supplied strings get a leading quote.
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+def csv_value(value):
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return export_value(value)
+
+
+def stream_batches(db: Session, query, batch_size: int):
+    result = db.execute(query.execution_options(stream_results=True, yield_per=batch_size))
+    yield result.keys()
+    for batch in result.partitions():
+        yield batch
+
+
+def csv_chunks(db: Session, query, batch_size: int) -> Iterator[bytes]:
+    batches = stream_batches(db, query, batch_size)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(list(next(batches)))
+    for batch in batches:
+        writer.writerows([csv_value(value) for value in row] for row in batch)
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def ndjson_chunks(db: Session, query, batch_size: int) -> Iterator[bytes]:
+    batches = stream_batches(db, query, batch_size)
+    keys = list(next(batches))
+    for batch in batches:
+        yield "".join(
+            json.dumps(dict(zip(keys, (export_value(value) for value in row))), separators=(",", ":")) + "\n"
+            for row in batch
+        ).encode("utf-8")
+
+
+EXPORT_FORMATS = {
+    "csv": (csv_chunks, "text/csv; charset=utf-8"),
+    "ndjson": (ndjson_chunks, "application/x-ndjson"),
+}
+
+
+def iter_export(session_factory, query, export_format: str, batch_size: int) -> Iterator[bytes]:
+    encode, _ = EXPORT_FORMATS[export_format]
+    with session_factory() as db:
+        yield from encode(db, query, batch_size)
@@ -0,0 +1,33 @@
+from collections import defaultdict
+from decimal import Decimal
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from backend.db.models import BusinessMetric, CampaignStatus, Product
+
+def get_metrics_summary(db: Session):
+    rows = db.execute(select(BusinessMetric)).scalars().all()
+    campaigns = {status.value: 0 for status in CampaignStatus}
+    products = defaultdict(lambda: {"active_subscriptions": 0, "mrr": Decimal(0)})
+    for row in rows:
+        if row.metric == "campaigns":
+            campaigns[row.dimension] = int(row.value)
+        elif row.metric == "active_subscriptions":
+            products[int(row.dimension)]["active_subscriptions"] = int(row.value)
+        elif row.metric == "mrr":
+            products[int(row.dimension)]["mrr"] = row.value
+    products = {id_product: values for id_product, values in products.items() if values["active_subscriptions"]}
+    names = dict(db.execute(
+        select(Product.id_product, Product.name).where(Product.id_product.in_(list(products)))
+    ).all()) if products else {}
+    by_product = sorted(
+        ({"id_product": id_product, "name": names.get(id_product, "Unknown"), **values}
+         for id_product, values in products.items()),
+        key=lambda item: (-item["mrr"], item["id_product"])
+    )
+    return {
+        "mrr": sum((item["mrr"] for item in by_product), Decimal(0)),
+        "active_subscriptions": sum(item["active_subscriptions"] for item in by_product),
+        "campaigns_by_status": campaigns,
+        "subscriptions_by_product": by_product,
+        "updated_at": max((row.updated_at for row in rows), default=None),
+    }
@@ -0,0 +1,151 @@
+import base64
+import binascii
+import json
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Dict, List, Optional, Sequence
+
+from fastapi import HTTPException, Query, status
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from backend.core.config import PAGE_SIZE_DEFAULT, PAGE_SIZE_MAX
+
+
+@dataclass(frozen=True)
+class ListSpec:
+    sort_keys: Dict[str, object]
+    tiebreak: Sequence[object]
+    default_sort: str = "id"
+
+    def key_columns(self, sort: str) -> List[object]:
+        column = self.sort_keys[sort]
+        return [column] + [key for key in self.tiebreak if key is not column]
+
+
+@dataclass(frozen=True)
+class PageParams:
+    limit: int
+    sort: str
+    descending: bool
+    after: Optional[list]
+    include_total: bool
+
+    @property
+    def sort_param(self) -> str:
+        return f"-{self.sort}" if self.descending else self.sort
+
+
+def invalid_cursor():
+    return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid pagination cursor")
+
+
+def encode_value(value):
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def decode_value(column, value):
+    if value is None:
+        return None
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+    if python_type in (date, datetime):
+        return python_type.fromisoformat(value)
+    if python_type is Decimal or issubclass(python_type, Enum):
+        return python_type(value)
+    return value
+
+
+def encode_cursor(sort_param: str, values: list) -> str:
+    payload = json.dumps({"sort": sort_param, "after": [encode_value(v) for v in values]}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_param: str, columns: List[object]) -> list:
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if payload["sort"] != sort_param or len(payload["after"]) != len(columns):
+            raise invalid_cursor()
+        return [decode_value(column, value) for column, value in zip(columns, payload["after"])]
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise invalid_cursor()
+
+
+def page_params(spec: ListSpec):
+    allowed = ", ".join(spec.sort_keys)
+
+    def dependency(
+        limit: int = Query(PAGE_SIZE_DEFAULT, ge=1, le=PAGE_SIZE_MAX),
+        cursor: Optional[str] = None,
+        sort: str = Query(spec.default_sort, description=f"One of: {allowed}. Prefix with '-' for descending."),
+        include_total: bool = False,
+    ) -> PageParams:
+        descending = sort.startswith("-")
+        name = sort[1:] if descending else sort
+        if name not in spec.sort_keys:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+                detail=f"Unsupported sort key '{name}'. Allowed: {allowed}"
+            )
+        after = decode_cursor(cursor, sort, spec.key_columns(name)) if cursor else None
+        return PageParams(limit, name, descending, after, include_total)
+
+    return dependency
+
+
+def after_keys(columns, values, descending: bool):
+    clauses = []
+    for i, column in enumerate(columns):
+        compare = column < values[i] if descending else column > values[i]
+        clauses.append(and_(*[c == v for c, v in zip(columns[:i], values[:i])], compare))
+    return or_(*clauses)
+
+
+def page_query(query, spec: ListSpec, params: PageParams):
+    columns = spec.key_columns(params.sort)
+    query = query.order_by(None).order_by(*[c.desc() if params.descending else c.asc() for c in columns])
+    if params.after is not None:
+        query = query.where(after_keys(columns, params.after, params.descending))
+    return query.limit(params.limit + 1)
+
+
+def count_query(query):
+    return select(func.count()).select_from(query.order_by(None).subquery())
+
+
+def row_value(row, column):
+    return row[column.key] if isinstance(row, Mapping) else getattr(row, column.key)
+
+
+def make_page(rows, spec: ListSpec, params: PageParams, total: Optional[int]) -> dict:
+    rows = list(rows)
+    next_cursor = None
+    if len(rows) > params.limit:
+        rows = rows[:params.limit]
+        next_cursor = encode_cursor(params.sort_param, [row_value(rows[-1], c) for c in spec.key_columns(params.sort)])
+    return {"items": rows, "limit": params.limit, "next_cursor": next_cursor, "total": total}
+
+
+def paginate(db: Session, query, spec: ListSpec, params: PageParams, mappings: bool = False) -> dict:
+    result = db.execute(page_query(query, spec, params))
+    rows = result.mappings().all() if mappings else result.scalars().unique().all()
+    total = db.scalar(count_query(query)) if params.include_total else None
+    return make_page(rows, spec, params, total)
+
+
+async def paginate_async(db: AsyncSession, query, spec: ListSpec, params: PageParams, mappings: bool = False) -> dict:
+    result = await db.execute(page_query(query, spec, params))
+    rows = result.mappings().all() if mappings else result.scalars().unique().all()
+    total = await db.scalar(count_query(query)) if params.include_total else None
+    return make_page(rows, spec, params, total)
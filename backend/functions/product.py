@@ -1,10 +1,26 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from backend.db.models import Product
+from backend.db.models import Product, ProductComponent, Component
 
-def get_active_products(db: Session):
-    products = (
-        db.query(Product)
-        .filter(Product.is_active == True)
-        .all()
+def catalog_rows_query():
+    return (
+        select(
+            Product.id_product,
+            Product.name,
+            Product.description,
+            Product.monthly_price,
+            Component.name.label("component_name"),
+            ProductComponent.quantity,
+        )
+        .outerjoin(ProductComponent, ProductComponent.id_product == Product.id_product)
+        .outerjoin(Component, Component.id_component == ProductComponent.id_component)
+        .where(Product.is_active == True)
+        .order_by(Product.id_product, ProductComponent.id_component)
     )
-    return products
\ No newline at end of file
+
+def get_catalog_rows(db: Session):
+    return db.execute(catalog_rows_query()).all()
+
+async def get_catalog_rows_async(db: AsyncSession):
+    return (await db.execute(catalog_rows_query())).all()
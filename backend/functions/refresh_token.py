@@ -0,0 +1,28 @@
+from datetime import datetime, timezone
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+from backend.db.models import RefreshToken
+
+
+def store_refresh_token(db: Session, jti: str, user_id: int, family: str, expires_at: datetime):
+    db_token = RefreshToken(jti=jti, id_user=user_id, family=family, expires_at=expires_at)
+    db.add(db_token)
+    return db_token
+
+def get_refresh_token(db: Session, jti: str):
+    return db.query(RefreshToken).filter(RefreshToken.jti == jti).first()
+
+def consume_refresh_token(db: Session, jti: str) -> bool:
+    result = db.execute(
+        update(RefreshToken)
+        .where(RefreshToken.jti == jti, RefreshToken.revoked_at.is_(None))
+        .values(revoked_at=datetime.now(timezone.utc))
+    )
+    return result.rowcount == 1
+
+def revoke_refresh_family(db: Session, family: str):
+    db.execute(
+        update(RefreshToken)
+        .where(RefreshToken.family == family, RefreshToken.revoked_at.is_(None))
+        .values(revoked_at=datetime.now(timezone.utc))
+    )
@@ -0,0 +1,26 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from backend.db.models import ResourceVersion, PRINCIPALS_VERSION
+
+def resource_versions_query(names):
+    return (
+        select(ResourceVersion.name, ResourceVersion.version, ResourceVersion.updated_at)
+        .where(ResourceVersion.name.in_(names))
+        .order_by(ResourceVersion.name)
+    )
+
+def get_resource_versions(db: Session, names):
+    return db.execute(resource_versions_query(names)).all()
+
+async def get_resource_versions_async(db: AsyncSession, names):
+    return (await db.execute(resource_versions_query(names))).all()
+
+def principals_version_query():
+    return select(ResourceVersion.version).where(ResourceVersion.name == PRINCIPALS_VERSION)
+
+def get_principals_version(db: Session):
+    return db.scalar(principals_version_query())
+
+async def get_principals_version_async(db: AsyncSession):
+    return await db.scalar(principals_version_query())
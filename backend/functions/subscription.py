@@ -0,0 +1,16 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from backend.db.models import Subscription, SubscriptionStatus
+
+def active_product_ids_query(user_id: int):
+    return select(Subscription.id_product).where(
+        Subscription.id_user == user_id,
+        Subscription.status == SubscriptionStatus.Active
+    )
+
+def get_active_product_ids(db: Session, user_id: int):
+    return db.scalars(active_product_ids_query(user_id)).all()
+
+async def get_active_product_ids_async(db: AsyncSession, user_id: int):
+    return (await db.scalars(active_product_ids_query(user_id))).all()
\ No newline at end of file
@@ -1,22 +1,18 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from passlib.context import CryptContext
-from backend.utils import validate_password
-from backend.schemas import UserCreate
-from backend.db.models import User
+from backend.db.models import User, UserRole
 
 
-pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
-
-def create_user(db: Session, user: UserCreate):
-    validate_password(user.password)
+def create_user(db: Session, user, hashed_password: str):
     normalized_email = user.email.lower()
-    hashed_password = pwd_context.hash(user.password)
     db_user = User(
         name=user.name,
         email=normalized_email,
         password_hash=hashed_password,
         phone_number=user.phone_number,
         address=user.address,
+        role=getattr(user, "role", UserRole.CLIENT),
     )
     db.add(db_user)
     db.commit()
@@ -28,4 +24,7 @@ def get_user_by_email(db: Session, email):
     return db.query(User).filter(User.email == normalized_email).first()
 
 def get_user_by_id(db: Session, id):
-    return db.query(User).filter(User.id_user == id).first()
\ No newline at end of file
+    return db.query(User).filter(User.id_user == id).first()
+
+async def get_user_by_id_async(db: AsyncSession, id):
+    return await db.scalar(select(User).where(User.id_user == id))
\ No newline at end of file
@@ -1,38 +1,88 @@
-from backend.routers import (
-    auth_router, 
-    campaign_router, 
-    user_router,
-    product_router,
-    subscription_router,
-    admin_router,
-    components_management_router,
-    products_management_router,
-    packages_management_router,
-)
 from fastapi.middleware.cors import CORSMiddleware
-from backend.db.session import engine
-from backend.db.base import Base
-from fastapi import FastAPI
-
-Base.metadata.create_all(bind=engine)
-
-app = FastAPI(title="Cloud Chaser API")
-
-origins = ["http://localhost:3000"]
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=origins,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-app.include_router(auth_router)
-app.include_router(user_router, prefix="/users")
-app.include_router(campaign_router, prefix="/campaigns")
-app.include_router(product_router, prefix="/products")
-app.include_router(subscription_router, prefix="/subscriptions")
-app.include_router(admin_router, prefix="/admin")
-app.include_router(components_management_router, prefix="/components-management")
-app.include_router(products_management_router, prefix="/products-management",)
-app.include_router(packages_management_router, prefix="/packages-management",)
\ No newline at end of file
+from backend.db.session import engine, async_engine, async_replica_engines, pin_reads_to_primary, DB_POOL_WARMUP
+from backend.db.routing import PIN_HEADER, SAFE_METHODS
+from backend.db.pool import warm_up_pool, warm_up_async_pool
+from starlette.concurrency import run_in_threadpool
+from backend.core import (password_hasher, last_login_writer, lifecycle_scheduler, metrics_reconciler,
+                          request_profiler, telemetry, install_query_tracking, LAST_LOGIN_WRITE_BEHIND,
+                          PROFILING_ENABLED, TELEMETRY_ENABLED)
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    password_hasher.start()
+    if DB_POOL_WARMUP > 0:
+        await run_in_threadpool(warm_up_pool, engine, DB_POOL_WARMUP)
+        if async_engine is not None:
+            await warm_up_async_pool(async_engine, DB_POOL_WARMUP)
+    if LAST_LOGIN_WRITE_BEHIND:
+        last_login_writer.start()
+    if lifecycle_scheduler.enabled:
+        lifecycle_scheduler.start()
+    if metrics_reconciler.enabled:
+        metrics_reconciler.start()
+    yield
+    metrics_reconciler.shutdown()
+    lifecycle_scheduler.shutdown()
+    last_login_writer.shutdown()
+    password_hasher.shutdown()
+    for async_db_engine in [async_engine, *async_replica_engines]:
+        if async_db_engine is not None:
+            await async_db_engine.dispose()
+
+def create_app() -> FastAPI:
+    from backend import routers
+
+    app = FastAPI(title="Cloud Chaser API", lifespan=lifespan)
+
+    origins = ["http://localhost:3000"]
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=origins,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+        expose_headers=[PIN_HEADER],
+    )
+
+    @app.middleware("http")
+    async def pin_writers_to_primary(request: Request, call_next):
+        response = await call_next(request)
+        if request.method not in SAFE_METHODS and response.status_code < 400:
+            pin_reads_to_primary(response)
+        return response
+
+    if TELEMETRY_ENABLED:
+        install_query_tracking()
+
+        @app.middleware("http")
+        async def record_telemetry(request: Request, call_next):
+            return await telemetry.observe_request(request, call_next)
+
+    if PROFILING_ENABLED:
+        @app.middleware("http")
+        async def profile_requests(request: Request, call_next):
+            if request_profiler.wants(request):
+                return await request_profiler.profile(request, call_next)
+            return await call_next(request)
+
+    app.include_router(routers.auth_router)
+    app.include_router(routers.health_router, prefix="/health")
+    app.include_router(routers.user_router, prefix="/users")
+    app.include_router(routers.campaign_router, prefix="/campaigns")
+    app.include_router(routers.product_router, prefix="/products")
+    app.include_router(routers.subscription_router, prefix="/subscriptions")
+    app.include_router(routers.admin_router, prefix="/admin")
+    app.include_router(routers.exports_router, prefix="/admin/exports")
+    app.include_router(routers.profiling_router, prefix="/admin/profiles")
+    app.include_router(routers.components_management_router, prefix="/components-management")
+    app.include_router(routers.products_management_router, prefix="/products-management",)
+    app.include_router(routers.packages_management_router, prefix="/packages-management",)
+    return app
+
+def __getattr__(name):
+    if name != "app":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    app = globals()["app"] = create_app()
+    return app
\ No newline at end of file
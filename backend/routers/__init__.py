@@ -1,9 +1,21 @@
-from .auth import router as auth_router
-from .campaigns import router as campaign_router
-from .users import router as user_router
-from .products import router as product_router
-from .subscriptions import router as subscription_router
-from .admin import router as admin_router
-from .components_management import router as components_management_router
-from .products_management import router as products_management_router
-from .packages_management import router as packages_management_router
\ No newline at end of file
+from importlib import import_module
+
+ROUTER_MODULES = {
+    "auth_router": ".auth",
+    "campaign_router": ".campaigns",
+    "user_router": ".users",
+    "product_router": ".products",
+    "subscription_router": ".subscriptions",
+    "admin_router": ".admin",
+    "components_management_router": ".components_management",
+    "products_management_router": ".products_management",
+    "packages_management_router": ".packages_management",
+    "health_router": ".health",
+    "exports_router": ".exports",
+    "profiling_router": ".profiling",
+}
+
+def __getattr__(name):
+    if name not in ROUTER_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return import_module(ROUTER_MODULES[name], __name__).router
\ No newline at end of file
@@ -1,46 +1,61 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import select
 from sqlalchemy.orm import Session
-from backend.db.models import User, Subscription, Campaign
-from passlib.context import CryptContext
-from backend.schemas import UserOut, ClientCreate, ClientUpdate, AdminCampaignUpdate, AdminCampaignOut
-from backend.db.session import get_db
-from backend.core import admin_required
-from typing import List
+from backend.db.models import User, UserRole, Subscription, Campaign, CampaignStatus, PRINCIPALS_VERSION
+from starlette.concurrency import run_in_threadpool
+from backend.schemas import (UserOut, ClientCreate, ClientUpdate, AdminCampaignUpdate, AdminCampaignOut, DatabasePoolsOut,
+                             Page, AdminCampaignBulkUpdate, AdminCampaignBulkResult, MetricsSummaryOut)
+from backend.db.session import get_db, get_read_db, engine, async_engine, replica_engines, async_replica_engines
+from backend.db.pool import pool_status
+from backend.db.query_budget import query_budget
+from backend.db.versioning import mark_changed
+from backend.core import admin_required, principal_cache, password_hasher, fast_response
+from backend.functions import (create_user, get_user_by_email, admin_campaigns_query,
+                               bulk_update_campaigns, get_metrics_summary, ListSpec, PageParams, page_params, paginate)
+from datetime import date
+from typing import Optional
 
 router = APIRouter(tags=["Admin"], dependencies=[Depends(admin_required)])
-pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
 
-@router.get("/clients", response_model=List[UserOut])
-def get_all_clients(db: Session = Depends(get_db)):
-    clients = db.query(User).filter(
-        User.role.in_(["CLIENT", "OPERATIVE"])
-    ).all()
-    return clients
+CLIENT_LIST = ListSpec(
+    sort_keys={"id": User.id_user, "name": User.name, "email": User.email, "created_at": User.created_at},
+    tiebreak=[User.id_user]
+)
+
+ADMIN_CAMPAIGN_LIST = ListSpec(
+    sort_keys={"id": Campaign.id_campaign, "name": Campaign.name,
+               "start_date": Campaign.start_date, "end_date": Campaign.end_date},
+    tiebreak=[Campaign.id_campaign]
+)
+
+@router.get("/clients", response_model=Page[UserOut])
+@query_budget(2)
+def get_all_clients(
+    page: PageParams = Depends(page_params(CLIENT_LIST)),
+    role: Optional[UserRole] = None,
+    email: Optional[str] = Query(None, description="Email prefix"),
+    db: Session = Depends(get_read_db)
+):
+    query = select(User).where(User.role.in_([UserRole.CLIENT, UserRole.OPERATIVE]))
+    if role is not None:
+        query = query.where(User.role == role)
+    if email:
+        query = query.where(User.email.startswith(email.lower(), autoescape=True))
+    return paginate(db, query, CLIENT_LIST, page)
 
 @router.post("/clients", response_model=UserOut, status_code=status.HTTP_201_CREATED)
-def create_client(
+async def create_client(
     client_data: ClientCreate,
     db: Session = Depends(get_db)
 ):
-    db_user = db.query(User).filter(User.email == client_data.email).first()
+    db_user = await run_in_threadpool(get_user_by_email, db, email=client_data.email)
     if db_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
         )
-    hashed_password = pwd_context.hash(client_data.password)
-    db_user = User(
-        email=client_data.email,
-        name=client_data.name,
-        password_hash=hashed_password,
-        phone_number=client_data.phone_number,
-        address=client_data.address,
-        role=client_data.role
-    )
-    db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
-    return db_user
+    hashed_password = await password_hasher.hash(client_data.password)
+    return await run_in_threadpool(create_user, db=db, user=client_data, hashed_password=hashed_password)
 
 @router.put("/clients/{user_id}", response_model=UserOut)
 def update_client(
@@ -56,8 +71,10 @@ def update_client(
     for key, value in update_data.items():
         setattr(db_user, key, value)
     
+    mark_changed(db, {PRINCIPALS_VERSION})
     db.commit()
     db.refresh(db_user)
+    principal_cache.invalidate_user(user_id)
     return db_user
 
 @router.delete("/clients/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -69,37 +86,39 @@ def delete_client(user_id: int, db: Session = Depends(get_db)):
     db.query(Subscription).filter(Subscription.id_user == user_id).delete(synchronize_session=False)
     
     db.delete(db_user)
+    mark_changed(db, {PRINCIPALS_VERSION})
     db.commit()
+    principal_cache.invalidate_user(user_id)
 
 
-@router.get("/campaigns", response_model=List[AdminCampaignOut])
-def get_all_campaigns(db: Session = Depends(get_db)):
-    campaigns = db.query(Campaign).all()
-    
-    result = []
-    for c in campaigns:
-        product_name = "Unknown"
-        client_name = "Unknown"
-        client_email = "Unknown"
-        
-        if c.subscription:
-            if c.subscription.product:
-                product_name = c.subscription.product.name
-            if c.subscription.user:
-                client_name = c.subscription.user.name
-                client_email = c.subscription.user.email
-
-        result.append(AdminCampaignOut(
-            id_campaign=c.id_campaign,
-            name=c.name,
-            status=c.status,
-            start_date=c.start_date,
-            end_date=c.end_date,
-            product_name=product_name,
-            client_name=client_name,
-            client_email=client_email
-        ))
-    return result
+@router.get("/metrics", response_model=MetricsSummaryOut)
+@query_budget(3)
+def get_metrics(db: Session = Depends(get_read_db)):
+    return get_metrics_summary(db)
+
+@router.get("/campaigns", response_model=Page[AdminCampaignOut])
+@query_budget(2)
+def get_all_campaigns(
+    page: PageParams = Depends(page_params(ADMIN_CAMPAIGN_LIST)),
+    campaign_status: Optional[CampaignStatus] = Query(None, alias="status"),
+    client_id: Optional[int] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    db: Session = Depends(get_read_db)
+):
+    query = admin_campaigns_query(status=campaign_status, client_id=client_id,
+                                  date_from=date_from, date_to=date_to)
+    return fast_response(paginate(db, query, ADMIN_CAMPAIGN_LIST, page, mappings=True))
+
+@router.patch("/campaigns", response_model=AdminCampaignBulkResult)
+def bulk_update_campaigns_route(
+    campaign_data: AdminCampaignBulkUpdate,
+    db: Session = Depends(get_db)
+):
+    values = campaign_data.model_dump(include={"status", "start_date", "end_date"}, exclude_none=True)
+    filters = campaign_data.filter.model_dump() if campaign_data.filter else {}
+    updated = bulk_update_campaigns(db, values, ids=campaign_data.ids, **filters)
+    return AdminCampaignBulkResult(updated=updated)
 
 @router.put("/campaigns/{campaign_id}", response_model=AdminCampaignOut)
 def update_campaign(
@@ -147,4 +166,14 @@ def delete_campaign(campaign_id: int, db: Session = Depends(get_db)):
     
     db.delete(db_campaign)
     db.commit()
-    return
\ No newline at end of file
+    return
+
+@router.get("/db/pool", response_model=DatabasePoolsOut)
+@query_budget(1)
+def get_database_pool_stats():
+    return DatabasePoolsOut(
+        primary=pool_status(engine),
+        primary_async=pool_status(async_engine) if async_engine is not None else None,
+        replicas=[pool_status(replica) for replica in replica_engines],
+        replicas_async=[pool_status(replica) for replica in async_replica_engines]
+    )
\ No newline at end of file
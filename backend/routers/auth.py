@@ -1,31 +1,57 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from fastapi.security import OAuth2PasswordRequestForm
+from starlette.concurrency import run_in_threadpool
 from datetime import timedelta, timezone, datetime
 from backend.db.session import get_db
-from backend.core import ACCESS_TOKEN_EXPIRE_MINUTES, verify_password, create_access_token, get_current_user
-from backend.functions import get_user_by_email, create_user
-from backend.schemas import Token, UserOut, UserCreate
+from backend.core import (ACCESS_TOKEN_EXPIRE_MINUTES, create_access_token, password_hasher,
+                          create_refresh_token, verify_refresh_token,
+                          LAST_LOGIN_WRITE_BEHIND, last_login_writer, login_admission, register_admission)
+from backend.functions import (get_user_by_email, get_user_by_id, create_user, store_refresh_token,
+                               get_refresh_token, consume_refresh_token, revoke_refresh_family)
+from backend.schemas import Token, UserOut, UserCreate, RefreshRequest
+from backend.utils import validate_password
 
 router = APIRouter(tags=["Auth"])
 
+def issue_tokens(db: Session, user, family=None):
+    token_data = {"id_user": user.id_user, "role": user.role.value}
+    access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    access_token = create_access_token(data=token_data,
+                                       expires_delta=access_token_expires)
+    refresh_token, jti, family, expires_at = create_refresh_token(user.id_user, family=family)
+    store_refresh_token(db, jti=jti, user_id=user.id_user, family=family, expires_at=expires_at)
+    return {"access_token": access_token, "token_type": "bearer", "refresh_token": refresh_token}
+
+def invalid_refresh_token():
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Invalid refresh token",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
 @router.post("/register", response_model=UserOut, status_code=status.HTTP_201_CREATED)
-def create_new_user(user: UserCreate, db: Session = Depends(get_db)):
-    db_user = get_user_by_email(db, email=user.email)
+async def create_new_user(user: UserCreate, request: Request, db: Session = Depends(get_db)):
+    await register_admission.check(request, user.email)
+    validate_password(user.password)
+    db_user = await run_in_threadpool(get_user_by_email, db, email=user.email)
     if db_user:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Email already registered")
+    hashed_password = await password_hasher.hash(user.password)
     try:
-        created = create_user(db=db, user=user)
+        created = await run_in_threadpool(create_user, db=db, user=user, hashed_password=hashed_password)
     except IntegrityError:
-        db.rollback()
+        await run_in_threadpool(db.rollback)
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Email already registered")
     return created
 
 @router.post("/login", response_model=Token)
-def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
+async def login_for_access_token(request: Request, form_data: OAuth2PasswordRequestForm = Depends(),
+                                 db: Session = Depends(get_db)):
     email_normalized = form_data.username.lower()
-    user = get_user_by_email(db, email=email_normalized)
+    await login_admission.check(request, email_normalized)
+    user = await run_in_threadpool(get_user_by_email, db, email=email_normalized)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -33,19 +59,48 @@ def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends(), db:
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    if not verify_password(form_data.password, user.password_hash):
+    if not await password_hasher.verify(form_data.password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    user.last_login_at = datetime.now(timezone.utc)
+    tokens = issue_tokens(db, user)
+    if LAST_LOGIN_WRITE_BEHIND:
+        last_login_writer.record(user.id_user, datetime.now(timezone.utc))
+    else:
+        user.last_login_at = datetime.now(timezone.utc)
+    await run_in_threadpool(db.commit)
+
+    return tokens
+
+@router.post("/refresh", response_model=Token)
+def refresh_access_token(body: RefreshRequest, db: Session = Depends(get_db)):
+    payload = verify_refresh_token(body.refresh_token)
+    if payload is None:
+        raise invalid_refresh_token()
+
+    if not consume_refresh_token(db, payload["jti"]):
+        stored = get_refresh_token(db, payload["jti"])
+        if stored is not None:
+            revoke_refresh_family(db, stored.family)
+            db.commit()
+        raise invalid_refresh_token()
+
+    user = get_user_by_id(db, payload["id_user"])
+    if user is None:
+        db.rollback()
+        raise invalid_refresh_token()
+
+    tokens = issue_tokens(db, user, family=payload["fam"])
     db.commit()
-    
-    token_data = {"id_user": user.id_user, "role": user.role.value}
-    access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    access_token = create_access_token(data=token_data, 
-                                       expires_delta=access_token_expires)
+    return tokens
 
-    return {"access_token": access_token, "token_type": "bearer"}
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+def logout(body: RefreshRequest, db: Session = Depends(get_db)):
+    payload = verify_refresh_token(body.refresh_token)
+    if payload is None:
+        raise invalid_refresh_token()
+    revoke_refresh_family(db, payload["fam"])
+    db.commit()
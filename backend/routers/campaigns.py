@@ -1,30 +1,69 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from backend.db.session import get_db
-from backend.core import get_current_user
-from backend.functions import get_user_campaigns
-from backend.schemas import CampaignOut, CampaignCreate
+from backend.db.session import get_db, get_read_db, get_async_read_db, ASYNC_DB_ENABLED
+from backend.db.query_budget import query_budget
+from backend.core import get_current_user, get_current_user_async, conditional_response, fast_response
+from backend.functions import (user_campaigns_page_query, ListSpec, PageParams, page_params, paginate,
+                               paginate_async, get_resource_versions, get_resource_versions_async)
+from backend.schemas import CampaignOut, CampaignCreate, Page
+from typing import Optional
 from backend.db.models import Campaign, Subscription, SubscriptionStatus, CampaignStatus
 
 router = APIRouter(tags=["Campaigns"])
 
-@router.get("/", response_model=list[CampaignOut])
-def get_campaigns_for_current_user(db: Session = Depends(get_db), current_user = Depends(get_current_user)):
-    campaigns = get_user_campaigns(db=db, user_id=current_user.id_user)
+CAMPAIGN_LIST = ListSpec(
+    sort_keys={"id": Campaign.id_campaign, "name": Campaign.name,
+               "start_date": Campaign.start_date, "end_date": Campaign.end_date},
+    tiebreak=[Campaign.id_campaign]
+)
 
-    result = []
-    for c in campaigns:
-        result.append(
-            CampaignOut(
-                id_campaign=c.id_campaign,
-                name=c.name,
-                product=c.subscription.product.name,
-                status=c.status,
-                start_date=c.start_date,
-                end_date=c.end_date
-            )
-        )
-    return result
+CAMPAIGN_RESOURCES = ("campaigns", "products", "subscriptions")
+
+def to_campaign_rows(campaigns):
+    return [
+        {
+            "id_campaign": c.id_campaign,
+            "name": c.name,
+            "product": c.subscription.product.name,
+            "status": c.status,
+            "start_date": c.start_date,
+            "end_date": c.end_date,
+        }
+        for c in campaigns
+    ]
+
+@query_budget(3)
+def get_campaigns_for_current_user(request: Request, response: Response,
+                                   page: PageParams = Depends(page_params(CAMPAIGN_LIST)),
+                                   campaign_status: Optional[CampaignStatus] = Query(None, alias="status"),
+                                   db: Session = Depends(get_read_db), current_user = Depends(get_current_user)):
+    not_modified = conditional_response(request, response, get_resource_versions(db, CAMPAIGN_RESOURCES),
+                                        current_user.id_user)
+    if not_modified:
+        return not_modified
+    query = user_campaigns_page_query(current_user.id_user, status=campaign_status)
+    result = paginate(db, query, CAMPAIGN_LIST, page)
+    result["items"] = to_campaign_rows(result["items"])
+    return fast_response(result, response)
+
+@query_budget(3)
+async def get_campaigns_for_current_user_async(request: Request, response: Response,
+                                               page: PageParams = Depends(page_params(CAMPAIGN_LIST)),
+                                               campaign_status: Optional[CampaignStatus] = Query(None, alias="status"),
+                                               db: AsyncSession = Depends(get_async_read_db),
+                                               current_user = Depends(get_current_user_async)):
+    not_modified = conditional_response(request, response, await get_resource_versions_async(db, CAMPAIGN_RESOURCES),
+                                        current_user.id_user)
+    if not_modified:
+        return not_modified
+    query = user_campaigns_page_query(current_user.id_user, status=campaign_status)
+    result = await paginate_async(db, query, CAMPAIGN_LIST, page)
+    result["items"] = to_campaign_rows(result["items"])
+    return fast_response(result, response)
+
+router.add_api_route("/", get_campaigns_for_current_user_async if ASYNC_DB_ENABLED else get_campaigns_for_current_user,
+                     methods=["GET"], response_model=Page[CampaignOut])
 
 @router.post("/", response_model=CampaignOut)
 def create_campaign(
@@ -1,20 +1,40 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from sqlalchemy import select
 from sqlalchemy.orm import Session
-from typing import List
+from typing import Optional
 from backend.db.models import Component
-from backend.schemas import ComponentUpdate, ComponentOut, ComponentCreate
-from backend.db.session import get_db
-from backend.core import operative_required
+from backend.schemas import ComponentUpdate, ComponentOut, ComponentCreate, Page, BulkImportRequest, BulkImportReport
+from backend.functions import ListSpec, PageParams, page_params, paginate, get_resource_versions, bulk_import_components
+from backend.db.session import get_db, get_read_db
+from backend.core import operative_required, refresh_catalog, conditional_response
+from backend.db.query_budget import query_budget
 
 router = APIRouter(
     tags=["Components"],
     dependencies=[Depends(operative_required)]
 )
 
-@router.get("/", response_model=List[ComponentOut])
-def get_all_components(db: Session = Depends(get_db)):
-    components = db.query(Component).all()
-    return components
+COMPONENT_LIST = ListSpec(
+    sort_keys={"id": Component.id_component, "name": Component.name, "unit_cost": Component.unit_cost},
+    tiebreak=[Component.id_component]
+)
+
+@router.get("/", response_model=Page[ComponentOut])
+@query_budget(3)
+def get_all_components(
+    request: Request,
+    response: Response,
+    page: PageParams = Depends(page_params(COMPONENT_LIST)),
+    component_type: Optional[str] = None,
+    db: Session = Depends(get_read_db)
+):
+    not_modified = conditional_response(request, response, get_resource_versions(db, ["components"]))
+    if not_modified:
+        return not_modified
+    query = select(Component)
+    if component_type is not None:
+        query = query.where(Component.component_type == component_type)
+    return paginate(db, query, COMPONENT_LIST, page)
 
 
 @router.post("/", response_model=ComponentOut, status_code=status.HTTP_201_CREATED)
@@ -26,6 +46,7 @@ def create_component(
     db_component = Component(**component_data.model_dump())
     db.add(db_component)
     db.commit()
+    refresh_catalog(db)
     db.refresh(db_component)
     return db_component
 
@@ -44,6 +65,7 @@ def update_component(
         setattr(db_component, key, value)
     
     db.commit()
+    refresh_catalog(db)
     db.refresh(db_component)
     return db_component
 
@@ -55,4 +77,13 @@ def delete_component(component_id: int, db: Session = Depends(get_db)):
     
     db.delete(db_component)
     db.commit()
-    return
\ No newline at end of file
+    refresh_catalog(db)
+    return
+
+
+@router.post("/bulk", response_model=BulkImportReport)
+def import_components(payload: BulkImportRequest, db: Session = Depends(get_db)):
+    report = bulk_import_components(db, payload.rows)
+    if report["created"] or report["updated"]:
+        refresh_catalog(db)
+    return report
@@ -0,0 +1,45 @@
+from datetime import date
+from typing import Literal, Optional
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
+from backend.core import admin_required, EXPORT_BATCH_SIZE
+from backend.db.models import CampaignStatus
+from backend.db.query_budget import query_budget
+from backend.db.session import read_session_factory
+from backend.functions import (iter_export, EXPORT_FORMATS, campaigns_export_query,
+                               clients_export_query, subscriptions_export_query)
+
+router = APIRouter(tags=["Exports (Admin)"], dependencies=[Depends(admin_required)])
+
+ExportFormat = Literal["csv", "ndjson"]
+
+def export_response(request: Request, name: str, query, export_format: str):
+    _, media_type = EXPORT_FORMATS[export_format]
+    return StreamingResponse(
+        iter_export(read_session_factory(request), query, export_format, EXPORT_BATCH_SIZE),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{name}.{export_format}"'}
+    )
+
+@router.get("/campaigns")
+@query_budget(2)
+def export_campaigns(
+    request: Request,
+    format: ExportFormat = "csv",
+    campaign_status: Optional[CampaignStatus] = Query(None, alias="status"),
+    client_id: Optional[int] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+):
+    query = campaigns_export_query(status=campaign_status, client_id=client_id, date_from=date_from, date_to=date_to)
+    return export_response(request, "campaigns", query, format)
+
+@router.get("/clients")
+@query_budget(2)
+def export_clients(request: Request, format: ExportFormat = "csv"):
+    return export_response(request, "clients", clients_export_query(), format)
+
+@router.get("/subscriptions")
+@query_budget(2)
+def export_subscriptions(request: Request, format: ExportFormat = "csv"):
+    return export_response(request, "subscriptions", subscriptions_export_query(), format)
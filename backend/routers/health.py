@@ -0,0 +1,25 @@
+from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import PlainTextResponse
+from prometheus_client import CONTENT_TYPE_LATEST
+from backend.core import render_metrics, METRICS_ENABLED
+from backend.db.session import engine
+from backend.db.migrations import check_ready
+
+router = APIRouter(tags=["Health"])
+
+@router.get("/live")
+def liveness():
+    return {"status": "ok"}
+
+@router.get("/ready")
+def readiness():
+    ready, detail = check_ready(engine)
+    if not ready:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=detail)
+    return {"status": "ready", "revision": detail}
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    if not METRICS_ENABLED:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Metrics are disabled")
+    return PlainTextResponse(render_metrics(), media_type=CONTENT_TYPE_LATEST)
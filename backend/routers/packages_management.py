@@ -1,28 +1,59 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from backend.db.session import get_db
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from sqlalchemy import select
+from sqlalchemy.orm import Session, joinedload
+from backend.db.session import get_db, get_read_db
 from backend.db.models import ProductComponent
-from backend.schemas import PackageUpdate, PackageOut, PackageCreate
-from backend.core import operative_required
-from typing import List
+from backend.core.catalog_snapshot import CATALOG_RESOURCES
+from backend.db.query_budget import query_budget
+from backend.schemas import PackageUpdate, PackageOut, PackageCreate, Page, BulkImportRequest, BulkImportReport
+from backend.functions import ListSpec, PageParams, page_params, paginate, get_resource_versions, bulk_import_packages
+from backend.core import operative_required, refresh_catalog, conditional_response
+from typing import Optional
 
 router = APIRouter(
     tags=["Packages Management (Operative)"],
     dependencies=[Depends(operative_required)]
 )
 
-@router.get("/", response_model=List[PackageOut])
-def get_all_packages(db: Session = Depends(get_db)):
-    packages = db.query(ProductComponent).all()
-    result = []
-    for pkg in packages:
-        result.append(PackageOut(
-            id_product=pkg.id_product,
-            id_component=pkg.id_component,
-            quantity=pkg.quantity,
-            product_name=pkg.product.name if pkg.product else "Unknown",
-            component_name=pkg.component.name if pkg.component else "Unknown"
-        ))
+PACKAGE_LIST = ListSpec(
+    sort_keys={"product": ProductComponent.id_product, "component": ProductComponent.id_component,
+               "quantity": ProductComponent.quantity},
+    tiebreak=[ProductComponent.id_product, ProductComponent.id_component],
+    default_sort="product"
+)
+
+def to_package_out(pkg):
+    return PackageOut(
+        id_product=pkg.id_product,
+        id_component=pkg.id_component,
+        quantity=pkg.quantity,
+        product_name=pkg.product.name if pkg.product else "Unknown",
+        component_name=pkg.component.name if pkg.component else "Unknown"
+    )
+
+@router.get("/", response_model=Page[PackageOut])
+@query_budget(3)
+def get_all_packages(
+    request: Request,
+    response: Response,
+    page: PageParams = Depends(page_params(PACKAGE_LIST)),
+    id_product: Optional[int] = None,
+    id_component: Optional[int] = None,
+    db: Session = Depends(get_read_db)
+):
+    not_modified = conditional_response(request, response, get_resource_versions(db, CATALOG_RESOURCES))
+    if not_modified:
+        return not_modified
+    query = select(ProductComponent).options(
+        joinedload(ProductComponent.product),
+        joinedload(ProductComponent.component)
+    )
+    if id_product is not None:
+        query = query.where(ProductComponent.id_product == id_product)
+    if id_component is not None:
+        query = query.where(ProductComponent.id_component == id_component)
+    result = paginate(db, query, PACKAGE_LIST, page)
+    result["items"] = [to_package_out(pkg) for pkg in result["items"]]
     return result
 
 @router.post("/", response_model=PackageOut)
@@ -48,15 +79,10 @@ def create_package_link(
     )
     db.add(db_package)
     db.commit()
+    refresh_catalog(db)
     db.refresh(db_package)
     
-    return PackageOut(
-        id_product=db_package.id_product,
-        id_component=db_package.id_component,
-        quantity=db_package.quantity,
-        product_name=db_package.product.name if db_package.product else "Unknown",
-        component_name=db_package.component.name if db_package.component else "Unknown"
-    )
+    return to_package_out(db_package)
 
 @router.put("/{product_id}/{component_id}", response_model=PackageOut)
 def update_package_link(
@@ -75,15 +101,10 @@ def update_package_link(
         
     db_package.quantity = package_data.quantity
     db.commit()
+    refresh_catalog(db)
     db.refresh(db_package)
     
-    return PackageOut(
-        id_product=db_package.id_product,
-        id_component=db_package.id_component,
-        quantity=db_package.quantity,
-        product_name=db_package.product.name if db_package.product else "Unknown",
-        component_name=db_package.component.name if db_package.component else "Unknown"
-    )
+    return to_package_out(db_package)
 
 @router.delete("/{product_id}/{component_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_package_link(
@@ -101,4 +122,13 @@ def delete_package_link(
         
     db.delete(db_package)
     db.commit()
-    return
\ No newline at end of file
+    refresh_catalog(db)
+    return
+
+
+@router.post("/bulk", response_model=BulkImportReport)
+def import_package_links(payload: BulkImportRequest, db: Session = Depends(get_db)):
+    report = bulk_import_packages(db, payload.rows)
+    if report["created"] or report["updated"]:
+        refresh_catalog(db)
+    return report
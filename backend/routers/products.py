@@ -1,41 +1,69 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from backend.db.session import get_db
-from backend.functions import get_active_products
-from backend.schemas import ProductDropDown, ProductCard, ComponentDetail
-from typing import List
+from fastapi import APIRouter, Depends, Request, Response, status
 from backend.db.models import Product
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from backend.db.session import get_read_db, get_async_read_db, ASYNC_DB_ENABLED
+from backend.core import catalog_snapshot, refresh_catalog, resource_validators, validator_headers, is_not_modified
+from backend.core.catalog_snapshot import CATALOG_RESOURCES
+from backend.functions import (get_catalog_rows_async, get_resource_versions_async,
+                               ListSpec, PageParams, page_params)
+from backend.db.query_budget import query_budget
+from backend.schemas import ProductDropDown, ProductCard, Page
 
 
 router = APIRouter(tags=["Products"])
 
-@router.get("/drop_down", response_model=list[ProductDropDown])
-def get_products_for_drop_down(db: Session = Depends(get_db)):
-    products = get_active_products(db=db)
-    return [
-        ProductDropDown(id_product=p.id_product, name=p.name)
-        for p in products
-    ]  
-
-@router.get("/list", response_model=List[ProductCard])
-def get_all_products(db: Session = Depends(get_db)):
-    products = db.query(Product).filter(Product.is_active == True).all()
-    
-    result = []
-    for p in products:
-        component_list = []
-
-        for pc in p.components_association: 
-            component_list.append(ComponentDetail(
-                name=pc.component.name,
-                quantity=pc.quantity
-            ))
-            
-        result.append(ProductCard(
-            id_product=p.id_product,
-            name=p.name,
-            description=p.description,
-            monthly_price=p.monthly_price,
-            components=component_list
-        ))
-    return result
\ No newline at end of file
+CATALOG_LIST = ListSpec(
+    sort_keys={"id": Product.id_product, "name": Product.name, "monthly_price": Product.monthly_price},
+    tiebreak=[Product.id_product]
+)
+
+def catalog_validators(request: Request, resource_versions):
+    return resource_validators(resource_versions, request.url.path, request.url.query)
+
+def not_modified_catalog(request: Request):
+    etag, last_modified = catalog_validators(request, catalog_snapshot.resource_versions)
+    if is_not_modified(request, etag, last_modified):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=validator_headers(etag, last_modified))
+
+def catalog_response(request: Request, snapshot):
+    version, body, resource_versions = snapshot
+    headers = validator_headers(*catalog_validators(request, resource_versions))
+    headers["X-Catalog-Version"] = str(version)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+def ensure_catalog(db: Session):
+    if not catalog_snapshot.is_fresh():
+        refresh_catalog(db)
+
+async def ensure_catalog_async(db: AsyncSession):
+    if not catalog_snapshot.is_fresh():
+        resource_versions = await get_resource_versions_async(db, CATALOG_RESOURCES)
+        catalog_snapshot.load(await get_catalog_rows_async(db), resource_versions)
+
+@query_budget(2)
+def get_products_for_drop_down(request: Request, db: Session = Depends(get_read_db)):
+    ensure_catalog(db)
+    return not_modified_catalog(request) or catalog_response(request, catalog_snapshot.drop_down())
+
+@query_budget(2)
+async def get_products_for_drop_down_async(request: Request, db: AsyncSession = Depends(get_async_read_db)):
+    await ensure_catalog_async(db)
+    return not_modified_catalog(request) or catalog_response(request, catalog_snapshot.drop_down())
+
+@query_budget(2)
+def get_all_products(request: Request, page: PageParams = Depends(page_params(CATALOG_LIST)),
+                     db: Session = Depends(get_read_db)):
+    ensure_catalog(db)
+    return not_modified_catalog(request) or catalog_response(request, catalog_snapshot.page(CATALOG_LIST, page))
+
+@query_budget(2)
+async def get_all_products_async(request: Request, page: PageParams = Depends(page_params(CATALOG_LIST)),
+                                 db: AsyncSession = Depends(get_async_read_db)):
+    await ensure_catalog_async(db)
+    return not_modified_catalog(request) or catalog_response(request, catalog_snapshot.page(CATALOG_LIST, page))
+
+router.add_api_route("/drop_down", get_products_for_drop_down_async if ASYNC_DB_ENABLED else get_products_for_drop_down,
+                     methods=["GET"], response_model=list[ProductDropDown])
+router.add_api_route("/list", get_all_products_async if ASYNC_DB_ENABLED else get_all_products,
+                     methods=["GET"], response_model=Page[ProductCard])
@@ -1,20 +1,79 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from sqlalchemy import select
 from sqlalchemy.orm import Session
-from backend.db.session import get_db
-from backend.core import operative_required
+from backend.db.session import get_db, get_read_db
+from backend.core import operative_required, refresh_catalog, conditional_response
 from backend.db.models import Product
-from backend.schemas import ProductMgmtOut, ProductMgmtUpdate
-from typing import List
+from backend.db.query_budget import query_budget
+from backend.schemas import ProductMgmtOut, ProductMgmtUpdate, ProductMarginOut, Page, BulkImportRequest, BulkImportReport
+from backend.functions import ListSpec, PageParams, page_params, paginate, get_resource_versions, bulk_import_products
+from decimal import Decimal
+from typing import Optional
 
 router = APIRouter(
     tags=["Products Management (Operative)"],
     dependencies=[Depends(operative_required)]
 )
 
-@router.get("/", response_model=List[ProductMgmtOut])
-def get_all_products(db: Session = Depends(get_db)):
-    products = db.query(Product).all()
-    return products
+PRODUCT_LIST = ListSpec(
+    sort_keys={"id": Product.id_product, "name": Product.name, "monthly_price": Product.monthly_price},
+    tiebreak=[Product.id_product]
+)
+
+MARGIN_LIST = ListSpec(
+    sort_keys={"margin": Product.margin, "cost": Product.cost, "monthly_price": Product.monthly_price,
+               "id": Product.id_product},
+    tiebreak=[Product.id_product],
+    default_sort="margin"
+)
+
+def margin_pct(margin: Decimal, monthly_price: Decimal) -> Optional[Decimal]:
+    if not monthly_price:
+        return None
+    return round(Decimal(margin) * 100 / Decimal(monthly_price), 2)
+
+@router.get("/", response_model=Page[ProductMgmtOut])
+@query_budget(3)
+def get_all_products(
+    request: Request,
+    response: Response,
+    page: PageParams = Depends(page_params(PRODUCT_LIST)),
+    is_active: Optional[bool] = None,
+    db: Session = Depends(get_read_db)
+):
+    not_modified = conditional_response(request, response, get_resource_versions(db, ["products"]))
+    if not_modified:
+        return not_modified
+    query = select(Product)
+    if is_active is not None:
+        query = query.where(Product.is_active == is_active)
+    return paginate(db, query, PRODUCT_LIST, page)
+
+@router.get("/margins", response_model=Page[ProductMarginOut])
+@query_budget(3)
+def get_product_margins(
+    request: Request,
+    response: Response,
+    page: PageParams = Depends(page_params(MARGIN_LIST)),
+    is_active: Optional[bool] = None,
+    max_margin: Optional[Decimal] = None,
+    db: Session = Depends(get_read_db)
+):
+    not_modified = conditional_response(request, response, get_resource_versions(db, ["products"]))
+    if not_modified:
+        return not_modified
+    query = select(Product.id_product, Product.name, Product.monthly_price, Product.cost,
+                   Product.margin, Product.is_active)
+    if is_active is not None:
+        query = query.where(Product.is_active == is_active)
+    if max_margin is not None:
+        query = query.where(Product.margin <= max_margin)
+    result = paginate(db, query, MARGIN_LIST, page, mappings=True)
+    result["items"] = [
+        ProductMarginOut(**row, margin_pct=margin_pct(row["margin"], row["monthly_price"]))
+        for row in result["items"]
+    ]
+    return result
 
 @router.post("/", response_model=ProductMgmtOut, status_code=status.HTTP_201_CREATED)
 def create_product(
@@ -29,6 +88,7 @@ def create_product(
     )
     db.add(db_product)
     db.commit()
+    refresh_catalog(db)
     db.refresh(db_product)
     return db_product
 
@@ -47,6 +107,7 @@ def update_product(
         setattr(db_product, key, value)
     
     db.commit()
+    refresh_catalog(db)
     db.refresh(db_product)
     return db_product
 
@@ -58,4 +119,13 @@ def delete_product(product_id: int, db: Session = Depends(get_db)):
     
     db.delete(db_product)
     db.commit()
-    return
\ No newline at end of file
+    refresh_catalog(db)
+    return
+
+
+@router.post("/bulk", response_model=BulkImportReport)
+def import_products(payload: BulkImportRequest, db: Session = Depends(get_db)):
+    report = bulk_import_products(db, payload.rows)
+    if report["created"] or report["updated"]:
+        refresh_catalog(db)
+    return report
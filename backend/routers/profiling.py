@@ -0,0 +1,24 @@
+from typing import List, Literal
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import PlainTextResponse, Response
+from backend.core import admin_required, request_profiler
+from backend.db.query_budget import query_budget
+from backend.schemas import ProfileSummaryOut
+
+router = APIRouter(tags=["Profiling (Admin)"], dependencies=[Depends(admin_required)])
+
+@router.get("", response_model=List[ProfileSummaryOut])
+@query_budget(1)
+def get_profiles():
+    return request_profiler.list_reports()
+
+@router.get("/{profile_id}")
+@query_budget(1)
+def get_profile(profile_id: str, format: Literal["json", "folded"] = "json"):
+    report = request_profiler.read(profile_id, format)
+    if report is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found")
+    if format == "folded":
+        return PlainTextResponse(report, headers={"Content-Disposition": f'attachment; filename="{profile_id}.folded"'})
+    return Response(report, media_type="application/json",
+                    headers={"Content-Disposition": f'attachment; filename="{profile_id}.json"'})
@@ -1,8 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from backend.db.session import get_db
-from backend.core import get_current_user
+from backend.db.session import get_db, get_read_db, get_async_read_db, ASYNC_DB_ENABLED
+from backend.core import get_current_user, get_current_user_async, conditional_response
+from backend.functions import (get_active_product_ids, get_active_product_ids_async,
+                               get_resource_versions, get_resource_versions_async)
 from backend.db.models import Subscription, SubscriptionStatus
+from backend.db.query_budget import query_budget
 from backend.schemas import SubscriptionOut, SubscriptionCreate
 from datetime import date
 from typing import List
@@ -39,15 +43,31 @@ def create_subscription(
     
     return db_sub
 
-@router.get("/my-active-ids", response_model=List[int])
+@query_budget(3)
 def get_my_active_subscription_ids(
-    db: Session = Depends(get_db),
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_read_db),
     current_user = Depends(get_current_user)
 ):
+    not_modified = conditional_response(request, response, get_resource_versions(db, ["subscriptions"]),
+                                        current_user.id_user)
+    if not_modified:
+        return not_modified
+    return get_active_product_ids(db, user_id=current_user.id_user)
 
-    active_subs = db.query(Subscription.id_product).filter(
-        Subscription.id_user == current_user.id_user,
-        Subscription.status == SubscriptionStatus.Active
-    ).all()
-    
-    return [sub[0] for sub in active_subs]
\ No newline at end of file
+@query_budget(3)
+async def get_my_active_subscription_ids_async(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user = Depends(get_current_user_async)
+):
+    not_modified = conditional_response(request, response, await get_resource_versions_async(db, ["subscriptions"]),
+                                        current_user.id_user)
+    if not_modified:
+        return not_modified
+    return await get_active_product_ids_async(db, user_id=current_user.id_user)
+
+router.add_api_route("/my-active-ids", get_my_active_subscription_ids_async if ASYNC_DB_ENABLED else get_my_active_subscription_ids,
+                     methods=["GET"], response_model=List[int])
\ No newline at end of file
@@ -1,10 +1,18 @@
 from fastapi import APIRouter, Depends
-from backend.core import get_current_user
+from backend.core import get_current_user, get_current_user_async
+from backend.db.session import ASYNC_DB_ENABLED
+from backend.db.query_budget import query_budget
 from backend.schemas import UserOut
 
 router = APIRouter(tags=["Users"])
 
-@router.get("/me", response_model=UserOut)
+@query_budget(1)
 def read_current_user(current_user = Depends(get_current_user)):
     return current_user
-    
\ No newline at end of file
+
+@query_budget(1)
+async def read_current_user_async(current_user = Depends(get_current_user_async)):
+    return current_user
+
+router.add_api_route("/me", read_current_user_async if ASYNC_DB_ENABLED else read_current_user,
+                     methods=["GET"], response_model=UserOut)
\ No newline at end of file
@@ -1,14 +1,15 @@
 from .user import ( UserCreate, UserOut,
                     ClientCreate, ClientUpdate,)
 
-from .auth import Token, TokenData
+from .auth import Token, TokenData, RefreshRequest
 
 from .campaigns import (CampaignOut, CampaignCreate,
-                        AdminCampaignOut, AdminCampaignUpdate,)
+                        AdminCampaignOut, AdminCampaignUpdate,
+                        CampaignBulkFilter, AdminCampaignBulkUpdate, AdminCampaignBulkResult,)
 
 from .products import (ProductCard, ProductDropDown, 
                        ComponentDetail, ProductMgmtCreate, 
-                       ProductMgmtOut, ProductMgmtUpdate,)
+                       ProductMgmtOut, ProductMgmtUpdate, ProductMarginOut,)
 
 from .subscriptions import SubscriptionCreate, SubscriptionOut
 
@@ -17,3 +18,10 @@ from .components import (ComponentCreate, ComponentOut,
 
 from .packages import (PackageCreate, PackageOut,
                        PackageUpdate,)
+
+from .system import PoolStatsOut, DatabasePoolsOut, ProfileSummaryOut
+
+from .pagination import Page
+
+from .bulk import BulkImportRequest, BulkRowResult, BulkImportReport
+from .metrics import ProductMetricsOut, MetricsSummaryOut
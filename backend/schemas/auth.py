@@ -4,7 +4,11 @@ from typing import Optional
 class Token(BaseModel):
     access_token: str
     token_type: str
+    refresh_token: Optional[str] = None
 
 class TokenData(BaseModel):
     id_user: Optional[int] = None
-    role: Optional[str] = None
\ No newline at end of file
+    role: Optional[str] = None
+
+class RefreshRequest(BaseModel):
+    refresh_token: str
\ No newline at end of file
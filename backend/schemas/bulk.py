@@ -0,0 +1,17 @@
+from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Literal, Optional
+
+class BulkImportRequest(BaseModel):
+    rows: List[Dict[str, Any]] = Field(..., min_length=1)
+
+class BulkRowResult(BaseModel):
+    index: int
+    status: Literal["created", "updated", "error"]
+    id: Optional[int] = None
+    detail: Optional[str] = None
+
+class BulkImportReport(BaseModel):
+    created: int
+    updated: int
+    failed: int
+    results: List[BulkRowResult]
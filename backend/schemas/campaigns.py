@@ -1,6 +1,6 @@
 from backend.db.models import CampaignStatus
-from typing import Optional
-from pydantic import BaseModel
+from typing import List, Optional
+from pydantic import BaseModel, Field, model_validator
 from datetime import date
 
 class CampaignOut(BaseModel):
@@ -38,4 +38,37 @@ class AdminCampaignUpdate(BaseModel):
     name: Optional[str] = None
     status: Optional[CampaignStatus] = None
     start_date: Optional[date] = None
-    end_date: Optional[date] = None
\ No newline at end of file
+    end_date: Optional[date] = None
+
+class CampaignBulkFilter(BaseModel):
+    status: Optional[CampaignStatus] = None
+    client_id: Optional[int] = None
+    product_id: Optional[int] = None
+    date_from: Optional[date] = None
+    date_to: Optional[date] = None
+
+    @model_validator(mode="after")
+    def check_not_empty(self):
+        if all(value is None for value in self.model_dump().values()):
+            raise ValueError("filter needs at least one criterion")
+        return self
+
+class AdminCampaignBulkUpdate(BaseModel):
+    ids: Optional[List[int]] = Field(None, min_length=1)
+    filter: Optional[CampaignBulkFilter] = None
+    status: Optional[CampaignStatus] = None
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+
+    @model_validator(mode="after")
+    def check_target_and_changes(self):
+        if (self.ids is None) == (self.filter is None):
+            raise ValueError("Provide exactly one of ids or filter")
+        if self.status is None and self.start_date is None and self.end_date is None:
+            raise ValueError("Nothing to update")
+        if self.start_date and self.end_date and self.start_date > self.end_date:
+            raise ValueError("start_date must not be after end_date")
+        return self
+
+class AdminCampaignBulkResult(BaseModel):
+    updated: int
@@ -0,0 +1,17 @@
+from pydantic import BaseModel
+from typing import Dict, List, Optional
+from decimal import Decimal
+from datetime import datetime
+
+class ProductMetricsOut(BaseModel):
+    id_product: int
+    name: str
+    active_subscriptions: int
+    mrr: Decimal
+
+class MetricsSummaryOut(BaseModel):
+    mrr: Decimal
+    active_subscriptions: int
+    campaigns_by_status: Dict[str, int]
+    subscriptions_by_product: List[ProductMetricsOut]
+    updated_at: Optional[datetime] = None
@@ -27,6 +27,20 @@ class ProductMgmtOut(BaseModel):
     description: Optional[str] = None
     monthly_price: Decimal
     is_active: bool
+    cost: Decimal = Decimal(0)
+    margin: Decimal = Decimal(0)
+
+    class Config:
+        from_attributes = True
+
+class ProductMarginOut(BaseModel):
+    id_product: int
+    name: str
+    monthly_price: Decimal
+    cost: Decimal
+    margin: Decimal
+    margin_pct: Optional[Decimal] = None
+    is_active: bool
 
     class Config:
         from_attributes = True
@@ -0,0 +1,30 @@
+from pydantic import BaseModel
+from typing import Optional, List
+from datetime import datetime
+
+class PoolStatsOut(BaseModel):
+    pool_class: str
+    size: Optional[int] = None
+    checked_in: Optional[int] = None
+    checked_out: Optional[int] = None
+    overflow: Optional[int] = None
+    checkouts: Optional[int] = None
+    timeouts: Optional[int] = None
+    wait_total_ms: Optional[float] = None
+    wait_avg_ms: Optional[float] = None
+    wait_max_ms: Optional[float] = None
+
+class DatabasePoolsOut(BaseModel):
+    primary: PoolStatsOut
+    primary_async: Optional[PoolStatsOut] = None
+    replicas: List[PoolStatsOut] = []
+    replicas_async: List[PoolStatsOut] = []
+
+class ProfileSummaryOut(BaseModel):
+    id: str
+    method: str
+    path: str
+    status_code: int
+    started_at: datetime
+    duration_ms: float
+    samples: int
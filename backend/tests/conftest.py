@@ -0,0 +1,135 @@
+import os
+import tempfile
+import pytest
+from sqlalchemy import text
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///" + os.path.join(tempfile.gettempdir(), "cloud_chaser_test.db"))
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "30")
+os.environ.setdefault("HASH_POOL_WORKERS", "0")
+os.environ.setdefault("LAST_LOGIN_FLUSH_INTERVAL_SECONDS", "3600")
+
+PASSWORD = "tEst123!"
+
+
+@pytest.fixture
+def db():
+    from backend.db.base import Base
+    from backend.db.session import engine, SessionLocal
+    from backend.core import principal_cache, catalog_snapshot, rate_limit_store
+
+    Base.metadata.drop_all(bind=engine)
+    with engine.begin() as connection:
+        connection.execute(text("DROP TABLE IF EXISTS alembic_version"))
+    Base.metadata.create_all(bind=engine)
+    principal_cache.clear()
+    catalog_snapshot.clear()
+    rate_limit_store.clear()
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def client(db):
+    from fastapi.testclient import TestClient
+    from backend.main import app
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+# Routers pick the async or sync handler for their hot read routes at import time (ASYNC_DB_ENABLED), so each
+# variant gets its own app built from freshly imported router modules.
+HOT_ROUTER_MODULES = ("backend.routers.users", "backend.routers.campaigns", "backend.routers.products",
+                      "backend.routers.subscriptions")
+
+
+@pytest.fixture(params=["async", "sync"])
+def hot_client(request, db, monkeypatch):
+    import importlib
+    from fastapi.testclient import TestClient
+    from backend.db import session
+    from backend.main import create_app
+
+    if request.param == "async" and session.async_engine is None:
+        pytest.skip("ASYNC_DB_ENABLED=false: there is no async engine")
+    modules = [importlib.import_module(name) for name in HOT_ROUTER_MODULES]
+    monkeypatch.setattr(session, "ASYNC_DB_ENABLED", request.param == "async")
+    try:
+        for module in modules:
+            importlib.reload(module)
+        with TestClient(create_app()) as test_client:
+            yield test_client
+    finally:
+        monkeypatch.undo()
+        for module in modules:
+            importlib.reload(module)
+
+
+@pytest.fixture
+def make_user(db):
+    from backend.core.hashing import pwd_context
+    from backend.db.models import User
+
+    def _make_user(email="client@example.com", role="CLIENT", password=PASSWORD):
+        user = User(name=email.split("@")[0], email=email, password_hash=pwd_context.hash(password), role=role)
+        db.add(user)
+        db.commit()
+        db.refresh(user)
+        return user
+
+    return _make_user
+
+
+@pytest.fixture
+def login(client):
+    def _login(email="client@example.com", password=PASSWORD):
+        response = client.post("/login", data={"username": email, "password": password})
+        assert response.status_code == 200, response.text
+        return response.json()
+
+    return _login
+
+
+@pytest.fixture
+def auth_headers(login):
+    def _auth_headers(email="client@example.com", password=PASSWORD):
+        return {"Authorization": f"Bearer {login(email, password)['access_token']}"}
+
+    return _auth_headers
+
+
+@pytest.fixture
+def catalog(db, make_user):
+    from datetime import date
+    from backend.db.models import Product, Component, ProductComponent, Subscription, Campaign
+
+    client_user = make_user()
+    components = [
+        Component(name="Social Media Post", component_type="Post", unit_cost=10),
+        Component(name="Analytics Report", component_type="Report", unit_cost=50),
+    ]
+    products = [
+        Product(name="Growth Package", description="Grow", monthly_price=199, is_active=True),
+        Product(name="Starter Package", description="Start", monthly_price=99, is_active=True),
+        Product(name="Legacy Package", description="Old", monthly_price=49, is_active=False),
+    ]
+    db.add_all(components + products)
+    db.flush()
+    for product in products:
+        for quantity, component in enumerate(components, start=1):
+            db.add(ProductComponent(id_product=product.id_product, id_component=component.id_component, quantity=quantity))
+    subscription = Subscription(id_user=client_user.id_user, id_product=products[0].id_product, start_date=date(2026, 1, 1))
+    db.add(subscription)
+    db.flush()
+    db.add_all([
+        Campaign(id_subscription=subscription.id_subscription, name=f"Campaign {i}",
+                 start_date=date(2026, 2, i + 1), end_date=date(2026, 3, i + 1))
+        for i in range(3)
+    ])
+    db.commit()
+    return {"client": client_user, "products": products, "components": components, "subscription": subscription}
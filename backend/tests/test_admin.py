@@ -0,0 +1,119 @@
+def test_pool_stats_are_admin_only(client, make_user, auth_headers):
+    make_user()
+    assert client.get("/admin/db/pool", headers=auth_headers()).status_code == 403
+
+def test_pool_stats(client, make_user, auth_headers):
+    make_user("admin@example.com", role="ADMIN")
+    response = client.get("/admin/db/pool", headers=auth_headers("admin@example.com"))
+    assert response.status_code == 200
+    stats = response.json()
+    assert stats["primary"]["pool_class"] == "InstrumentedQueuePool"
+    assert stats["primary"]["checked_out"] >= 1
+    assert stats["primary"]["checkouts"] >= 1
+
+def test_admin_campaigns_cursor_pagination(client, catalog, make_user, auth_headers):
+    make_user("admin@example.com", role="ADMIN")
+    headers = auth_headers("admin@example.com")
+
+    first = client.get("/admin/campaigns", params={"limit": 2}, headers=headers)
+    assert first.status_code == 200
+    page = first.json()
+    assert [c["name"] for c in page["items"]] == ["Campaign 0", "Campaign 1"]
+    assert page["items"][0]["client_email"] == "client@example.com"
+    assert page["items"][0]["product_name"] == "Growth Package"
+
+    second = client.get("/admin/campaigns", params={"limit": 2, "cursor": page["next_cursor"]}, headers=headers)
+    assert [c["name"] for c in second.json()["items"]] == ["Campaign 2"]
+    assert second.json()["next_cursor"] is None
+
+def test_campaigns_filters(client, catalog, make_user, auth_headers):
+    admin = make_user("admin@example.com", role="ADMIN")
+    headers = auth_headers("admin@example.com")
+
+    def names(**params):
+        response = client.get("/admin/campaigns", params=params, headers=headers)
+        assert response.status_code == 200
+        return [c["name"] for c in response.json()["items"]]
+
+    assert len(names(status="Pending")) == 3
+    assert names(status="Active") == []
+    assert len(names(client_id=catalog["client"].id_user)) == 3
+    assert names(client_id=admin.id_user) == []
+    assert names(date_to="2026-02-01") == ["Campaign 0"]
+    assert names(date_from="2026-03-03") == ["Campaign 2"]
+    assert client.get("/admin/campaigns", params={"status": "Bogus"}, headers=headers).status_code == 422
+
+def test_bulk_campaign_update_by_filter_is_one_statement(client, catalog, make_user, auth_headers):
+    from backend.db.query_budget import QueryCounter
+    from backend.db.session import engine
+    make_user("admin@example.com", role="ADMIN")
+    headers = auth_headers("admin@example.com")
+    product_id = catalog["products"][0].id_product
+
+    with QueryCounter(engine) as counter:
+        response = client.patch("/admin/campaigns", headers=headers, json={
+            "filter": {"status": "Pending", "product_id": product_id, "date_to": "2026-02-02"},
+            "status": "On Hold",
+        })
+    assert response.status_code == 200
+    assert response.json() == {"updated": 2}
+    assert len([s for s, _, _ in counter.statements if s.startswith("UPDATE campaigns")]) == 1
+
+    on_hold = client.get("/admin/campaigns", params={"status": "On Hold"}, headers=headers).json()["items"]
+    assert [c["name"] for c in on_hold] == ["Campaign 0", "Campaign 1"]
+    other_product = {"filter": {"product_id": catalog["products"][1].id_product}, "status": "Active"}
+    assert client.patch("/admin/campaigns", headers=headers, json=other_product).json() == {"updated": 0}
+
+def test_bulk_campaign_update_by_ids_and_validation(client, catalog, make_user, auth_headers):
+    make_user("admin@example.com", role="ADMIN")
+    headers = auth_headers("admin@example.com")
+    ids = [c["id_campaign"] for c in client.get("/admin/campaigns", headers=headers).json()["items"]]
+
+    response = client.patch("/admin/campaigns", headers=headers,
+                            json={"ids": ids[:2] + [999999], "end_date": "2026-12-31"})
+    assert response.json() == {"updated": 2}
+    dates = {c["id_campaign"]: c["end_date"] for c in client.get("/admin/campaigns", headers=headers).json()["items"]}
+    assert dates[ids[0]] == dates[ids[1]] == "2026-12-31"
+    assert dates[ids[2]] == "2026-03-03"
+
+    conflict = client.patch("/admin/campaigns", headers=headers, json={"ids": ids, "start_date": "2026-03-05"})
+    assert conflict.status_code == 409
+    assert client.patch("/admin/campaigns", headers=headers, json={"status": "Active"}).status_code == 422
+    assert client.patch("/admin/campaigns", headers=headers, json={"filter": {}, "status": "Active"}).status_code == 422
+    assert client.patch("/admin/campaigns", headers=headers, json={"ids": ids}).status_code == 422
+    assert client.patch("/admin/campaigns", headers=auth_headers(), json={"ids": ids, "status": "Active"}).status_code == 403
+
+def test_bulk_campaign_check_violation_from_mysql_is_409(client, catalog, make_user, auth_headers, monkeypatch):
+    from sqlalchemy.exc import OperationalError
+    from sqlalchemy.orm import Session
+    from backend.functions import campaign as campaign_functions
+    make_user("admin@example.com", role="ADMIN")
+    headers = auth_headers("admin@example.com")
+    execute = Session.execute
+
+    def execute_with_mysql_check(self, statement, *args, **kwargs):
+        if getattr(statement, "is_update", False) and statement.table.name == "campaigns":
+            raise OperationalError("UPDATE campaigns", {}, Exception(
+                3819, "Check constraint 'chk_campaign_dates' is violated."))
+        return execute(self, statement, *args, **kwargs)
+
+    monkeypatch.setattr(campaign_functions, "date_conflict_criterion", lambda values: None)
+    monkeypatch.setattr(Session, "execute", execute_with_mysql_check)
+    response = client.patch("/admin/campaigns", headers=headers, json={"filter": {"status": "Pending"},
+                                                                       "start_date": "2027-01-01"})
+    assert response.status_code == 409
+
+def test_deleted_client_is_dropped_from_another_workers_principal_cache(client, make_user, auth_headers, monkeypatch):
+    from backend.core import principal_cache
+    make_user("admin@example.com", role="ADMIN")
+    client_user = make_user()
+    admin_headers = auth_headers("admin@example.com")
+    headers = auth_headers()
+    assert client.get("/users/me", headers=headers).status_code == 200
+    assert client.get("/users/me", headers=headers).status_code == 200
+
+    # Another worker never sees invalidate_user; only the shared principals version tells it to drop the entry.
+    monkeypatch.setattr(principal_cache, "invalidate_user", lambda user_id: None)
+    monkeypatch.setattr(principal_cache, "recheck_seconds", 0)
+    assert client.delete(f"/admin/clients/{client_user.id_user}", headers=admin_headers).status_code == 204
+    assert client.get("/users/me", headers=headers).status_code == 401
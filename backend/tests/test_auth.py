@@ -0,0 +1,75 @@
+def test_login_returns_refresh_token(client, make_user, login):
+    make_user()
+    tokens = login()
+    assert tokens["refresh_token"]
+    response = client.get("/users/me", headers={"Authorization": f"Bearer {tokens['access_token']}"})
+    assert response.status_code == 200
+    assert response.json()["email"] == "client@example.com"
+
+def test_refresh_rotates_tokens(client, make_user, login):
+    make_user()
+    tokens = login()
+    response = client.post("/refresh", json={"refresh_token": tokens["refresh_token"]})
+    assert response.status_code == 200
+    rotated = response.json()
+    assert rotated["refresh_token"] != tokens["refresh_token"]
+    assert client.get("/users/me", headers={"Authorization": f"Bearer {rotated['access_token']}"}).status_code == 200
+
+def test_refresh_token_reuse_revokes_family(client, make_user, login):
+    make_user()
+    tokens = login()
+    rotated = client.post("/refresh", json={"refresh_token": tokens["refresh_token"]}).json()
+    assert client.post("/refresh", json={"refresh_token": tokens["refresh_token"]}).status_code == 401
+    assert client.post("/refresh", json={"refresh_token": rotated["refresh_token"]}).status_code == 401
+
+def test_logout_revokes_refresh_token(client, make_user, login):
+    make_user()
+    tokens = login()
+    assert client.post("/logout", json={"refresh_token": tokens["refresh_token"]}).status_code == 204
+    assert client.post("/refresh", json={"refresh_token": tokens["refresh_token"]}).status_code == 401
+
+def test_refresh_token_is_not_an_access_token(client, make_user, login):
+    make_user()
+    tokens = login()
+    response = client.get("/users/me", headers={"Authorization": f"Bearer {tokens['refresh_token']}"})
+    assert response.status_code == 401
+
+def test_last_login_is_written_behind(client, db, make_user, login):
+    from backend.core import last_login_writer
+    user = make_user()
+    login()
+    db.refresh(user)
+    assert user.last_login_at is None
+    assert last_login_writer.flush() == 1
+    db.refresh(user)
+    assert user.last_login_at is not None
+
+def test_login_flood_is_rejected_before_lookup_and_hashing(client, make_user, monkeypatch):
+    from backend.core import login_admission, password_hasher
+    make_user()
+    for _ in range(login_admission.per_email):
+        response = client.post("/login", data={"username": "client@example.com", "password": "wrong"})
+        assert response.status_code == 401
+
+    def fail(*args, **kwargs):
+        raise AssertionError("limited login reached the database or the hasher")
+    monkeypatch.setattr("backend.routers.auth.get_user_by_email", fail)
+    monkeypatch.setattr(password_hasher, "verify", fail)
+    response = client.post("/login", data={"username": "Client@Example.com", "password": "tEst123!"})
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) >= 1
+
+def test_login_limit_is_per_ip():
+    from backend.core.rate_limit import AdmissionControl, MemoryRateLimitStore
+    admission = AdmissionControl(MemoryRateLimitStore(max_keys=100), "login", 60, per_ip=2, per_email=0)
+    assert admission.admit("10.0.0.1", "a@example.com")[0]
+    assert admission.admit("10.0.0.1", "b@example.com")[0]
+    assert not admission.admit("10.0.0.1", "c@example.com")[0]
+    assert admission.admit("10.0.0.2", "c@example.com")[0]
+
+def test_register_is_rate_limited(client):
+    from backend.core import register_admission
+    for _ in range(register_admission.per_email):
+        client.post("/register", json={"name": "new", "email": "new@example.com", "password": "tEst123!"})
+    response = client.post("/register", json={"name": "new", "email": "NEW@example.com", "password": "tEst123!"})
+    assert response.status_code == 429
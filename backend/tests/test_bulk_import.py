@@ -0,0 +1,110 @@
+import pytest
+from sqlalchemy import select
+
+from backend.db.models import Component, ProductComponent
+
+
+@pytest.fixture
+def operative_headers(make_user, auth_headers):
+    make_user("operative@example.com", role="OPERATIVE")
+    return auth_headers("operative@example.com")
+
+
+def test_components_bulk_creates_updates_and_reports_bad_rows(client, catalog, operative_headers, db):
+    existing = catalog["components"][0]
+    rows = [
+        {"name": "Video", "component_type": "Media", "unit_cost": "120.5"},
+        {"id_component": existing.id_component, "unit_cost": 15},
+        {"name": "Missing cost", "component_type": "Post"},
+        {"id_component": 999999, "name": "Ghost"},
+        {"name": "Banner", "component_type": "Ad", "unit_cost": 30, "description": "Static"},
+    ]
+    response = client.post("/components-management/bulk", json={"rows": rows}, headers=operative_headers)
+    assert response.status_code == 200
+    report = response.json()
+    assert (report["created"], report["updated"], report["failed"]) == (2, 1, 2)
+    assert [result["status"] for result in report["results"]] == ["created", "updated", "error", "error", "created"]
+    assert "unit_cost" in report["results"][2]["detail"]
+    assert "not found" in report["results"][3]["detail"]
+
+    db.expire_all()
+    assert db.get(Component, existing.id_component).unit_cost == 15
+    assert db.get(Component, existing.id_component).name == "Social Media Post"
+    assert report["results"][1]["id"] == existing.id_component
+    assert db.execute(select(Component.description).where(Component.name == "Banner")).scalar_one() == "Static"
+    created = dict(db.execute(select(Component.name, Component.id_component)
+                              .where(Component.name.in_(["Video", "Banner"]))).all())
+    assert (report["results"][0]["id"], report["results"][4]["id"]) == (created["Video"], created["Banner"])
+
+
+def test_failed_chunk_is_rolled_back_and_reported(db, catalog):
+    rows = [{"name": f"Item {i}", "component_type": "Post", "unit_cost": 1} for i in range(4)]
+    rows[3]["name"] = "x" * 500 if db.get_bind().dialect.name == "mysql" else None
+    rows.append({"id_component": catalog["components"][0].id_component, "name": None})
+
+    from backend.functions import bulk_import as module
+    report = module.bulk_upsert_entities(db, Component, Component.id_component, rows,
+                                         module.ComponentCreate, module.ComponentUpdate, chunk_size=2)
+    assert [result["status"] for result in report["results"]] == ["created", "created", "error", "error", "error"]
+    assert report["results"][4]["detail"].startswith("Database error")
+    assert db.execute(select(Component).where(Component.name.like("Item %"))).scalars().all()[-1].name == "Item 1"
+
+
+def test_products_bulk_import(client, catalog, operative_headers):
+    product = catalog["products"][2]
+    rows = [
+        {"name": "Scale Package", "description": "Scale", "monthly_price": 499},
+        {"id_product": product.id_product, "is_active": True},
+    ]
+    report = client.post("/products-management/bulk", json={"rows": rows}, headers=operative_headers).json()
+    assert (report["created"], report["updated"], report["failed"]) == (1, 1, 0)
+    cards = {card["name"]: card for card in client.get("/products/list").json()["items"]}
+    assert "Legacy Package" in cards
+    assert report["results"][0]["id"] == cards["Scale Package"]["id_product"]
+
+
+def test_packages_bulk_upserts_links(client, catalog, operative_headers, db):
+    product, component = catalog["products"][0], catalog["components"][0]
+    fresh = Component(name="Email", component_type="Post", unit_cost=5)
+    db.add(fresh)
+    db.commit()
+    rows = [
+        {"id_product": product.id_product, "id_component": component.id_component, "quantity": 9},
+        {"id_product": product.id_product, "id_component": fresh.id_component, "quantity": 2},
+        {"id_product": product.id_product, "id_component": fresh.id_component, "quantity": 3},
+        {"id_product": 999999, "id_component": component.id_component, "quantity": 1},
+        {"id_product": product.id_product, "id_component": component.id_component},
+    ]
+    report = client.post("/packages-management/bulk", json={"rows": rows}, headers=operative_headers).json()
+    assert [result["status"] for result in report["results"]] == ["updated", "created", "error", "error", "error"]
+    assert report["results"][2]["detail"] == "Duplicate of row 1"
+
+    db.expire_all()
+    link = db.get(ProductComponent, (product.id_product, component.id_component))
+    assert link.quantity == 9
+    assert db.get(ProductComponent, (product.id_product, fresh.id_component)).quantity == 2
+
+
+def test_bulk_requires_operative_and_limits_rows(client, catalog, auth_headers, operative_headers, monkeypatch):
+    from backend.functions import bulk_import
+    monkeypatch.setattr(bulk_import, "BULK_IMPORT_MAX_ROWS", 2)
+    row = {"name": "A", "component_type": "Post", "unit_cost": 1}
+    too_many = client.post("/components-management/bulk", json={"rows": [row] * 3}, headers=operative_headers)
+    assert too_many.status_code == 413
+    assert client.post("/components-management/bulk", json={"rows": [row]}, headers=auth_headers()).status_code == 403
+    assert client.post("/components-management/bulk", json={"rows": []}, headers=operative_headers).status_code == 422
+
+
+def test_bulk_import_uses_chunked_multi_row_statements(db, catalog):
+    from backend.db.query_budget import QueryCounter
+    from backend.db.session import engine
+    from backend.functions import bulk_import_components
+    rows = [{"name": f"Bulk {i}", "component_type": "Post", "unit_cost": i} for i in range(1200)]
+    with QueryCounter(engine) as counter:
+        report = bulk_import_components(db, rows)
+    assert report["created"] == 1200
+    ids = dict(db.execute(select(Component.name, Component.id_component)
+                          .where(Component.name.like("Bulk %"))).all())
+    assert [result["id"] for result in report["results"]] == [ids[f"Bulk {i}"] for i in range(1200)]
+    inserts = [statement for statement, _, _ in counter.statements if statement.startswith("INSERT")]
+    assert len(inserts) == 3
@@ -0,0 +1,50 @@
+from backend.core import catalog_snapshot
+from backend.db.query_budget import QueryCounter
+from backend.db.session import engine, async_engine
+
+
+def test_catalog_reads_are_served_from_the_snapshot(client, catalog):
+    first = client.get("/products/list")
+    assert first.status_code == 200
+
+    with QueryCounter(engine, async_engine) as counter:
+        again = client.get("/products/list")
+        drop_down = client.get("/products/drop_down")
+        second_page = client.get("/products/list", params={"limit": 1, "sort": "-name"})
+    assert counter.count == 0, counter.report()
+    assert again.content == first.content
+    assert again.headers["X-Catalog-Version"] == first.headers["X-Catalog-Version"]
+    assert [p["name"] for p in drop_down.json()] == ["Growth Package", "Starter Package"]
+    assert [p["name"] for p in second_page.json()["items"]] == ["Starter Package"]
+
+def test_snapshot_pages_follow_cursors(client, catalog):
+    page = client.get("/products/list", params={"limit": 1, "sort": "monthly_price"}).json()
+    assert [p["name"] for p in page["items"]] == ["Starter Package"]
+    page = client.get("/products/list", params={"limit": 1, "sort": "monthly_price", "cursor": page["next_cursor"]}).json()
+    assert [p["name"] for p in page["items"]] == ["Growth Package"]
+    assert page["next_cursor"] is None
+
+def test_catalog_writes_rebuild_the_snapshot(client, catalog, make_user, auth_headers):
+    make_user("operative@example.com", role="OPERATIVE")
+    headers = auth_headers("operative@example.com")
+    version = client.get("/products/list").headers["X-Catalog-Version"]
+
+    starter = catalog["products"][1]
+    response = client.put(f"/products-management/{starter.id_product}", json={"is_active": False}, headers=headers)
+    assert response.status_code == 200
+
+    products = client.get("/products/list")
+    assert int(products.headers["X-Catalog-Version"]) > int(version)
+    assert [p["name"] for p in products.json()["items"]] == ["Growth Package"]
+
+    component = catalog["components"][0]
+    client.put(f"/components-management/{component.id_component}", json={"name": "Reel"}, headers=headers)
+    growth = client.get("/products/list").json()["items"][0]
+    assert [c["name"] for c in growth["components"]] == ["Reel", "Analytics Report"]
+
+def test_stale_snapshot_is_rebuilt_after_ttl(client, catalog, monkeypatch):
+    client.get("/products/list")
+    monkeypatch.setattr(catalog_snapshot, "ttl_seconds", 0)
+    with QueryCounter(engine, async_engine) as counter:
+        client.get("/products/list")
+    assert counter.count == 2
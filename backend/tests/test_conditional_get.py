@@ -0,0 +1,139 @@
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import update
+from backend.db.models import ResourceVersion
+from backend.db.query_budget import QueryCounter
+from backend.db.session import engine, async_engine
+
+
+def age_versions(seconds=60):
+    now = datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0)
+    with engine.begin() as connection:
+        connection.execute(update(ResourceVersion).values(updated_at=now - timedelta(seconds=seconds)))
+
+
+def test_catalog_revalidates_without_touching_the_database(client, catalog):
+    first = client.get("/products/list")
+    etag = first.headers["ETag"]
+
+    with QueryCounter(engine, async_engine) as counter:
+        response = client.get("/products/list", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+    assert counter.count == 0
+
+    other_page = client.get("/products/list", params={"sort": "name"}, headers={"If-None-Match": etag})
+    assert other_page.status_code == 200
+
+def test_components_not_modified_skips_the_list_query(client, catalog, make_user, auth_headers):
+    make_user("operative@example.com", role="OPERATIVE")
+    headers = auth_headers("operative@example.com")
+    etag = client.get("/components-management/", headers=headers).headers["ETag"]
+
+    with QueryCounter(engine, async_engine) as counter:
+        response = client.get("/components-management/", headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 304
+    assert not any("FROM components" in statement for statement, _, _ in counter.statements)
+
+    component = catalog["components"][0]
+    client.put(f"/components-management/{component.id_component}", json={"unit_cost": 12}, headers=headers)
+    changed = client.get("/components-management/", headers={**headers, "If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+
+def test_campaign_etag_changes_on_write_and_is_per_user(client, catalog, make_user, auth_headers):
+    headers = auth_headers()
+    first = client.get("/campaigns/", headers=headers)
+    etag = first.headers["ETag"]
+    assert client.get("/campaigns/", headers={**headers, "If-None-Match": etag}).status_code == 304
+
+    make_user("other@example.com")
+    other = client.get("/campaigns/", headers={**auth_headers("other@example.com"), "If-None-Match": etag})
+    assert other.status_code == 200
+
+    created = client.post("/campaigns/", headers=headers, json={
+        "name": "Launch", "id_product": catalog["products"][0].id_product,
+        "start_date": "2026-05-01", "end_date": "2026-06-01",
+    })
+    assert created.status_code == 200
+    assert client.get("/campaigns/", headers={**headers, "If-None-Match": etag}).status_code == 200
+
+def test_bulk_deletes_bump_versions(client, catalog, make_user, auth_headers):
+    headers = auth_headers()
+    etag = client.get("/subscriptions/my-active-ids", headers=headers).headers["ETag"]
+
+    make_user("admin@example.com", role="ADMIN")
+    admin_headers = auth_headers("admin@example.com")
+    other = make_user("other@example.com")
+    client.delete(f"/admin/clients/{other.id_user}", headers=admin_headers)
+
+    response = client.get("/subscriptions/my-active-ids", headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 200
+
+def test_if_modified_since(client, catalog, auth_headers):
+    headers = auth_headers()
+    age_versions()
+    last_modified = client.get("/subscriptions/my-active-ids", headers=headers).headers["Last-Modified"]
+    response = client.get("/subscriptions/my-active-ids", headers={**headers, "If-Modified-Since": last_modified})
+    assert response.status_code == 304
+    stale = client.get("/subscriptions/my-active-ids",
+                       headers={**headers, "If-Modified-Since": "Mon, 01 Jan 2001 00:00:00 GMT"})
+    assert stale.status_code == 200
+
+def test_last_modified_is_withheld_until_its_second_is_over(client, catalog, auth_headers):
+    headers = auth_headers()
+    fresh = client.get("/subscriptions/my-active-ids", headers=headers)
+    assert "Last-Modified" not in fresh.headers
+    assert fresh.headers["ETag"]
+
+    # A Last-Modified from the current second could match a later write in the same second and answer a stale 304.
+    age_versions(0)
+    future = "Fri, 01 Jan 2100 00:00:00 GMT"
+    response = client.get("/subscriptions/my-active-ids", headers={**headers, "If-Modified-Since": future})
+    assert response.status_code == 200
+    assert "Last-Modified" not in response.headers
+
+def test_versions_bump_at_the_end_of_the_writer_transaction(db, catalog, monkeypatch):
+    from sqlalchemy import select
+    from backend.db import versioning
+    from backend.db.models import Component
+    from backend.db.session import SessionLocal
+
+    def version():
+        with engine.connect() as connection:
+            return connection.execute(
+                select(ResourceVersion.version).where(ResourceVersion.name == "components")).scalar()
+
+    def unit_cost():
+        with engine.connect() as connection:
+            return connection.execute(
+                select(Component.unit_cost).where(Component.id_component == component_id)).scalar()
+
+    component_id = catalog["components"][0].id_component
+    before, cost = version(), unit_cost()
+    with SessionLocal() as writer:
+        writer.get(Component, component_id).unit_cost = 13
+        with QueryCounter(engine) as counter:
+            writer.flush()
+        assert not any("resource_versions" in statement for statement, _, _ in counter.statements)
+        writer.rollback()
+    assert version() == before
+
+    # The rows and their version bump commit together, so readers never see new rows under the old version.
+    def failing_bump(connection, tables):
+        raise RuntimeError("bump failed")
+    monkeypatch.setattr(versioning, "bump_versions", failing_bump)
+    with SessionLocal() as writer:
+        writer.get(Component, component_id).unit_cost = 13
+        try:
+            writer.commit()
+        except RuntimeError:
+            writer.rollback()
+    assert (version(), unit_cost()) == (before, cost)
+    monkeypatch.undo()
+
+    with SessionLocal() as writer:
+        writer.get(Component, component_id).unit_cost = 13
+        writer.commit()
+    assert version() == before + 1
+    assert unit_cost() == 13
@@ -0,0 +1,32 @@
+from sqlalchemy import func, select
+
+
+def snapshot(db):
+    from backend.db.models import Campaign, Product, Subscription, User
+    return (db.execute(select(User.email, User.role).order_by(User.id_user)).all(),
+            db.execute(select(Product.id_product, Product.monthly_price, Product.cost).order_by(Product.id_product)).all(),
+            db.execute(select(Subscription.id_user, Subscription.status).order_by(Subscription.id_subscription)).all(),
+            db.execute(select(Campaign.id_subscription, Campaign.status, Campaign.start_date)
+                       .order_by(Campaign.id_campaign)).all())
+
+
+def test_dataset_is_deterministic_and_consistent(db):
+    from backend.benchmarks.dataset import build_dataset, dataset_sizes
+    from backend.db.base import Base
+    from backend.db.metrics import METRIC_FAMILIES, recompute_family
+    from backend.db.models import Campaign
+    from backend.db.session import engine
+
+    sizes = build_dataset(engine, scale=0.002, seed=7, chunk_size=500)
+    assert sizes == dataset_sizes(0.002)
+    assert db.execute(select(func.count()).select_from(Campaign)).scalar() == sizes["campaigns"]
+    first = snapshot(db)
+    assert all(product.cost > 0 for product in first[1])
+    with engine.begin() as connection:
+        assert sum(recompute_family(connection, family) for family in METRIC_FAMILIES) == 0
+
+    db.close()
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    build_dataset(engine, scale=0.002, seed=7, chunk_size=500)
+    assert snapshot(db) == first
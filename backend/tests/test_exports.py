@@ -0,0 +1,75 @@
+import csv
+import io
+import json
+
+
+def test_export_campaigns_csv(client, catalog, make_user, auth_headers):
+    make_user("admin@example.com", role="ADMIN")
+    response = client.get("/admin/exports/campaigns", headers=auth_headers("admin@example.com"))
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert 'filename="campaigns.csv"' in response.headers["content-disposition"]
+
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [row["name"] for row in rows] == ["Campaign 0", "Campaign 1", "Campaign 2"]
+    assert rows[0]["status"] == "Pending"
+    assert rows[0]["client_email"] == "client@example.com"
+    assert rows[0]["start_date"] == "2026-02-01"
+
+def test_export_streams_in_batches(client, catalog, make_user, auth_headers, monkeypatch):
+    from backend.db.query_budget import QueryCounter
+    from backend.db.session import SessionLocal, engine
+    from backend.functions import campaigns_export_query, iter_export
+    from backend.routers import exports
+    monkeypatch.setattr(exports, "EXPORT_BATCH_SIZE", 2)
+    make_user("admin@example.com", role="ADMIN")
+    headers = auth_headers("admin@example.com")
+
+    chunks = list(iter_export(SessionLocal, campaigns_export_query(), "ndjson", 2))
+    assert [chunk.count(b"\n") for chunk in chunks] == [2, 1]
+
+    with QueryCounter(engine) as counter:
+        response = client.get("/admin/exports/campaigns", params={"format": "ndjson"}, headers=headers)
+    assert response.headers["content-type"] == "application/x-ndjson"
+    records = [json.loads(line) for line in response.text.splitlines()]
+    assert [r["name"] for r in records] == ["Campaign 0", "Campaign 1", "Campaign 2"]
+    assert records[0]["product_name"] == "Growth Package"
+    assert len([s for s, _, _ in counter.statements if "FROM campaigns" in s]) == 1
+
+    response = client.get("/admin/exports/campaigns", params={"format": "ndjson", "date_from": "2026-03-02"},
+                          headers=headers)
+    assert [json.loads(line)["name"] for line in response.text.splitlines()] == ["Campaign 1", "Campaign 2"]
+
+def test_export_clients_and_subscriptions(client, catalog, make_user, auth_headers):
+    make_user("admin@example.com", role="ADMIN")
+    headers = auth_headers("admin@example.com")
+    clients = [json.loads(line) for line in
+               client.get("/admin/exports/clients", params={"format": "ndjson"}, headers=headers).text.splitlines()]
+    assert [c["email"] for c in clients] == ["client@example.com"]
+    assert clients[0]["role"] == "CLIENT"
+
+    subscriptions = list(csv.DictReader(io.StringIO(client.get("/admin/exports/subscriptions", headers=headers).text)))
+    assert [(s["client_email"], s["product_name"], s["status"]) for s in subscriptions] == [
+        ("client@example.com", "Growth Package", "Active")
+    ]
+
+def test_exports_are_admin_only(client, catalog, auth_headers):
+    assert client.get("/admin/exports/clients", headers=auth_headers()).status_code == 403
+
+def test_csv_export_neutralizes_formula_cells(client, db, catalog, make_user, auth_headers):
+    make_user("admin@example.com", role="ADMIN")
+    catalog["client"].name = '=HYPERLINK("http://evil.example","x")'
+    catalog["client"].address = "-2+3"
+    catalog["client"].phone_number = "@SUM(A1)"
+    db.commit()
+    headers = auth_headers("admin@example.com")
+
+    rows = list(csv.DictReader(io.StringIO(client.get("/admin/exports/clients", headers=headers).text)))
+    assert rows[0]["name"] == '\'=HYPERLINK("http://evil.example","x")'
+    assert rows[0]["address"] == "'-2+3"
+    assert rows[0]["phone_number"] == "'@SUM(A1)"
+    assert rows[0]["email"] == "client@example.com"
+
+    records = [json.loads(line) for line in
+               client.get("/admin/exports/clients", params={"format": "ndjson"}, headers=headers).text.splitlines()]
+    assert records[0]["address"] == "-2+3"
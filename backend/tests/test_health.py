@@ -0,0 +1,15 @@
+from alembic import command
+from backend.db.migrations import alembic_config, head_revision
+
+def test_liveness(client):
+    assert client.get("/health/live").json() == {"status": "ok"}
+
+def test_readiness_requires_alembic_head(client):
+    response = client.get("/health/ready")
+    assert response.status_code == 503
+    assert "expected" in response.json()["detail"]
+
+    command.stamp(alembic_config(), "head")
+    response = client.get("/health/ready")
+    assert response.status_code == 200
+    assert response.json()["revision"] == head_revision()
@@ -0,0 +1,62 @@
+from datetime import date
+
+from sqlalchemy import select
+
+from backend.db.models import Campaign, CampaignStatus, Subscription, SubscriptionStatus
+
+
+def statuses(db, model, pk):
+    db.expire_all()
+    return [row.status for row in db.execute(select(model).order_by(pk)).scalars()]
+
+
+def test_lifecycle_moves_records_by_date_in_batches(db, catalog):
+    from backend.core import run_lifecycle
+    from backend.db.session import SessionLocal
+
+    db.add(Campaign(id_subscription=catalog["subscription"].id_subscription, name="Paused",
+                    status=CampaignStatus.On_Hold, start_date=date(2026, 1, 1), end_date=date(2026, 1, 2)))
+    db.add_all([
+        Subscription(id_user=catalog["client"].id_user, id_product=catalog["products"][1].id_product,
+                     start_date=date(2025, 1, 1), end_date=date(2026, 2, 1)),
+        Subscription(id_user=catalog["client"].id_user, id_product=catalog["products"][1].id_product,
+                     status=SubscriptionStatus.Cancelled, start_date=date(2025, 1, 1), end_date=date(2026, 2, 1)),
+    ])
+    db.commit()
+
+    report = run_lifecycle(SessionLocal, today=date(2026, 3, 2), batch_size=1)
+    counts = {step["step"]: step["updated"] for step in report}
+    assert counts == {"complete_campaigns": 1, "activate_campaigns": 2, "expire_subscriptions": 1,
+                      "reconcile_metrics": 0}
+    assert {step["step"]: step["batches"] for step in report}["activate_campaigns"] == 2
+    assert all(step["elapsed_ms"] >= 0 for step in report)
+
+    assert statuses(db, Campaign, Campaign.id_campaign) == [
+        CampaignStatus.Completed, CampaignStatus.Active, CampaignStatus.Active, CampaignStatus.On_Hold,
+    ]
+    assert statuses(db, Subscription, Subscription.id_subscription) == [
+        SubscriptionStatus.Active, SubscriptionStatus.Expired, SubscriptionStatus.Cancelled,
+    ]
+
+    again = run_lifecycle(SessionLocal, today=date(2026, 3, 2))
+    assert [step["updated"] for step in again] == [0, 0, 0, 0]
+
+
+def test_lifecycle_cli_reports_counts(db, catalog, capsys):
+    from backend.__main__ import main
+
+    assert main(["lifecycle", "--date", "2026-04-01"]) == 0
+    output = capsys.readouterr().out
+    assert "complete_campaigns" in output and "expire_subscriptions" in output
+    assert statuses(db, Campaign, Campaign.id_campaign) == [CampaignStatus.Completed] * 3
+
+
+def test_overlapping_lifecycle_runs_are_skipped(db, catalog):
+    from backend.core.lifecycle import lifecycle_lock, run_lifecycle
+    from backend.db.session import SessionLocal
+
+    with lifecycle_lock(SessionLocal) as acquired:
+        assert acquired
+        assert run_lifecycle(SessionLocal, today=date(2026, 4, 1)) == []
+    assert statuses(db, Campaign, Campaign.id_campaign) == [CampaignStatus.Pending] * 3
+    assert len(run_lifecycle(SessionLocal, today=date(2026, 4, 1))) == 4
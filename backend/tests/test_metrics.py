@@ -0,0 +1,102 @@
+from sqlalchemy import text
+
+
+def summary(client, headers):
+    response = client.get("/admin/metrics", headers=headers)
+    assert response.status_code == 200
+    return response.json()
+
+
+def assert_in_sync(db):
+    from backend.db.metrics import reconcile_metrics
+    assert reconcile_metrics(db) == 0
+
+
+def test_metrics_follow_writes_incrementally(client, db, catalog, make_user, auth_headers):
+    make_user("admin@example.com", role="ADMIN")
+    make_user("operative@example.com", role="OPERATIVE")
+    admin, operative, client_headers = (auth_headers("admin@example.com"),
+                                        auth_headers("operative@example.com"), auth_headers())
+    growth, starter = catalog["products"][0], catalog["products"][1]
+
+    first = summary(client, admin)
+    assert float(first["mrr"]) == 199
+    assert first["active_subscriptions"] == 1
+    assert first["campaigns_by_status"] == {"Pending": 3, "Active": 0, "Completed": 0, "On Hold": 0}
+    assert first["subscriptions_by_product"][0]["name"] == "Growth Package"
+
+    client.post("/subscriptions/", json={"id_product": starter.id_product}, headers=client_headers)
+    client.put(f"/products-management/{starter.id_product}", json={"monthly_price": 120}, headers=operative)
+    created = client.post("/campaigns/", headers=client_headers, json={
+        "name": "Launch", "id_product": growth.id_product, "start_date": "2026-05-01", "end_date": "2026-06-01",
+    })
+    client.put(f"/admin/campaigns/{created.json()['id_campaign']}", json={"status": "Active"}, headers=admin)
+    client.patch("/admin/campaigns", json={"filter": {"status": "Pending"}, "status": "On Hold"}, headers=admin)
+    assert_in_sync(db)
+
+    current = summary(client, admin)
+    assert float(current["mrr"]) == 319
+    assert current["active_subscriptions"] == 2
+    assert current["campaigns_by_status"] == {"Pending": 0, "Active": 1, "Completed": 0, "On Hold": 3}
+
+    client.delete(f"/admin/clients/{catalog['client'].id_user}", headers=admin)
+    assert_in_sync(db)
+    emptied = summary(client, admin)
+    assert float(emptied["mrr"]) == 0
+    assert emptied["subscriptions_by_product"] == []
+    remaining = db.execute(text("SELECT COUNT(*) FROM campaigns")).scalar()
+    assert sum(emptied["campaigns_by_status"].values()) == remaining
+
+
+def test_reconcile_corrects_drift(client, db, catalog, make_user, auth_headers):
+    from backend.db.metrics import reconcile_metrics
+    make_user("admin@example.com", role="ADMIN")
+    headers = auth_headers("admin@example.com")
+
+    db.execute(text("UPDATE campaigns SET status = 'Completed'"))
+    db.commit()
+    assert summary(client, headers)["campaigns_by_status"]["Pending"] == 3
+
+    assert reconcile_metrics(db) == 2
+    assert summary(client, headers)["campaigns_by_status"]["Completed"] == 3
+    assert reconcile_metrics(db) == 0
+
+
+def test_bulk_product_edits_recompute_subscriptions_only_for_price_changes(client, db, catalog, make_user,
+                                                                         auth_headers):
+    from backend.db.query_budget import QueryCounter
+    from backend.db.session import engine
+    make_user("operative@example.com", role="OPERATIVE")
+    headers = auth_headers("operative@example.com")
+    growth = catalog["products"][0]
+
+    def grouped_statements(rows):
+        with QueryCounter(engine) as counter:
+            assert client.post("/products-management/bulk", json={"rows": rows}, headers=headers).status_code == 200
+        return [statement for statement, _, _ in counter.statements if "GROUP BY" in statement]
+
+    assert grouped_statements([{"id_product": growth.id_product, "name": "Growth Plus",
+                                "description": "Renamed"}]) == []
+    assert grouped_statements([{"id_product": growth.id_product, "monthly_price": 250}])
+    assert_in_sync(db)
+
+
+def test_metrics_reconciler_fixes_drift_on_its_own_schedule(db, catalog):
+    import time
+    from backend.core.lifecycle import MetricsReconciler
+    from backend.db.metrics import reconcile_metrics
+    from backend.db.session import SessionLocal
+
+    db.execute(text("UPDATE campaigns SET status = 'Completed'"))
+    db.commit()
+    reconciler = MetricsReconciler(SessionLocal, interval_seconds=0.05, enabled=True)
+    reconciler.start()
+    try:
+        deadline = time.monotonic() + 5
+        while db.execute(text("SELECT value FROM business_metrics WHERE metric = 'campaigns' AND dimension = 'Completed'")).scalar() != 3:
+            assert time.monotonic() < deadline
+            db.rollback()
+            time.sleep(0.05)
+    finally:
+        reconciler.shutdown()
+    assert reconcile_metrics(db) == 0
@@ -0,0 +1,66 @@
+import pytest
+
+
+def walk(client, url, headers, **params):
+    pages = []
+    cursor = None
+    while True:
+        response = client.get(url, params={**params, **({"cursor": cursor} if cursor else {})}, headers=headers)
+        assert response.status_code == 200, response.text
+        page = response.json()
+        pages.append(page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return pages
+
+
+@pytest.fixture
+def operative_headers(make_user, auth_headers):
+    make_user("operative@example.com", role="OPERATIVE")
+    return auth_headers("operative@example.com")
+
+
+def test_clients_walk_every_page_in_sort_order(client, make_user, auth_headers):
+    make_user("admin@example.com", role="ADMIN")
+    for n in [3, 0, 4, 1, 2]:
+        make_user(f"user{n}@example.com")
+    headers = auth_headers("admin@example.com")
+
+    pages = walk(client, "/admin/clients", headers, limit=2, sort="-email")
+    emails = [user["email"] for page in pages for user in page]
+    assert [len(page) for page in pages] == [2, 2, 1]
+    assert emails == sorted(emails, reverse=True)
+
+def test_total_is_optional(client, make_user, auth_headers):
+    make_user("admin@example.com", role="ADMIN")
+    make_user()
+    headers = auth_headers("admin@example.com")
+    assert client.get("/admin/clients", headers=headers).json()["total"] is None
+    page = client.get("/admin/clients", params={"include_total": True, "limit": 1}, headers=headers).json()
+    assert page["total"] == 1
+    assert page["limit"] == 1
+
+def test_packages_paginate_on_composite_key(client, catalog, operative_headers):
+    pages = walk(client, "/packages-management/", operative_headers, limit=1, sort="-quantity")
+    links = [(p["quantity"], p["id_product"], p["id_component"]) for page in pages for p in page]
+    assert len(links) == len(set(links)) == 6
+    assert links == sorted(links, reverse=True)
+
+def test_decimal_sort_key_round_trips_through_cursor(client, catalog, operative_headers):
+    pages = walk(client, "/products-management/", operative_headers, limit=1, sort="monthly_price")
+    assert [p["name"] for page in pages for p in page] == ["Legacy Package", "Starter Package", "Growth Package"]
+
+def test_filters(client, catalog, operative_headers):
+    components = client.get("/components-management/", params={"component_type": "Report"}, headers=operative_headers)
+    assert [c["name"] for c in components.json()["items"]] == ["Analytics Report"]
+    products = client.get("/products-management/", params={"is_active": False}, headers=operative_headers)
+    assert [p["name"] for p in products.json()["items"]] == ["Legacy Package"]
+
+def test_rejects_unknown_sort_and_bad_cursors(client, catalog, operative_headers):
+    url = "/products-management/"
+    assert client.get(url, params={"sort": "description"}, headers=operative_headers).status_code == 422
+    assert client.get(url, params={"cursor": "not-a-cursor"}, headers=operative_headers).status_code == 400
+    assert client.get(url, params={"limit": 10_000}, headers=operative_headers).status_code == 422
+
+    cursor = client.get(url, params={"limit": 1, "sort": "name"}, headers=operative_headers).json()["next_cursor"]
+    assert client.get(url, params={"cursor": cursor, "sort": "-name"}, headers=operative_headers).status_code == 400
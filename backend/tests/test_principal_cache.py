@@ -0,0 +1,57 @@
+import time
+from backend.core.principal_cache import PrincipalCache
+from backend.db.models import User, UserRole
+
+TOKEN = "header.payload.signature"
+
+def make_user(id_user=1, role=UserRole.CLIENT):
+    return User(id_user=id_user, name="Test", email="test@example.com", password_hash="x", role=role)
+
+def test_put_returns_detached_snapshot():
+    cache = PrincipalCache(maxsize=10, ttl_seconds=60)
+    user = make_user()
+    snapshot = cache.put(TOKEN, {"id_user": 1}, user)
+    assert snapshot is not user
+    assert snapshot.id_user == 1
+    assert cache.get(TOKEN) == ({"id_user": 1}, snapshot)
+
+def test_entry_never_outlives_token_exp():
+    cache = PrincipalCache(maxsize=10, ttl_seconds=60)
+    cache.put(TOKEN, {"id_user": 1, "exp": time.time() - 1}, make_user())
+    assert cache.get(TOKEN) is None
+
+def test_lru_eviction():
+    cache = PrincipalCache(maxsize=2, ttl_seconds=60)
+    cache.put("a", {}, make_user(1))
+    cache.put("b", {}, make_user(2))
+    cache.get("a")
+    cache.put("c", {}, make_user(3))
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+
+def test_invalidate_user():
+    cache = PrincipalCache(maxsize=10, ttl_seconds=60)
+    cache.put("a", {}, make_user(1))
+    cache.put("b", {}, make_user(1))
+    cache.put("c", {}, make_user(2))
+    cache.invalidate_user(1)
+    assert cache.get("a") is None
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
+
+def test_disabled_cache_stores_nothing():
+    cache = PrincipalCache(maxsize=10, ttl_seconds=0)
+    cache.put(TOKEN, {}, make_user())
+    assert cache.get(TOKEN) is None
+
+def test_sync_version_drops_entries_when_version_moves():
+    cache = PrincipalCache(maxsize=10, ttl_seconds=60, recheck_seconds=60)
+    cache.sync_version(1)
+    cache.put(TOKEN, {}, make_user())
+    assert not cache.version_due()
+
+    cache.sync_version(1)
+    assert cache.get(TOKEN) is not None
+    cache.sync_version(2)
+    assert cache.get(TOKEN) is None
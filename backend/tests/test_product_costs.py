@@ -0,0 +1,83 @@
+from decimal import Decimal
+
+import pytest
+
+from backend.db.query_budget import QueryCounter
+from backend.db.session import engine
+
+
+@pytest.fixture
+def operative_headers(make_user, auth_headers):
+    make_user("operative@example.com", role="OPERATIVE")
+    return auth_headers("operative@example.com")
+
+
+def products_by_name(client, headers):
+    items = client.get("/products-management/", headers=headers).json()["items"]
+    return {item["name"]: item for item in items}
+
+
+def test_cost_and_margin_follow_component_and_package_changes(client, catalog, operative_headers):
+    # every catalog product links Social Media Post x1 (10) and Analytics Report x2 (50)
+    products = products_by_name(client, operative_headers)
+    assert Decimal(products["Growth Package"]["cost"]) == 110
+    assert Decimal(products["Growth Package"]["margin"]) == 89
+
+    post, report = catalog["components"]
+    growth, starter = catalog["products"][0], catalog["products"][1]
+    with QueryCounter(engine) as counter:
+        client.put(f"/components-management/{post.id_component}", json={"unit_cost": 20}, headers=operative_headers)
+    cost_updates = [s for s, params, _ in counter.statements if s.startswith("UPDATE products SET cost")]
+    assert len(cost_updates) == 1
+
+    client.put(f"/packages-management/{starter.id_product}/{report.id_component}",
+               json={"quantity": 1}, headers=operative_headers)
+    updated = client.put(f"/products-management/{growth.id_product}", json={"monthly_price": 300},
+                         headers=operative_headers).json()
+    assert (Decimal(updated["cost"]), Decimal(updated["margin"])) == (120, 180)
+
+    products = products_by_name(client, operative_headers)
+    assert Decimal(products["Starter Package"]["cost"]) == 70
+    assert Decimal(products["Legacy Package"]["margin"]) == -71
+
+
+def test_margin_report_sorts_and_filters(client, catalog, operative_headers):
+    response = client.get("/products-management/margins", headers=operative_headers)
+    assert response.status_code == 200
+    items = response.json()["items"]
+    assert [item["name"] for item in items] == ["Legacy Package", "Starter Package", "Growth Package"]
+    assert Decimal(items[0]["margin_pct"]) == Decimal("-124.49")
+
+    etag = response.headers["ETag"]
+    assert client.get("/products-management/margins", headers={**operative_headers, "If-None-Match": etag}).status_code == 304
+
+    losing = client.get("/products-management/margins", params={"max_margin": 0, "is_active": False},
+                        headers=operative_headers).json()["items"]
+    assert [item["name"] for item in losing] == ["Legacy Package"]
+
+    rows = [{"id_component": catalog["components"][1].id_component, "unit_cost": 1}]
+    client.post("/components-management/bulk", json={"rows": rows}, headers=operative_headers)
+    refreshed = client.get("/products-management/margins", params={"sort": "-margin"}, headers=operative_headers)
+    assert refreshed.headers["ETag"] != etag
+    assert Decimal(refreshed.json()["items"][0]["cost"]) == 12
+
+
+def test_bulk_imports_recompute_only_affected_products(client, catalog, operative_headers):
+    post, _ = catalog["components"]
+    growth = catalog["products"][0]
+    rows = [{"id_component": post.id_component, "unit_cost": 20},
+            {"name": "Banner", "component_type": "Post", "unit_cost": 5}]
+    with QueryCounter(engine) as counter:
+        client.post("/components-management/bulk", json={"rows": rows}, headers=operative_headers)
+    cost_updates = [s for s, params, _ in counter.statements if s.startswith("UPDATE products SET cost")]
+    assert len(cost_updates) == 1 and "WHERE products.id_product IN" in cost_updates[0]
+
+    rows = [{"id_product": growth.id_product, "is_active": False},
+            {"name": "Scale Package", "description": "Scale", "monthly_price": 499}]
+    with QueryCounter(engine) as counter:
+        client.post("/products-management/bulk", json={"rows": rows}, headers=operative_headers)
+    assert not [s for s, params, _ in counter.statements if s.startswith("UPDATE products SET cost")]
+
+    products = products_by_name(client, operative_headers)
+    assert Decimal(products["Growth Package"]["cost"]) == 120
+    assert (Decimal(products["Scale Package"]["cost"]), Decimal(products["Scale Package"]["margin"])) == (0, 499)
@@ -0,0 +1,73 @@
+import pytest
+
+
+@pytest.fixture
+def profiled_client(db, tmp_path, monkeypatch):
+    from fastapi.testclient import TestClient
+    from backend import main
+    from backend.core import request_profiler
+
+    monkeypatch.setattr(main, "PROFILING_ENABLED", True)
+    monkeypatch.setattr(request_profiler, "directory", str(tmp_path))
+    with TestClient(main.create_app()) as test_client:
+        yield test_client
+
+
+def test_admin_header_profiles_a_single_request(profiled_client, catalog, make_user):
+    make_user("admin@example.com", role="ADMIN")
+    token = profiled_client.post("/login", data={"username": "admin@example.com", "password": "tEst123!"}).json()
+    headers = {"Authorization": f"Bearer {token['access_token']}"}
+
+    assert "X-Profile-Id" not in profiled_client.get("/admin/campaigns", headers=headers).headers
+    response = profiled_client.get("/admin/campaigns", headers={**headers, "X-Profile": "1"})
+    assert response.status_code == 200
+    profile_id = response.headers["X-Profile-Id"]
+
+    listed = profiled_client.get("/admin/profiles", headers=headers).json()
+    assert [profile["id"] for profile in listed] == [profile_id]
+    assert listed[0]["path"] == "/admin/campaigns"
+    report = profiled_client.get(f"/admin/profiles/{profile_id}", headers=headers).json()
+    assert report["duration_ms"] > 0
+    assert "allocations" in report and "categories" in report and "scope" in report
+    folded = profiled_client.get(f"/admin/profiles/{profile_id}", params={"format": "folded"}, headers=headers)
+    assert folded.status_code == 200
+    assert profiled_client.get("/admin/profiles/missing", headers=headers).status_code == 404
+
+
+def test_profile_header_is_ignored_for_non_admins(profiled_client, catalog):
+    token = profiled_client.post("/login", data={"username": "client@example.com", "password": "tEst123!"}).json()
+    headers = {"Authorization": f"Bearer {token['access_token']}", "X-Profile": "1"}
+    response = profiled_client.get("/campaigns/", headers=headers)
+    assert response.status_code == 200
+    assert "X-Profile-Id" not in response.headers
+
+
+def test_stack_sampler_attributes_samples_to_categories():
+    import sys
+    from backend.core.profiling import StackSampler
+    sampler = StackSampler(0.001)
+    sampler.sample(sys._getframe())
+    assert sampler.samples == 1
+    assert sampler.categories == {"app": 1}
+
+
+def test_stack_sampler_skips_threads_that_serve_no_request():
+    import threading
+    import time
+    from backend.core.profiling import StackSampler
+    done = threading.Event()
+
+    def unrelated_work():
+        while not done.is_set():
+            sum(range(1000))
+
+    background = threading.Thread(target=unrelated_work, name="lifecycle-scheduler")
+    background.start()
+    sampler = StackSampler(0.001)
+    sampler.start()
+    time.sleep(0.05)
+    sampler.stop()
+    done.set()
+    background.join()
+    assert sampler.samples > 0
+    assert not any("unrelated_work" in stack for stack in sampler.stacks)
@@ -0,0 +1,74 @@
+import pytest
+from sqlalchemy import text
+from fastapi.routing import APIRoute
+from backend.core import principal_cache
+from backend.db.query_budget import QueryCounter, get_query_budget
+from backend.db.session import engine, async_engine
+from backend.main import app
+
+BUDGETED_REQUESTS = {
+    "/users/me": "client@example.com",
+    "/campaigns/": "client@example.com",
+    "/subscriptions/my-active-ids": "client@example.com",
+    "/products/drop_down": None,
+    "/products/list": None,
+    "/admin/clients": "admin@example.com",
+    "/admin/campaigns": "admin@example.com",
+    "/admin/db/pool": "admin@example.com",
+    "/admin/metrics": "admin@example.com",
+    "/admin/exports/campaigns": "admin@example.com",
+    "/admin/exports/clients": "admin@example.com",
+    "/admin/exports/subscriptions": "admin@example.com",
+    "/admin/profiles": "admin@example.com",
+    "/admin/profiles/{profile_id}": "admin@example.com",
+    "/components-management/": "operative@example.com",
+    "/products-management/": "operative@example.com",
+    "/products-management/margins": "operative@example.com",
+    "/packages-management/": "operative@example.com",
+}
+
+@pytest.fixture
+def saved_profile(tmp_path, monkeypatch):
+    from collections import Counter
+    from backend.core import request_profiler
+    monkeypatch.setattr(request_profiler, "directory", str(tmp_path))
+    request_profiler.save("budget", {"id": "budget", "method": "GET", "path": "/admin/campaigns", "status_code": 200,
+                                     "started_at": "2026-01-01T00:00:00+00:00", "duration_ms": 1.0, "samples": 0},
+                          Counter())
+    return "budget"
+
+
+ROUTES = {route.path: route for route in app.routes if isinstance(route, APIRoute) and "GET" in route.methods}
+
+
+def test_every_read_endpoint_declares_a_budget():
+    unbudgeted = [path for path, route in ROUTES.items()
+                  if not path.startswith("/health") and get_query_budget(route.endpoint) is None]
+    assert unbudgeted == []
+    assert set(BUDGETED_REQUESTS) == {path for path in ROUTES if not path.startswith("/health")}
+
+
+@pytest.mark.parametrize("path,email", BUDGETED_REQUESTS.items())
+def test_endpoint_stays_within_query_budget(client, catalog, make_user, auth_headers, db, saved_profile,
+                                            path, email):
+    make_user("admin@example.com", role="ADMIN")
+    make_user("operative@example.com", role="OPERATIVE")
+    for n in range(5):
+        make_user(f"extra{n}@example.com")
+    headers = auth_headers(email) if email else {}
+    principal_cache.clear()
+
+    with QueryCounter(engine, async_engine) as counter:
+        response = client.get(path.format(profile_id=saved_profile), headers=headers)
+
+    assert response.status_code == 200, response.text
+    budget = get_query_budget(ROUTES[path].endpoint)
+    assert counter.count <= budget, counter.report()
+
+
+def test_counter_records_statements_and_time(db):
+    with QueryCounter(engine) as counter:
+        db.execute(text("SELECT 1"))
+    assert counter.count == 1
+    assert counter.elapsed_ms >= 0
+    assert "SELECT 1" in counter.report()
@@ -0,0 +1,90 @@
+import re
+import pytest
+from backend.db.query_budget import QueryCounter
+from backend.functions.pagination import encode_cursor
+from backend.db.session import engine, async_engine
+
+FIRST_ID_CURSOR = encode_cursor("id", [0])
+
+HOT_REQUESTS = [
+    ("GET", "/campaigns/", None, "client@example.com"),
+    ("GET", "/subscriptions/my-active-ids", None, "client@example.com"),
+    ("POST", "/campaigns/", "campaign", "client@example.com"),
+    ("POST", "/subscriptions/", "subscription", "client@example.com"),
+    ("GET", "/admin/clients", None, "admin@example.com"),
+    ("GET", f"/admin/campaigns?status=Active&cursor={FIRST_ID_CURSOR}", None, "admin@example.com"),
+    ("GET", f"/admin/campaigns?date_from=2026-01-01&cursor={FIRST_ID_CURSOR}", None, "admin@example.com"),
+]
+
+
+def full_scans(statement, parameters):
+    with engine.connect() as connection:
+        if connection.dialect.name == "sqlite":
+            rows = connection.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters).all()
+            return [row.detail for row in rows if re.match(r"SCAN \w+$", row.detail)]
+        rows = connection.exec_driver_sql("EXPLAIN " + statement, parameters).mappings().all()
+        return [f"{row['table']}: type=ALL" for row in rows if row["type"] == "ALL"]
+
+
+def sorts_in_memory(statement, parameters):
+    with engine.connect() as connection:
+        if connection.dialect.name == "sqlite":
+            rows = connection.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters).all()
+            return [row.detail for row in rows if "TEMP B-TREE FOR ORDER BY" in row.detail]
+        rows = connection.exec_driver_sql("EXPLAIN " + statement, parameters).mappings().all()
+        return [f"{row['table']}: {row['Extra']}" for row in rows if "filesort" in (row["Extra"] or "")]
+
+
+def request_body(kind, catalog):
+    starter = catalog["products"][1]
+    if kind == "campaign":
+        growth = catalog["products"][0]
+        return {"name": "Launch", "id_product": growth.id_product, "start_date": "2026-05-01", "end_date": "2026-06-01"}
+    if kind == "subscription":
+        return {"id_product": starter.id_product}
+    return None
+
+
+@pytest.mark.parametrize("method,url,body,email", HOT_REQUESTS)
+def test_hot_queries_use_indexes(client, catalog, make_user, auth_headers, method, url, body, email):
+    make_user("admin@example.com", role="ADMIN")
+    headers = auth_headers(email)
+
+    with QueryCounter(engine, async_engine) as counter:
+        response = client.request(method, url, json=request_body(body, catalog), headers=headers)
+    assert response.status_code < 400, response.text
+    selects = [(statement, parameters) for statement, parameters, _ in counter.statements
+               if statement.lstrip().upper().startswith("SELECT")]
+    assert selects
+
+    for statement, parameters in selects:
+        assert full_scans(statement, parameters) == [], statement
+
+
+def test_lifecycle_batches_use_indexes(db, catalog):
+    from datetime import date
+    from backend.core import run_lifecycle
+    from backend.db.session import SessionLocal
+
+    with QueryCounter(engine) as counter:
+        run_lifecycle(SessionLocal, today=date(2026, 3, 2))
+    statements = [(statement, parameters) for statement, parameters, _ in counter.statements
+                  if statement.lstrip().upper().startswith(("SELECT", "UPDATE"))]
+    assert statements
+    for statement, parameters in statements:
+        assert full_scans(statement, parameters) == [], statement
+
+
+@pytest.mark.parametrize("sort", ["id", "name", "-start_date", "end_date"])
+def test_admin_campaign_sorts_walk_an_index(client, catalog, make_user, auth_headers, sort):
+    make_user("admin@example.com", role="ADMIN")
+    headers = auth_headers("admin@example.com")
+
+    with QueryCounter(engine, async_engine) as counter:
+        response = client.get("/admin/campaigns", params={"sort": sort, "limit": 2}, headers=headers)
+    assert response.status_code == 200
+    pages = [(statement, parameters) for statement, parameters, _ in counter.statements
+             if "FROM campaigns" in statement and "ORDER BY" in statement]
+    assert pages
+    for statement, parameters in pages:
+        assert sorts_in_memory(statement, parameters) == [], statement
@@ -0,0 +1,86 @@
+import os
+import tempfile
+from itertools import cycle
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from backend.db import session as db_session
+from backend.db.base import Base
+from backend.db.models import Product
+
+
+@pytest.fixture
+def replica(monkeypatch):
+    url = "sqlite:///" + os.path.join(tempfile.gettempdir(), "cloud_chaser_test_replica.db")
+    replica_engine = create_engine(url)
+    Base.metadata.drop_all(bind=replica_engine)
+    Base.metadata.create_all(bind=replica_engine)
+    ReplicaSession = sessionmaker(bind=replica_engine)
+    with ReplicaSession() as replica_db:
+        replica_db.add(Product(name="Replica Package", description="Stale", monthly_price=1, is_active=True))
+        replica_db.commit()
+
+    async_replica_engine = create_async_engine(db_session.to_async_url(url))
+    monkeypatch.setattr(db_session, "replica_sessions", cycle([ReplicaSession]))
+    monkeypatch.setattr(db_session, "async_replica_sessions", cycle([
+        async_sessionmaker(bind=async_replica_engine, class_=AsyncSession, expire_on_commit=False)
+    ]))
+    monkeypatch.setattr(db_session, "primary_pins", db_session.PrimaryPins(window_seconds=60, secret="test-secret"))
+    yield
+    replica_engine.dispose()
+
+
+def product_names(response):
+    assert response.status_code == 200
+    body = response.json()
+    return [p["name"] for p in (body["items"] if isinstance(body, dict) else body)]
+
+def test_reads_go_to_replica(client, catalog, replica):
+    assert product_names(client.get("/products/list")) == ["Replica Package"]
+    assert product_names(client.get("/products/drop_down")) == ["Replica Package"]
+
+def test_consistency_header_forces_primary(client, catalog, replica):
+    response = client.get("/products/list", headers={"X-Read-Consistency": "primary"})
+    assert product_names(response) == ["Growth Package", "Starter Package"]
+
+def test_reads_after_write_stay_on_primary(client, catalog, replica, auth_headers):
+    headers = auth_headers()
+    client.cookies.clear()
+    starter = catalog["products"][1]
+    assert client.get("/subscriptions/my-active-ids", headers=headers).json() == []
+    assert client.post("/subscriptions/", json={"id_product": starter.id_product}, headers=headers).status_code == 200
+    assert sorted(client.get("/subscriptions/my-active-ids", headers=headers).json()) == [
+        catalog["products"][0].id_product, starter.id_product
+    ]
+
+def test_read_after_write_pin_is_signed_and_shared(client, catalog, replica, auth_headers):
+    from backend.db.routing import PIN_COOKIE, PIN_HEADER
+
+    headers = auth_headers()
+    response = client.post("/subscriptions/", json={"id_product": catalog["products"][1].id_product},
+                           headers=headers)
+    token = response.headers[PIN_HEADER]
+    client.cookies.clear()
+    other_worker = db_session.PrimaryPins(window_seconds=60, secret="test-secret")
+    assert other_worker.is_pinned(token)
+    assert len(client.get("/subscriptions/my-active-ids", headers={**headers, PIN_HEADER: token}).json()) == 2
+
+    until, _, signature = token.partition(".")
+    forged = f"{int(until) + 60_000}.{signature}"
+    assert not other_worker.is_pinned(forged)
+    client.cookies.set(PIN_COOKIE, forged)
+    assert client.get("/subscriptions/my-active-ids", headers=headers).json() == []
+
+def test_cross_origin_client_pins_reads_by_echoing_the_header(client, catalog, replica, auth_headers):
+    # What frontend/lib/api.ts does: no cookie jar, the pin from the write response is sent back as a header.
+    from backend.db.routing import PIN_HEADER
+
+    headers = auth_headers()
+    client.cookies.clear()
+    response = client.post("/subscriptions/", json={"id_product": catalog["products"][1].id_product},
+                           headers=headers)
+    client.cookies.clear()
+    assert client.get("/subscriptions/my-active-ids", headers=headers).json() == []
+    pinned = {**headers, PIN_HEADER: response.headers[PIN_HEADER]}
+    assert len(client.get("/subscriptions/my-active-ids", headers=pinned).json()) == 2
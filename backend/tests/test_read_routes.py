@@ -0,0 +1,40 @@
+def test_products_list(hot_client, catalog):
+    response = hot_client.get("/products/list")
+    assert response.status_code == 200
+    products = response.json()["items"]
+    assert [p["name"] for p in products] == ["Growth Package", "Starter Package"]
+    assert products[0]["components"] == [
+        {"name": "Social Media Post", "quantity": 1},
+        {"name": "Analytics Report", "quantity": 2},
+    ]
+
+def test_products_drop_down(hot_client, catalog):
+    response = hot_client.get("/products/drop_down")
+    assert response.status_code == 200
+    assert [p["name"] for p in response.json()] == ["Growth Package", "Starter Package"]
+
+def test_campaigns_for_current_user(hot_client, catalog, auth_headers):
+    response = hot_client.get("/campaigns/", headers=auth_headers())
+    assert response.status_code == 200
+    campaigns = response.json()["items"]
+    assert len(campaigns) == 3
+    assert {c["product"] for c in campaigns} == {"Growth Package"}
+
+def test_my_active_subscription_ids(hot_client, catalog, auth_headers):
+    response = hot_client.get("/subscriptions/my-active-ids", headers=auth_headers())
+    assert response.status_code == 200
+    assert response.json() == [catalog["products"][0].id_product]
+
+def test_current_user(hot_client, catalog, auth_headers):
+    response = hot_client.get("/users/me", headers=auth_headers())
+    assert response.status_code == 200
+    assert response.json()["email"] == "client@example.com"
+
+def test_hot_routes_use_the_handler_for_each_mode(hot_client, request):
+    from inspect import iscoroutinefunction
+    hot_paths = {"/users/me", "/campaigns/", "/products/drop_down", "/products/list", "/subscriptions/my-active-ids"}
+    endpoints = [route.endpoint for route in hot_client.app.routes
+                 if getattr(route, "path", None) in hot_paths and "GET" in route.methods]
+    assert len(endpoints) == len(hot_paths)
+    is_async = request.node.callspec.params["hot_client"] == "async"
+    assert {iscoroutinefunction(endpoint) for endpoint in endpoints} == {is_async}
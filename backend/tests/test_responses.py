@@ -0,0 +1,44 @@
+import json
+from datetime import date, datetime
+from decimal import Decimal
+
+from pydantic import TypeAdapter
+from sqlalchemy import text
+
+from backend.db.models import CampaignStatus
+from backend.schemas import AdminCampaignOut, ProductMgmtOut, Page
+
+
+def test_fast_dumps_matches_pydantic_json_mode(db):
+    from backend.core.responses import dumps
+    row = {"id_campaign": 1, "name": "Launch", "status": CampaignStatus.On_Hold, "start_date": date(2026, 1, 2),
+           "end_date": date(2026, 2, 3), "product_name": "Growth", "client_name": "Ana", "client_email": "a@b.c"}
+    page = {"items": [row], "limit": 50, "next_cursor": None, "total": None}
+    adapter = TypeAdapter(Page[AdminCampaignOut])
+    expected = adapter.dump_python(adapter.validate_python(page), mode="json")
+    assert json.loads(dumps(page)) == expected
+
+    product = ProductMgmtOut(id_product=1, name="Growth", monthly_price=Decimal("199.5000"), is_active=True,
+                             cost=Decimal("10.2500"), margin=Decimal("189.2500"))
+    assert json.loads(dumps([product])) == [product.model_dump(mode="json")]
+
+    fetched = db.execute(text("SELECT 1 AS id, 'x' AS name")).first()
+    assert json.loads(dumps({"row": fetched, "at": datetime(2026, 1, 1, 12, 30)})) == {
+        "row": {"id": 1, "name": "x"}, "at": "2026-01-01T12:30:00"
+    }
+
+
+def test_fast_routes_keep_schema_and_validators(client, catalog, make_user, auth_headers):
+    headers = auth_headers()
+    response = client.get("/campaigns/", headers=headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.headers["ETag"]
+    item = response.json()["items"][0]
+    assert item == {"id_campaign": item["id_campaign"], "name": "Campaign 0", "product": "Growth Package",
+                    "status": "Pending", "start_date": "2026-02-01", "end_date": "2026-03-01"}
+
+    make_user("admin@example.com", role="ADMIN")
+    admin = client.get("/admin/campaigns", params={"limit": 1}, headers=auth_headers("admin@example.com")).json()
+    assert admin["items"][0]["client_email"] == "client@example.com"
+    assert admin["next_cursor"]
@@ -0,0 +1,65 @@
+import json
+import os
+import subprocess
+import sys
+
+from prometheus_client import REGISTRY
+
+
+def sample(name: str, **labels) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+def test_metrics_report_routes_queries_and_hashing(client, catalog, login):
+    route = {"method": "GET", "route": "/products/list", "status": "200"}
+    served = sample("http_requests_total", **route)
+    queried = sample("http_request_db_queries_count", route="/products/list")
+    verified = sample("password_hashing_duration_seconds_count", operation="verify")
+
+    assert client.get("/products/list").status_code == 200
+    login()
+    assert sample("http_requests_total", **route) == served + 1
+    assert sample("http_request_db_queries_count", route="/products/list") == queried + 1
+    assert sample("password_hashing_duration_seconds_count", operation="verify") == verified + 1
+
+    response = client.get("/health/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    assert 'http_requests_total{method="GET",route="/products/list",status="200"}' in body
+    assert 'http_request_duration_seconds_bucket{le="+Inf",method="POST",route="/login"}' in body
+    assert 'http_request_db_queries_count{route="/login"}' in body
+    assert "threadpool_max_threads " in body
+    assert "password_hashing_pending 0.0" in body
+
+
+def test_tracing_links_request_to_its_sql_statements(client, catalog, tmp_path, monkeypatch):
+    from backend.core import telemetry
+    trace_file = tmp_path / "traces.ndjson"
+    monkeypatch.setattr(telemetry, "tracing", True)
+    monkeypatch.setattr(telemetry, "trace_file", str(trace_file))
+    trace_id = "4bf92f3577b34da6a3ce929d0e0e4736"
+
+    response = client.get("/products/drop_down", headers={"traceparent": f"00-{trace_id}-00f067aa0ba902b7-01"})
+    assert response.status_code == 200
+    assert response.headers["traceparent"].startswith(f"00-{trace_id}-")
+
+    spans = [json.loads(line) for line in trace_file.read_text().splitlines()]
+    root, children = spans[0], spans[1:]
+    assert root["name"] == "GET /products/drop_down"
+    assert root["parent_span_id"] == "00f067aa0ba902b7"
+    assert root["attributes"]["db.queries"] == len(children) > 0
+    assert {span["trace_id"] for span in spans} == {trace_id}
+    assert all(span["name"] == "db.query" and span["parent_span_id"] == root["span_id"] for span in children)
+
+
+def test_scrapes_sum_samples_from_every_worker_process(tmp_path):
+    from backend.core.telemetry import render_metrics
+    record = ("from backend.core.telemetry import HTTP_REQUESTS\n"
+              "HTTP_REQUESTS.labels(method='GET', route='/products/list', status=200).inc()\n")
+    env = {**os.environ, "PROMETHEUS_MULTIPROC_DIR": str(tmp_path)}
+    for _ in range(2):
+        subprocess.run([sys.executable, "-c", record], env=env, check=True)
+
+    body = render_metrics(str(tmp_path)).decode()
+    assert 'http_requests_total{method="GET",route="/products/list",status="200"} 2.0' in body
@@ -18,6 +18,9 @@ import { DropdownMenu, DropdownMenuContent, DropdownMenuItem, DropdownMenuTrigge
 import { Card } from "@/components/ui/card"
 import { MoreVertical, Pencil, Trash2, Search, Loader2 } from "lucide-react"
 import { cn } from "@/lib/utils"
+import { useCursorPages } from "@/lib/pagination"
+import { LoadMore } from "@/components/load-more"
+import { apiFetch } from "@/lib/api"
 
 type CampaignStatus = "Pending" | "Active" | "Completed" | "On Hold"
 
@@ -54,6 +57,7 @@ export function CampaignsTable() {
   const [formError, setFormError] = useState<string | null>(null)
 
   const getToken = () => localStorage.getItem("cloudchaser_token")
+  const campaignPages = useCursorPages<Campaign>(`${API_URL}/admin/campaigns`, "Failed to fetch campaigns")
 
   useEffect(() => {
     const loadCampaigns = async () => {
@@ -67,12 +71,7 @@ export function CampaignsTable() {
       }
 
       try {
-        const res = await fetch(`${API_URL}/admin/campaigns`, {
-          headers: { Authorization: `Bearer ${token}` },
-        })
-        if (!res.ok) throw new Error("Failed to fetch campaigns")
-
-        const data: Campaign[] = await res.json()
+        const data = await campaignPages.fetchFirst({ headers: { Authorization: `Bearer ${token}` } })
         setCampaigns(data)
       } catch (err: any) {
         setError(err.message)
@@ -83,6 +82,15 @@ export function CampaignsTable() {
     loadCampaigns()
   }, [])
 
+  const loadMore = async () => {
+    try {
+      const more = await campaignPages.fetchMore({ headers: { Authorization: `Bearer ${getToken()}` } })
+      setCampaigns((current) => [...current, ...more])
+    } catch (err: any) {
+      setError(err.message)
+    }
+  }
+
   const getStatusColor = (status: CampaignStatus) => {
     switch (status) {
       case "Pending":
@@ -125,7 +133,7 @@ export function CampaignsTable() {
     }
 
     try {
-      const res = await fetch(`${API_URL}/admin/campaigns/${editingCampaign.id_campaign}`, {
+      const res = await apiFetch(`${API_URL}/admin/campaigns/${editingCampaign.id_campaign}`, {
         method: "PUT",
         headers: { "Content-Type": "application/json", Authorization: `Bearer ${token}` },
         body: JSON.stringify(updatePayload),
@@ -154,7 +162,7 @@ export function CampaignsTable() {
     const token = getToken()
     
     try {
-      const res = await fetch(`${API_URL}/admin/campaigns/${id}`, {
+      const res = await apiFetch(`${API_URL}/admin/campaigns/${id}`, {
         method: "DELETE",
         headers: { Authorization: `Bearer ${token}` },
       })
@@ -292,6 +300,7 @@ export function CampaignsTable() {
             </TableBody>
           </Table>
         </div>
+        <LoadMore hasMore={campaignPages.hasMore} isLoading={campaignPages.isLoadingMore} onLoadMore={loadMore} />
       </div>
 
       <Dialog open={isEditDialogOpen} onOpenChange={(open) => { setIsEditDialogOpen(open); if (!open) resetForm(); }}>
@@ -18,6 +18,9 @@ import { DropdownMenu, DropdownMenuContent, DropdownMenuItem, DropdownMenuTrigge
 import { Card } from "@/components/ui/card"
 import { Plus, MoreVertical, Pencil, Trash2, Search, Loader2, AlertCircle } from "lucide-react"
 import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from "@/components/ui/select"
+import { useCursorPages } from "@/lib/pagination"
+import { LoadMore } from "@/components/load-more"
+import { apiFetch } from "@/lib/api"
 
 type User = {
   id_user: number
@@ -53,6 +56,7 @@ export function ClientsTable() {
   const [formError, setFormError] = useState<string | null>(null)
 
   const getToken = () => localStorage.getItem("cloudchaser_token")
+  const userPages = useCursorPages<User>(`${API_URL}/admin/clients`, "Failed to fetch users")
 
   useEffect(() => {
     const loadUsers = async () => {
@@ -65,11 +69,7 @@ export function ClientsTable() {
         return
       }
       try {
-        const res = await fetch(`${API_URL}/admin/clients`, {
-          headers: { Authorization: `Bearer ${token}` },
-        })
-        if (!res.ok) throw new Error("Failed to fetch users")
-        const data: User[] = await res.json()
+        const data = await userPages.fetchFirst({ headers: { Authorization: `Bearer ${token}` } })
         setUsers(data)
       } catch (err: any) {
         setError(err.message)
@@ -80,6 +80,15 @@ export function ClientsTable() {
     loadUsers()
   }, [])
 
+  const loadMore = async () => {
+    try {
+      const more = await userPages.fetchMore({ headers: { Authorization: `Bearer ${getToken()}` } })
+      setUsers((current) => [...current, ...more])
+    } catch (err: any) {
+      setError(err.message)
+    }
+  }
+
   const filteredUsers = users.filter(
     (user) =>
       user.name.toLowerCase().includes(searchQuery.toLowerCase()) ||
@@ -104,7 +113,7 @@ export function ClientsTable() {
       return
     }
     try {
-      const res = await fetch(`${API_URL}/admin/clients`, {
+      const res = await apiFetch(`${API_URL}/admin/clients`, {
         method: "POST",
         headers: { "Content-Type": "application/json", Authorization: `Bearer ${token}` },
         body: JSON.stringify(formData),
@@ -137,7 +146,7 @@ export function ClientsTable() {
       role: formData.role,
     }
     try {
-      const res = await fetch(`${API_URL}/admin/clients/${editingUser.id_user}`, {
+      const res = await apiFetch(`${API_URL}/admin/clients/${editingUser.id_user}`, {
         method: "PUT",
         headers: { "Content-Type": "application/json", Authorization: `Bearer ${token}` },
         body: JSON.stringify(updatePayload),
@@ -164,7 +173,7 @@ export function ClientsTable() {
     const token = getToken()
     
     try {
-      const res = await fetch(`${API_URL}/admin/clients/${id}`, {
+      const res = await apiFetch(`${API_URL}/admin/clients/${id}`, {
         method: "DELETE",
         headers: { Authorization: `Bearer ${token}` },
       })
@@ -331,6 +340,7 @@ export function ClientsTable() {
             </TableBody>
           </Table>
         </div>
+        <LoadMore hasMore={userPages.hasMore} isLoading={userPages.isLoadingMore} onLoadMore={loadMore} />
       </div>
 
       <Dialog open={isEditDialogOpen} onOpenChange={(open) => { setIsEditDialogOpen(open); if (!open) resetForm(); }}>
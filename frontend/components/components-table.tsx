@@ -17,6 +17,9 @@ import {
 import { DropdownMenu, DropdownMenuContent, DropdownMenuItem, DropdownMenuTrigger } from "@/components/ui/dropdown-menu"
 import { Card } from "@/components/ui/card"
 import { Plus, MoreVertical, Pencil, Trash2, Search, Loader2 } from "lucide-react"
+import { useCursorPages } from "@/lib/pagination"
+import { LoadMore } from "@/components/load-more"
+import { apiFetch } from "@/lib/api"
 
 type Component = {
   id_component: number
@@ -48,6 +51,7 @@ export function ComponentsTable() {
   const [formError, setFormError] = useState<string | null>(null)
 
   const getToken = () => localStorage.getItem("cloudchaser_token")
+  const componentPages = useCursorPages<Component>(`${API_URL}/components-management/`, "Failed to fetch components")
 
   useEffect(() => {
     const loadComponents = async () => {
@@ -61,14 +65,7 @@ export function ComponentsTable() {
       }
 
       try {
-        const res = await fetch(`${API_URL}/components-management/`, {
-          headers: { Authorization: `Bearer ${token}` },
-        })
-        if (!res.ok) {
-           const errData = await res.json()
-           throw new Error(errData.detail || "Failed to fetch components")
-        }
-        const data: Component[] = await res.json()
+        const data = await componentPages.fetchFirst({ headers: { Authorization: `Bearer ${token}` } })
         setComponents(data)
       } catch (err: any) {
         setError(err.message)
@@ -79,6 +76,15 @@ export function ComponentsTable() {
     loadComponents()
   }, [])
 
+  const loadMore = async () => {
+    try {
+      const more = await componentPages.fetchMore({ headers: { Authorization: `Bearer ${getToken()}` } })
+      setComponents((current) => [...current, ...more])
+    } catch (err: any) {
+      setError(err.message)
+    }
+  }
+
   const filteredComponents = components.filter(
     (component) =>
       component.name.toLowerCase().includes(searchQuery.toLowerCase()) ||
@@ -103,7 +109,7 @@ export function ComponentsTable() {
         unit_cost: parseFloat(formData.unit_cost),
       }
       
-      const res = await fetch(`${API_URL}/components-management/`, {
+      const res = await apiFetch(`${API_URL}/components-management/`, {
         method: "POST",
         headers: { "Content-Type": "application/json", Authorization: `Bearer ${token}` },
         body: JSON.stringify(payload),
@@ -137,7 +143,7 @@ export function ComponentsTable() {
         unit_cost: parseFloat(formData.unit_cost),
       }
       
-      const res = await fetch(`${API_URL}/components-management/${editingComponent.id_component}`, {
+      const res = await apiFetch(`${API_URL}/components-management/${editingComponent.id_component}`, {
         method: "PUT",
         headers: { "Content-Type": "application/json", Authorization: `Bearer ${token}` },
         body: JSON.stringify(payload),
@@ -168,7 +174,7 @@ export function ComponentsTable() {
     const token = getToken()
 
     try {
-      const res = await fetch(`${API_URL}/components-management/${id}`, {
+      const res = await apiFetch(`${API_URL}/components-management/${id}`, {
         method: "DELETE",
         headers: { Authorization: `Bearer ${token}` },
       })
@@ -324,6 +330,7 @@ export function ComponentsTable() {
             </TableBody>
           </Table>
         </div>
+        <LoadMore hasMore={componentPages.hasMore} isLoading={componentPages.isLoadingMore} onLoadMore={loadMore} />
       </div>
 
       <Dialog open={isEditDialogOpen} onOpenChange={(open) => { setIsEditDialogOpen(open); if (!open) resetForm(); }}>
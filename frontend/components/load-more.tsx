@@ -0,0 +1,21 @@
+"use client"
+
+import { Button } from "@/components/ui/button"
+import { Loader2 } from "lucide-react"
+
+type LoadMoreProps = {
+  hasMore: boolean
+  isLoading: boolean
+  onLoadMore: () => void
+}
+
+export function LoadMore({ hasMore, isLoading, onLoadMore }: LoadMoreProps) {
+  if (!hasMore) return null
+  return (
+    <div className="mt-4 flex justify-center">
+      <Button variant="outline" onClick={onLoadMore} disabled={isLoading}>
+        {isLoading ? <Loader2 className="h-4 w-4 animate-spin" /> : "Load more"}
+      </Button>
+    </div>
+  )
+}
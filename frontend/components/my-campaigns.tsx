@@ -19,6 +19,9 @@ import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from "@
 import { Card } from "@/components/ui/card"
 import { Plus, Search, Calendar, Loader2, AlertCircle } from "lucide-react"
 import { cn } from "@/lib/utils"
+import { useCursorPages } from "@/lib/pagination"
+import { LoadMore } from "@/components/load-more"
+import { apiFetch } from "@/lib/api"
 
 type Product = {
   id_product: number
@@ -62,6 +65,7 @@ export function MyCampaigns() {
   const getToken = () => {
     return localStorage.getItem("cloudchaser_token")
   }
+  const campaignPages = useCursorPages<Campaign>(`${API_URL}/campaigns/`, "Failed to fetch campaigns")
 
   useEffect(() => {
     const loadData = async () => {
@@ -78,15 +82,13 @@ export function MyCampaigns() {
       const headers = { Authorization: `Bearer ${token}` }
 
       try {
-        const [campaignsRes, productsRes] = await Promise.all([
-          fetch(`${API_URL}/campaigns/`, { headers }),
-          fetch(`${API_URL}/products/drop_down/`, { headers }),
+        const [campaignsData, productsRes] = await Promise.all([
+          campaignPages.fetchFirst({ headers }),
+          apiFetch(`${API_URL}/products/drop_down/`, { headers }),
         ])
 
-        if (!campaignsRes.ok) throw new Error("Failed to fetch campaigns")
         if (!productsRes.ok) throw new Error("Failed to fetch products")
 
-        const campaignsData: Campaign[] = await campaignsRes.json()
         const productsData: Product[] = await productsRes.json()
 
         setCampaigns(campaignsData)
@@ -101,6 +103,15 @@ export function MyCampaigns() {
     loadData()
   }, [])
 
+  const loadMore = async () => {
+    try {
+      const more = await campaignPages.fetchMore({ headers: { Authorization: `Bearer ${getToken()}` } })
+      setCampaigns((current) => [...current, ...more])
+    } catch (err: any) {
+      setError(err.message)
+    }
+  }
+
   const handleAdd = async () => {
     setIsSaving(true)
     setFormError(null)
@@ -126,7 +137,7 @@ export function MyCampaigns() {
     }
 
     try {
-      const res = await fetch(`${API_URL}/campaigns/`, {
+      const res = await apiFetch(`${API_URL}/campaigns/`, {
         method: "POST",
         headers: {
           "Content-Type": "application/json",
@@ -373,6 +384,7 @@ export function MyCampaigns() {
             </Table>
           </div>
         )}
+        <LoadMore hasMore={campaignPages.hasMore} isLoading={campaignPages.isLoadingMore} onLoadMore={loadMore} />
       </div>
     </Card>
   )
@@ -18,6 +18,9 @@ import { DropdownMenu, DropdownMenuContent, DropdownMenuItem, DropdownMenuTrigge
 import { Card } from "@/components/ui/card"
 import { Plus, MoreVertical, Pencil, Trash2, Search, Loader2 } from "lucide-react"
 import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from "@/components/ui/select"
+import { fetchAllPages, useCursorPages } from "@/lib/pagination"
+import { LoadMore } from "@/components/load-more"
+import { apiFetch } from "@/lib/api"
 
 type Package = {
   id_product: number
@@ -62,6 +65,7 @@ export function PackagesTable() {
   const [formError, setFormError] = useState<string | null>(null)
 
   const getToken = () => localStorage.getItem("cloudchaser_token")
+  const packagePages = useCursorPages<Package>(`${API_URL}/packages-management/`, "Failed to fetch packages")
 
   useEffect(() => {
     const loadData = async () => {
@@ -76,20 +80,12 @@ export function PackagesTable() {
       const headers = { Authorization: `Bearer ${token}` }
 
       try {
-        const [packagesRes, productsRes, componentsRes] = await Promise.all([
-          fetch(`${API_URL}/packages-management/`, { headers }),
-          fetch(`${API_URL}/products-management/`, { headers }),
-          fetch(`${API_URL}/components-management/`, { headers }),
+        const [packagesData, productsData, componentsData] = await Promise.all([
+          packagePages.fetchFirst({ headers }),
+          fetchAllPages<Product>(`${API_URL}/products-management/`, { headers }, "Failed to fetch products"),
+          fetchAllPages<Component>(`${API_URL}/components-management/`, { headers }, "Failed to fetch components"),
         ])
 
-        if (!packagesRes.ok) throw new Error("Failed to fetch packages")
-        if (!productsRes.ok) throw new Error("Failed to fetch products")
-        if (!componentsRes.ok) throw new Error("Failed to fetch components")
-
-        const packagesData: Package[] = await packagesRes.json()
-        const productsData: Product[] = await productsRes.json()
-        const componentsData: Component[] = await componentsRes.json()
-
         setPackages(packagesData)
         setProducts(productsData)
         setComponents(componentsData)
@@ -102,6 +98,15 @@ export function PackagesTable() {
     loadData()
   }, [])
 
+  const loadMore = async () => {
+    try {
+      const more = await packagePages.fetchMore({ headers: { Authorization: `Bearer ${getToken()}` } })
+      setPackages((current) => [...current, ...more])
+    } catch (err: any) {
+      setError(err.message)
+    }
+  }
+
   const filteredPackages = packages.filter(
     (pkg) =>
       pkg.product_name.toLowerCase().includes(searchQuery.toLowerCase()) ||
@@ -126,7 +131,7 @@ export function PackagesTable() {
         quantity: parseInt(formData.quantity),
       }
       
-      const res = await fetch(`${API_URL}/packages-management/`, {
+      const res = await apiFetch(`${API_URL}/packages-management/`, {
         method: "POST",
         headers: { "Content-Type": "application/json", Authorization: `Bearer ${token}` },
         body: JSON.stringify(payload),
@@ -159,7 +164,7 @@ export function PackagesTable() {
         quantity: parseInt(formData.quantity),
       }
       
-      const res = await fetch(`${API_URL}/packages-management/${editingKey.id_product}/${editingKey.id_component}`, {
+      const res = await apiFetch(`${API_URL}/packages-management/${editingKey.id_product}/${editingKey.id_component}`, {
         method: "PUT",
         headers: { "Content-Type": "application/json", Authorization: `Bearer ${token}` },
         body: JSON.stringify(payload),
@@ -194,7 +199,7 @@ export function PackagesTable() {
     const token = getToken()
 
     try {
-      const res = await fetch(`${API_URL}/packages-management/${id_product}/${id_component}`, {
+      const res = await apiFetch(`${API_URL}/packages-management/${id_product}/${id_component}`, {
         method: "DELETE",
         headers: { Authorization: `Bearer ${token}` },
       })
@@ -361,6 +366,7 @@ export function PackagesTable() {
             </TableBody>
           </Table>
         </div>
+        <LoadMore hasMore={packagePages.hasMore} isLoading={packagePages.isLoadingMore} onLoadMore={loadMore} />
       </div>
 
       <Dialog open={isEditDialogOpen} onOpenChange={(open) => { setIsEditDialogOpen(open); if (!open) resetForm(); }}>
@@ -14,6 +14,9 @@ import {
   DialogHeader,
   DialogTitle,
 } from "@/components/ui/dialog"
+import { useCursorPages } from "@/lib/pagination"
+import { LoadMore } from "@/components/load-more"
+import { apiFetch } from "@/lib/api"
 
 type ComponentDetail = {
   name: string
@@ -46,6 +49,7 @@ export function ProductsBrowser() {
   const [purchaseSuccess, setPurchaseSuccess] = useState(false)
 
   const getToken = () => localStorage.getItem("cloudchaser_token")
+  const productPages = useCursorPages<Product>(`${API_URL}/products/list`, "Failed to fetch products")
 
   useEffect(() => {
     const loadData = async () => {
@@ -60,15 +64,13 @@ export function ProductsBrowser() {
       const headers = { Authorization: `Bearer ${token}` }
 
       try {
-        const [productsRes, ownedIdsRes] = await Promise.all([
-          fetch(`${API_URL}/products/list`, { headers }),
-          fetch(`${API_URL}/subscriptions/my-active-ids`, { headers }),
+        const [productsData, ownedIdsRes] = await Promise.all([
+          productPages.fetchFirst({ headers }),
+          apiFetch(`${API_URL}/subscriptions/my-active-ids`, { headers }),
         ])
 
-        if (!productsRes.ok) throw new Error("Failed to fetch products")
         if (!ownedIdsRes.ok) throw new Error("Failed to fetch owned products")
 
-        const productsData: Product[] = await productsRes.json()
         const ownedIdsData: number[] = await ownedIdsRes.json()
 
         setProducts(productsData)
@@ -82,6 +84,15 @@ export function ProductsBrowser() {
     loadData()
   }, [])
 
+  const loadMore = async () => {
+    try {
+      const more = await productPages.fetchMore({ headers: { Authorization: `Bearer ${getToken()}` } })
+      setProducts((current) => [...current, ...more])
+    } catch (err: any) {
+      setError(err.message)
+    }
+  }
+
   const filteredProducts = products.filter(
     (product) =>
       product.name.toLowerCase().includes(searchQuery.toLowerCase()) ||
@@ -103,7 +114,7 @@ export function ProductsBrowser() {
     const token = getToken()
 
       try {
-          const res = await fetch(`${API_URL}/subscriptions/`, {
+          const res = await apiFetch(`${API_URL}/subscriptions/`, {
             method: "POST",
             headers: {
               "Content-Type": "application/json",
@@ -216,6 +227,7 @@ export function ProductsBrowser() {
           )
         })}
       </div>
+      <LoadMore hasMore={productPages.hasMore} isLoading={productPages.isLoadingMore} onLoadMore={loadMore} />
 
       <Dialog open={isPurchaseDialogOpen} onOpenChange={setIsPurchaseDialogOpen}>
         <DialogContent>
@@ -19,6 +19,9 @@ import { Card } from "@/components/ui/card"
 import { Plus, MoreVertical, Pencil, Trash2, Search, Loader2 } from "lucide-react"
 import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from "@/components/ui/select"
 import { cn } from "@/lib/utils"
+import { useCursorPages } from "@/lib/pagination"
+import { LoadMore } from "@/components/load-more"
+import { apiFetch } from "@/lib/api"
 
 type Product = {
   id_product: number
@@ -50,6 +53,7 @@ export function ProductsTable() {
   const [formError, setFormError] = useState<string | null>(null)
 
   const getToken = () => localStorage.getItem("cloudchaser_token")
+  const productPages = useCursorPages<Product>(`${API_URL}/products-management/`, "Failed to fetch products")
 
   useEffect(() => {
     const loadProducts = async () => {
@@ -63,14 +67,7 @@ export function ProductsTable() {
       }
 
       try {
-        const res = await fetch(`${API_URL}/products-management/`, {
-          headers: { Authorization: `Bearer ${token}` },
-        })
-        if (!res.ok) {
-           const errData = await res.json()
-           throw new Error(errData.detail || "Failed to fetch products")
-        }
-        const data: Product[] = await res.json()
+        const data = await productPages.fetchFirst({ headers: { Authorization: `Bearer ${token}` } })
         setProducts(data)
       } catch (err: any) {
         setError(err.message)
@@ -81,6 +78,15 @@ export function ProductsTable() {
     loadProducts()
   }, [])
 
+  const loadMore = async () => {
+    try {
+      const more = await productPages.fetchMore({ headers: { Authorization: `Bearer ${getToken()}` } })
+      setProducts((current) => [...current, ...more])
+    } catch (err: any) {
+      setError(err.message)
+    }
+  }
+
   const filteredProducts = products.filter(
     (product) =>
       product.name.toLowerCase().includes(searchQuery.toLowerCase()) ||
@@ -106,7 +112,7 @@ export function ProductsTable() {
         is_active: formData.is_active === "true",
       }
       
-      const res = await fetch(`${API_URL}/products-management/`, {
+      const res = await apiFetch(`${API_URL}/products-management/`, {
         method: "POST",
         headers: { "Content-Type": "application/json", Authorization: `Bearer ${token}` },
         body: JSON.stringify(payload),
@@ -142,7 +148,7 @@ export function ProductsTable() {
         is_active: formData.is_active === "true",
       }
       
-      const res = await fetch(`${API_URL}/products-management/${editingProduct.id_product}`, {
+      const res = await apiFetch(`${API_URL}/products-management/${editingProduct.id_product}`, {
         method: "PUT",
         headers: { "Content-Type": "application/json", Authorization: `Bearer ${token}` },
         body: JSON.stringify(payload),
@@ -173,7 +179,7 @@ export function ProductsTable() {
     const token = getToken()
 
     try {
-      const res = await fetch(`${API_URL}/products-management/${id}`, {
+      const res = await apiFetch(`${API_URL}/products-management/${id}`, {
         method: "DELETE",
         headers: { Authorization: `Bearer ${token}` },
       })
@@ -344,6 +350,7 @@ export function ProductsTable() {
             </TableBody>
           </Table>
         </div>
+        <LoadMore hasMore={productPages.hasMore} isLoading={productPages.isLoadingMore} onLoadMore={loadMore} />
       </div>
 
       <Dialog open={isEditDialogOpen} onOpenChange={(open) => { setIsEditDialogOpen(open); if (!open) resetForm(); }}>
@@ -0,0 +1,16 @@
+// Writes return a signed X-Read-Primary-Until token. Sending it back on later requests keeps reads on the
+// primary database until it expires, so the UI never reads its own writes from a lagging replica. The API is
+// cross-origin, so the matching cookie is not relied on.
+const PIN_HEADER = "X-Read-Primary-Until"
+const PIN_STORAGE_KEY = "cloudchaser_read_primary_until"
+
+export async function apiFetch(input: string | URL, init: RequestInit = {}): Promise<Response> {
+  const headers = new Headers(init.headers)
+  const pin = typeof window === "undefined" ? null : localStorage.getItem(PIN_STORAGE_KEY)
+  if (pin && !headers.has(PIN_HEADER)) headers.set(PIN_HEADER, pin)
+
+  const res = await fetch(input, { ...init, headers })
+  const nextPin = res.headers.get(PIN_HEADER)
+  if (nextPin && typeof window !== "undefined") localStorage.setItem(PIN_STORAGE_KEY, nextPin)
+  return res
+}
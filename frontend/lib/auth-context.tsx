@@ -2,6 +2,7 @@
 
 import { createContext, useContext, useState, useEffect, type ReactNode } from "react"
 import { useRouter } from "next/navigation"
+import { apiFetch } from "@/lib/api"
 
 export type UserRole = "CLIENT" | "OPERATIVE" | "ADMIN"
 
@@ -55,7 +56,7 @@ export function AuthProvider({ children }: { children: ReactNode }) {
       formData.append("username", email)
       formData.append("password", password)
 
-      const res = await fetch(`${API_URL}/login`, {
+      const res = await apiFetch(`${API_URL}/login`, {
         method: "POST",
         body: formData,
       })
@@ -66,7 +67,7 @@ export function AuthProvider({ children }: { children: ReactNode }) {
       const token = data.access_token
       localStorage.setItem("cloudchaser_token", token)
 
-      const userRes = await fetch(`${API_URL}/users/me`, {
+      const userRes = await apiFetch(`${API_URL}/users/me`, {
         headers: { Authorization: `Bearer ${token}` },
       })
 
@@ -94,7 +95,7 @@ export function AuthProvider({ children }: { children: ReactNode }) {
   ) => {
     setIsLoading(true)
     try {
-      const res = await fetch(`${API_URL}/register`, {
+      const res = await apiFetch(`${API_URL}/register`, {
         method: "POST",
         headers: { "Content-Type": "application/json" },
         body: JSON.stringify({
@@ -0,0 +1,68 @@
+import { useState } from "react"
+import { apiFetch } from "@/lib/api"
+
+export type Page<T> = {
+  items: T[]
+  limit: number
+  next_cursor: string | null
+  total: number | null
+}
+
+export const PAGE_SIZE = 50
+
+export async function fetchPage<T>(
+  url: string,
+  init: RequestInit,
+  errorMessage: string,
+  cursor: string | null = null,
+  limit = PAGE_SIZE,
+): Promise<Page<T>> {
+  const pageUrl = new URL(url)
+  pageUrl.searchParams.set("limit", String(limit))
+  if (cursor) pageUrl.searchParams.set("cursor", cursor)
+
+  const res = await apiFetch(pageUrl, init)
+  if (!res.ok) {
+    const errData = await res.json().catch(() => ({}))
+    throw new Error(errData.detail || errorMessage)
+  }
+  return res.json()
+}
+
+// Tables load one page up front and fetch the next one only when asked to.
+export function useCursorPages<T>(url: string, errorMessage: string, limit = PAGE_SIZE) {
+  const [nextCursor, setNextCursor] = useState<string | null>(null)
+  const [isLoadingMore, setIsLoadingMore] = useState(false)
+
+  const fetchFirst = async (init: RequestInit): Promise<T[]> => {
+    const page = await fetchPage<T>(url, init, errorMessage, null, limit)
+    setNextCursor(page.next_cursor)
+    return page.items
+  }
+
+  const fetchMore = async (init: RequestInit): Promise<T[]> => {
+    if (!nextCursor) return []
+    setIsLoadingMore(true)
+    try {
+      const page = await fetchPage<T>(url, init, errorMessage, nextCursor, limit)
+      setNextCursor(page.next_cursor)
+      return page.items
+    } finally {
+      setIsLoadingMore(false)
+    }
+  }
+
+  return { hasMore: nextCursor !== null, isLoadingMore, fetchFirst, fetchMore }
+}
+
+// For select options, which need the whole (small) list.
+export async function fetchAllPages<T>(url: string, init: RequestInit, errorMessage: string, limit = 500): Promise<T[]> {
+  const items: T[] = []
+  let cursor: string | null = null
+  do {
+    const page: Page<T> = await fetchPage<T>(url, init, errorMessage, cursor, limit)
+    items.push(...page.items)
+    cursor = page.next_cursor
+  } while (cursor)
+  return items
+}